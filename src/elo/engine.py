@@ -27,6 +27,7 @@ import math
 import statistics
 from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 
 from src.config import (
@@ -116,6 +117,38 @@ def calculate_weight(score_i, score_j, max_gap):
     return 0.5 + 0.5 * (gap / max_gap)
 
 
+def calculate_weight_matrix(scores, max_gap):
+    """
+    Vectorized calculate_weight over every pair of a day's scores.
+
+    Args:
+        scores: 1-D array of the day's scores
+        max_gap: Score gap between first and last place (linear mode)
+
+    Returns:
+        2-D array where [i, j] == calculate_weight(scores[i], scores[j], max_gap)
+    """
+    n = len(scores)
+    if not USE_SCORE_GAP_WEIGHTING:
+        return np.ones((n, n))
+
+    score_i = scores[:, None]
+    score_j = scores[None, :]
+    if max_gap == 0:
+        linear = np.ones((n, n))
+    else:
+        linear = 0.5 + 0.5 * ((score_i - score_j) / max_gap)
+    if not USE_RATIO_BASED_WEIGHTING:
+        return linear
+
+    # Ratio weighting where the lower score is positive, linear fallback elsewhere
+    has_ratio = score_j > 0
+    ratio = score_i / np.where(has_ratio, score_j, 1.0)
+    log_ratio = np.log2(np.maximum(ratio, 1.0))
+    weight = 0.5 + 0.5 * np.minimum(log_ratio / math.log2(RATIO_CAP), 1.0)
+    return np.where(has_ratio, weight, linear)
+
+
 def get_dynamic_k(games_played):
     """
     Calculate dynamic K-factor based on games played.
@@ -276,26 +309,24 @@ def process_daily_leaderboard(leaderboard_df, ratings, games_played, last_seen,
         player_uncertainty[name] = uncertainty[name]
 
     max_gap = players[0]['score'] - players[-1]['score'] if n > 1 else 1
-    rating_changes = defaultdict(float)
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            player_i = players[i]
-            player_j = players[j]
-            name_i = player_i['player_name']
-            name_j = player_j['player_name']
-            r_i = ratings[name_i]
-            r_j = ratings[name_j]
-            e_i = expected_score(r_i, r_j)
-            weight = calculate_weight(player_i['score'], player_j['score'], max_gap)
-            k_i = get_dynamic_k(games_played[name_i])
-            k_j = get_dynamic_k(games_played[name_j])
-            delta_i = k_i * weight * (1 - e_i)
-            floor_factor = calculate_floor_factor(r_j)
-            delta_i *= floor_factor
-            delta_j = k_j * weight * (e_i - 1)
-            rating_changes[name_i] += delta_i
-            rating_changes[name_j] += delta_j
+    rating_changes = {}
+
+    if n > 1:
+        # All pairs at once: row i is the higher-placed player, column j the lower
+        names = [p['player_name'] for p in players]
+        r = np.array([ratings[name] for name in names], dtype=float)
+        scores = np.array([p['score'] for p in players], dtype=float)
+        k = np.array([get_dynamic_k(games_played[name]) for name in names])
+        floor_factor = np.array([calculate_floor_factor(rating) for rating in r])
+
+        e = 1 / (1 + 10 ** ((r[None, :] - r[:, None]) / 400))
+        weight = calculate_weight_matrix(scores, max_gap)
+        gain = k[:, None] * weight * (1 - e) * floor_factor[None, :]
+        loss = k[None, :] * weight * (e - 1)
+
+        # Upper triangle only (each pair once): gains summed across rows, losses down columns
+        totals = np.triu(gain, k=1).sum(axis=1) + np.triu(loss, k=1).sum(axis=0)
+        rating_changes = dict(zip(names, totals.tolist()))
 
     if USE_LOG_SCALING:
         for name in rating_changes:
@@ -341,11 +372,13 @@ def compute_elo_ratings(df):
     uncertainty = {}
     daily_history = []
 
-    dates = sorted(df['date'].unique())
-    logger.info(f"Processing {len(dates)} days of leaderboard data using '{ELO_MODEL}' model...")
+    # One sorted groupby pass instead of a full boolean mask per day
+    days = df.groupby('date', sort=True)
+    logger.info(f"Processing {days.ngroups} days of leaderboard data using '{ELO_MODEL}' model...")
 
-    for date in dates:
-        day_df = df[df['date'] == date]
+    last_date = None
+    for date, day_df in days:
+        last_date = date
 
         if ELO_MODEL == "daily_result":
             changes, day_uncertainty = process_daily_result_model(
@@ -377,7 +410,7 @@ def compute_elo_ratings(df):
                 'active_rank': active_rank
             })
 
-    logger.info(f"Processed {len(dates)} days, {len(ratings)} unique players")
+    logger.info(f"Processed {days.ngroups} days, {len(ratings)} unique players")
 
     raw_values = list(ratings.values())
     if raw_values:
@@ -409,8 +442,6 @@ def compute_elo_ratings(df):
         logger.info(f"  Median: {statistics.median(scaled_values):.2f}")
         logger.info(f"  Std Dev: {statistics.stdev(scaled_values) if len(scaled_values) > 1 else 0:.2f}")
 
-    last_date = dates[-1] if dates else None
-
     final_ratings = []
     for player, rating in scaled_ratings.items():
         gp = games_played[player]
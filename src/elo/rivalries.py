@@ -22,9 +22,6 @@ _project_root = str(Path(__file__).parent.parent.parent)
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
-from collections import defaultdict
-from itertools import combinations
-
 import numpy as np
 import pandas as pd
 
@@ -67,96 +64,66 @@ def compute_rivalries(df_history: pd.DataFrame) -> pd.DataFrame:
         logger.warning("No played games found in history")
         return pd.DataFrame()
 
-    # Group by date and collect players who played each day
-    logger.info("Grouping games by date...")
-    games_by_date = df_played.groupby('date')[['player_name', 'rank']].apply(
-        lambda x: x.set_index('player_name')['rank'].to_dict(),
-        include_groups=False
-    ).to_dict()
-
-    # Track head-to-head stats for each pair
-    # Key: (player1, player2) where player1 < player2 alphabetically
-    rivalry_stats: defaultdict[tuple[str, str], dict] = defaultdict(lambda: {
-        'encounters': 0,
-        'p1_wins': 0,
-        'p2_wins': 0,
-        'p1_ranks': [],
-        'p2_ranks': [],
+    # Self-join each day's results to get every pair of players who met.
+    # `pos` is the order a player appears within the day, so `pos_a < pos_b`
+    # keeps each pair once, in the same order itertools.combinations would.
+    logger.info(f"Processing {df_played['date'].nunique()} days of games...")
+    df_day = df_played[['date', 'player_name', 'rank']].sort_values('date', kind='mergesort')
+    df_day = df_day.assign(pos=df_day.groupby('date').cumcount())
+    pairs = df_day.merge(df_day, on='date', suffixes=('_a', '_b'))
+    pairs = pairs[pairs['pos_a'] < pairs['pos_b']]
+
+    # Ensure consistent ordering (alphabetical): player1 < player2
+    swap = (pairs['player_name_a'] > pairs['player_name_b']).to_numpy()
+    name_a, name_b = pairs['player_name_a'].to_numpy(), pairs['player_name_b'].to_numpy()
+    rank_a, rank_b = pairs['rank_a'].to_numpy(), pairs['rank_b'].to_numpy()
+    pairs = pd.DataFrame({
+        'player1': np.where(swap, name_b, name_a),
+        'player2': np.where(swap, name_a, name_b),
+        'rank1': np.where(swap, rank_b, rank_a),
+        'rank2': np.where(swap, rank_a, rank_b),
     })
 
-    logger.info(f"Processing {len(games_by_date)} days of games...")
-
-    for _, players_ranks in games_by_date.items():
-        players = list(players_ranks.keys())
-
-        # Generate all pairs for this day
-        for p1, p2 in combinations(players, 2):
-            # Ensure consistent ordering (alphabetical)
-            if p1 > p2:
-                p1, p2 = p2, p1
-
-            rank1 = players_ranks[p1 if p1 in players_ranks else p2]
-            rank2 = players_ranks[p2 if p2 in players_ranks else p1]
-
-            # Re-fetch with correct ordering
-            rank1 = players_ranks.get(p1)
-            rank2 = players_ranks.get(p2)
-
-            if rank1 is None or rank2 is None:
-                continue
-
-            key = (p1, p2)
-            rivalry_stats[key]['encounters'] += 1
-            rivalry_stats[key]['p1_ranks'].append(rank1)
-            rivalry_stats[key]['p2_ranks'].append(rank2)
-
-            # Lower rank = winner
-            if rank1 < rank2:
-                rivalry_stats[key]['p1_wins'] += 1
-            elif rank2 < rank1:
-                rivalry_stats[key]['p2_wins'] += 1
-            # Ties: neither gets a win
-
-    logger.info(f"Found {len(rivalry_stats)} total player pairs")
-
-    # Convert to DataFrame
-    rows = []
-    for (p1, p2), stats in rivalry_stats.items():
-        if stats['encounters'] < MIN_ENCOUNTERS:
-            continue
-
-        p1_avg_rank = np.mean(stats['p1_ranks'])
-        p2_avg_rank = np.mean(stats['p2_ranks'])
-        avg_combined_rank = (p1_avg_rank + p2_avg_rank) / 2
-
-        total = stats['encounters']
-        win_diff = abs(stats['p1_wins'] - stats['p2_wins'])
-
-        # Closeness with gap penalty:
-        # - Ratio component: 1 - (diff/total) - how close the win% is to 50-50
-        # - Gap penalty: 1 / (1 + diff/k) - penalizes large absolute gaps
-        # This means 36-24 (gap=12) feels closer than 72-48 (gap=24) even at same ratio
-        ratio_closeness = 1 - (win_diff / total) if total > 0 else 0
-        gap_penalty = 1 / (1 + win_diff / GAP_PENALTY_K)
-        closeness = ratio_closeness * gap_penalty
-
-        # Elite score: more encounters at higher ranks = higher score
-        elite_score = total / avg_combined_rank if avg_combined_rank > 0 else 0
-
-        rows.append({
-            'player1': p1,
-            'player2': p2,
-            'total_encounters': total,
-            'p1_wins': stats['p1_wins'],
-            'p2_wins': stats['p2_wins'],
-            'p1_avg_rank': round(p1_avg_rank, 2),
-            'p2_avg_rank': round(p2_avg_rank, 2),
-            'avg_combined_rank': round(avg_combined_rank, 2),
-            'closeness': round(closeness, 4),
-            'elite_score': round(elite_score, 2),
-        })
-
-    df_rivalries = pd.DataFrame(rows)
+    # Lower rank = winner; ties give neither player a win
+    pairs['p1_win'] = pairs['rank1'] < pairs['rank2']
+    pairs['p2_win'] = pairs['rank2'] < pairs['rank1']
+
+    # Groups come out in first-encounter order (date, then pair order that day)
+    stats = pairs.groupby(['player1', 'player2'], sort=False).agg(
+        total_encounters=('rank1', 'size'),
+        p1_wins=('p1_win', 'sum'),
+        p2_wins=('p2_win', 'sum'),
+        p1_avg_rank=('rank1', 'mean'),
+        p2_avg_rank=('rank2', 'mean'),
+    ).reset_index()
+
+    logger.info(f"Found {len(stats)} total player pairs")
+
+    df_rivalries = stats[stats['total_encounters'] >= MIN_ENCOUNTERS].reset_index(drop=True)
+    if df_rivalries.empty:
+        logger.info(f"Found 0 qualifying rivalries (>= {MIN_ENCOUNTERS} encounters)")
+        return pd.DataFrame()
+
+    total = df_rivalries['total_encounters']
+    win_diff = (df_rivalries['p1_wins'] - df_rivalries['p2_wins']).abs()
+    avg_combined_rank = (df_rivalries['p1_avg_rank'] + df_rivalries['p2_avg_rank']) / 2
+
+    # Closeness with gap penalty:
+    # - Ratio component: 1 - (diff/total) - how close the win% is to 50-50
+    # - Gap penalty: 1 / (1 + diff/k) - penalizes large absolute gaps
+    # This means 36-24 (gap=12) feels closer than 72-48 (gap=24) even at same ratio
+    ratio_closeness = 1 - (win_diff / total)
+    gap_penalty = 1 / (1 + win_diff / GAP_PENALTY_K)
+    closeness = ratio_closeness * gap_penalty
+
+    # Elite score: more encounters at higher ranks = higher score
+    elite_score = total / avg_combined_rank
+
+    df_rivalries['p1_avg_rank'] = df_rivalries['p1_avg_rank'].round(2)
+    df_rivalries['p2_avg_rank'] = df_rivalries['p2_avg_rank'].round(2)
+    df_rivalries['avg_combined_rank'] = avg_combined_rank.round(2)
+    df_rivalries['closeness'] = closeness.round(4)
+    df_rivalries['elite_score'] = elite_score.round(2)
     logger.info(f"Found {len(df_rivalries)} qualifying rivalries (>= {MIN_ENCOUNTERS} encounters)")
 
     return df_rivalries
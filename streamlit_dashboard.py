@@ -2,8 +2,10 @@
 import base64
 import html
 import math
+import os
 import random
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
 from urllib.parse import quote
 
@@ -233,25 +235,15 @@ def generate_ranking_cards(df):
     if df.empty:
         return "<p>No data available</p>"
 
-    # Theme-adaptive styles using Streamlit CSS variables
-    # Base card styling (border, radius, shadow) - background varies by active status
-    # Uses spacing token: --space-md (1rem) for padding
-    # Uses --glass-* CSS vars for borders/shadows (dark mode)
-    card_base = "color-scheme:inherit;border:1px solid var(--glass-border-subtle);border-radius:12px;padding:1rem;margin-bottom:0.75rem;box-shadow:0 0 0 1px var(--glass-ring), inset 0 1px 0 var(--glass-inset), 0 4px 20px var(--glass-drop);"
-    # Active player: coral accent gradient (use bg-color + bg-image so gradient blends with element, not parent)
-    active_bg = "background-color:var(--secondary-background-color);background-image:linear-gradient(135deg, transparent 0%, rgba(255,107,107,0.15) 100%);"
-    # Inactive player (N/R): muted gray gradient to visually distinguish
-    inactive_bg = "background-color:var(--secondary-background-color);background-image:linear-gradient(135deg, transparent 0%, rgba(128,128,128,0.12) 100%);"
+    # Card shell and stat cells are styled by CSS classes (.rank-card, .card-stat*
+    # in styles/dashboard.css) rather than inline styles repeated on every card;
+    # .rank-card.inactive swaps the coral gradient for a muted gray one (N/R)
 
     # Header now uses CSS classes for responsive layout (see CSS: .card-header, .card-rank, etc.)
     # Status label style for inactive players (blue to match N/R and rating)
     inactive_blue = "#6B9AFF"
     status_label_style = f"font-size:0.65rem;font-weight:400;margin-top:0.15rem;color:{inactive_blue};"
 
-    stat_layout = "display:flex;flex-direction:column;align-items:center;text-align:center;"
-    label_style = "font-size:0.8rem;text-transform:uppercase;color:var(--text-color);font-weight:500;"
-    value_style = "font-size:1.4rem;font-weight:700;color:var(--text-color);"
-
     def safe_str(val, fmt=None):
         if pd.isna(val):
             return "—"
@@ -260,12 +252,14 @@ def generate_ranking_cards(df):
         return str(int(val))
 
     cards = []
-    for _, row in df.iterrows():
-        rank = row.get('active_rank')
+    # itertuples yields plain tuples instead of building a Series per row;
+    # getattr with a default keeps the old row.get() handling of absent columns
+    for row in df.itertuples(index=False):
+        rank = getattr(row, 'active_rank', None)
         is_inactive = pd.isna(rank)
 
         # Choose card background based on active status
-        card_style = (inactive_bg if is_inactive else active_bg) + card_base
+        card_class = "rank-card inactive" if is_inactive else "rank-card"
 
         # Rank display - centered, emojis only for podium (1-3), # for others
         if is_inactive:
@@ -282,9 +276,9 @@ def generate_ranking_cards(df):
                 rank_html = f'<span style="color:#FF6B6B;">#{rank_int}</span>'
 
         # Player name with status indicator (stacked vertically for small viewports)
-        raw_name = str(row.get('player_name', 'Unknown'))
+        raw_name = str(getattr(row, 'player_name', 'Unknown'))
         name_link = player_link(raw_name)
-        games_played = row.get('games_played', 0)
+        games_played = getattr(row, 'games_played', 0)
         games_count = int(games_played) if pd.notna(games_played) else 0
 
         if is_inactive:
@@ -299,27 +293,50 @@ def generate_ranking_cards(df):
             name_html = f'<span class="card-name-text">{name_link}</span>'
 
         # Stats
-        rating = safe_str(row.get('rating'), "{:.1f}")
-        games = safe_str(row.get('games_played'))
-        wins = safe_str(row.get('wins'))
-        win_rate = safe_str(row.get('win_rate'), "{:.1f}") + "%" if pd.notna(row.get('win_rate')) else "—"
-        top10 = safe_str(row.get('top_10s'))
-        top10_rate = safe_str(row.get('top_10s_rate'), "{:.1f}") + "%" if pd.notna(row.get('top_10s_rate')) else "—"
-        avg_r = safe_str(row.get('avg_daily_rank'), "{:.1f}")
-        last7 = safe_str(row.get('last_7'), "{:.1f}")
-        consist = safe_str(row.get('consistency'), "{:.1f}")
+        rating = safe_str(getattr(row, 'rating', None), "{:.1f}")
+        games = safe_str(getattr(row, 'games_played', None))
+        wins = safe_str(getattr(row, 'wins', None))
+        win_rate = safe_str(getattr(row, 'win_rate', None), "{:.1f}") + "%" if pd.notna(getattr(row, 'win_rate', None)) else "—"
+        top10 = safe_str(getattr(row, 'top_10s', None))
+        top10_rate = safe_str(getattr(row, 'top_10s_rate', None), "{:.1f}") + "%" if pd.notna(getattr(row, 'top_10s_rate', None)) else "—"
+        avg_r = safe_str(getattr(row, 'avg_daily_rank', None), "{:.1f}")
+        last7 = safe_str(getattr(row, 'last_7', None), "{:.1f}")
+        consist = safe_str(getattr(row, 'consistency', None), "{:.1f}")
 
         # Build card with CSS-class-based responsive header
         # Rating class: 'active' (coral) for ranked, 'inactive' (muted) for unranked
         rating_class = "inactive" if is_inactive else "active"
         # Create URL-safe anchor ID from player name for navigation
         player_anchor_id = urllib.parse.quote(raw_name, safe='')
-        card = f'<div id="player-{player_anchor_id}" class="player-card" style="{card_style}"><div class="card-header"><div class="card-rank">{rank_html}</div><div class="card-name">{name_html}</div><div class="card-rating {rating_class}"><span class="rating-label">Elo</span>{rating}</div></div><div class="stats-grid"><div style="{stat_layout}"><span style="{label_style}">Daily Runs</span><span style="{value_style}">{games}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily #1</span><span style="{value_style}">{wins}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily #1 (%)</span><span style="{value_style}">{win_rate}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily Top10</span><span style="{value_style}">{top10}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily Top10 (%)</span><span style="{value_style}">{top10_rate}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily Avg</span><span style="{value_style}">{avg_r}</span></div><div style="{stat_layout}"><span style="{label_style}">7-Game Avg</span><span style="{value_style}">{last7}</span></div><div style="{stat_layout}"><span style="{label_style}" title="Lower = more consistent">7-Game StdDev</span><span style="{value_style}">{consist}</span></div></div></div>'
+        card = f'<div id="player-{player_anchor_id}" class="player-card {card_class}"><div class="card-header"><div class="card-rank">{rank_html}</div><div class="card-name">{name_html}</div><div class="card-rating {rating_class}"><span class="rating-label">Elo</span>{rating}</div></div><div class="stats-grid"><div class="card-stat"><span class="card-stat-label">Daily Runs</span><span class="card-stat-value">{games}</span></div><div class="card-stat"><span class="card-stat-label">Daily #1</span><span class="card-stat-value">{wins}</span></div><div class="card-stat"><span class="card-stat-label">Daily #1 (%)</span><span class="card-stat-value">{win_rate}</span></div><div class="card-stat"><span class="card-stat-label">Daily Top10</span><span class="card-stat-value">{top10}</span></div><div class="card-stat"><span class="card-stat-label">Daily Top10 (%)</span><span class="card-stat-value">{top10_rate}</span></div><div class="card-stat"><span class="card-stat-label">Daily Avg</span><span class="card-stat-value">{avg_r}</span></div><div class="card-stat"><span class="card-stat-label">7-Game Avg</span><span class="card-stat-value">{last7}</span></div><div class="card-stat"><span class="card-stat-label" title="Lower = more consistent">7-Game StdDev</span><span class="card-stat-value">{consist}</span></div></div></div>'
         cards.append(card)
 
     return "".join(cards)
 
 
+def format_rating_change_col(changes, parens=True, style="font-size:0.85rem;", missing=''):
+    """
+    Format a column of rating changes as '(+12.3)' / '(-4.5)' HTML spans in one pass.
+
+    Vectorized counterpart of per-row formatting: the whole column is formatted with
+    NumPy, and missing values become `missing`. Pass parens=False / style=None for
+    bare '+12.3' spans (game history cards).
+    """
+    vals = changes.to_numpy(dtype=float)
+    nan_mask = np.isnan(vals)
+    # Positive/zero changes get an explicit '+' sign; negatives carry their own '-'
+    text = np.char.mod('%+.1f', np.where(nan_mask, 0.0, vals))
+    style_attr = f' style="{style}"' if style else ''
+    open_paren, close_paren = ('(', ')') if parens else ('', '')
+    positive = vals >= 0
+    spans = np.where(
+        positive,
+        np.char.add(np.char.add(f'<span class="change-positive"{style_attr}>{open_paren}', text), f'{close_paren}</span>'),
+        np.char.add(np.char.add(f'<span class="change-negative"{style_attr}>{open_paren}', text), f'{close_paren}</span>'),
+    )
+    return pd.Series(np.where(nan_mask, missing, spans), index=changes.index, dtype=object)
+
+
 def generate_leaderboard_cards(df, has_rating=True, has_active_rank=True):
     """
     Generate HTML rows for the daily leaderboard display (Tab 4).
@@ -337,8 +354,14 @@ def generate_leaderboard_cards(df, has_rating=True, has_active_rank=True):
             return fmt.format(val)
         return str(int(val))
 
+    # Rating-change spans for the whole column at once
+    if has_rating and 'rating_change' in df.columns:
+        change_spans = format_rating_change_col(df['rating_change']).tolist()
+    else:
+        change_spans = [''] * len(df)
+
     rows = []
-    for _, row in df.iterrows():
+    for (_, row), change_span in zip(df.iterrows(), change_spans):
         rank = row.get('rank')
         rank_int = int(rank) if pd.notna(rank) else 0
 
@@ -376,11 +399,8 @@ def generate_leaderboard_cards(df, has_rating=True, has_active_rank=True):
         if has_rating and 'rating' in row.index:
             rating = row.get('rating')
             rating_str = f"{rating:.1f}" if pd.notna(rating) else "—"
-            change = row.get('rating_change') if 'rating_change' in row.index else None
-            if pd.notna(change):
-                change_class = "change-positive" if change >= 0 else "change-negative"
-                change_str = f"+{change:.1f}" if change >= 0 else f"{change:.1f}"
-                rating_html = f'<span style="min-width:7rem;text-align:right;"><span style="font-weight:600;color:var(--text-color);">{rating_str}</span> <span class="{change_class}" style="font-size:0.85rem;">({change_str})</span></span>'
+            if change_span:
+                rating_html = f'<span style="min-width:7rem;text-align:right;"><span style="font-weight:600;color:var(--text-color);">{rating_str}</span> {change_span}</span>'
             else:
                 rating_html = f'<span style="min-width:7rem;text-align:right;font-weight:600;color:var(--text-color);">{rating_str}</span>'
 
@@ -401,11 +421,8 @@ def generate_game_history_cards(df, player_name="Player", has_active_rank=True):
     if df.empty:
         return "<p>No data available</p>"
 
-    card_base = "color-scheme:inherit;border:1px solid var(--glass-border-subtle);border-radius:12px;padding:1rem;margin-bottom:0.75rem;box-shadow:0 0 0 1px var(--glass-ring), inset 0 1px 0 var(--glass-inset), 0 4px 20px var(--glass-drop);background-color:var(--secondary-background-color);background-image:linear-gradient(135deg, transparent 0%, rgba(59,130,246,0.12) 100%);"
-
-    stat_layout = "display:flex;flex-direction:column;align-items:center;text-align:center;"
-    label_style = "font-size:0.8rem;text-transform:uppercase;color:var(--text-color);font-weight:500;"
-    value_style = "font-size:1.4rem;font-weight:700;color:var(--text-color);"
+    # Card shell (.history-card) and stat cells (.card-stat*) are styled in
+    # styles/dashboard.css instead of inline on every card
 
     def safe_str(val, fmt=None):
         if pd.isna(val):
@@ -419,8 +436,14 @@ def generate_game_history_cards(df, player_name="Player", has_active_rank=True):
     df_with_run = df.copy()
     df_with_run['_run_number'] = df_with_run['date'].rank(method='dense').astype(int)
 
+    # Elo change spans for the whole column at once ("—" when missing)
+    if 'rating_change' in df_with_run.columns:
+        change_spans = format_rating_change_col(df_with_run['rating_change'], parens=False, style=None, missing="—").tolist()
+    else:
+        change_spans = ["—"] * len(df_with_run)
+
     cards = []
-    for _, row in df_with_run.iterrows():
+    for (_, row), change_display in zip(df_with_run.iterrows(), change_spans):
         run_number = row['_run_number']
 
         # Score
@@ -431,9 +454,8 @@ def generate_game_history_cards(df, player_name="Player", has_active_rank=True):
         date_str = date_val.strftime('%Y-%m-%d') if hasattr(date_val, 'strftime') else str(date_val)[:10]
         date_link_html = daily_link(date_val, date_str)
 
-        # Rating and change values
+        # Rating value
         rating = safe_str(row.get('rating'), "{:.1f}")
-        change = row.get('rating_change')
 
         # Daily rank for header right
         rank = row.get('rank')
@@ -453,33 +475,26 @@ def generate_game_history_cards(df, player_name="Player", has_active_rank=True):
         top10 = safe_str(row.get('top_10s'))
         top10_rate = safe_str(row.get('top_10s_rate'), "{:.1f}") + "%" if pd.notna(row.get('top_10s_rate')) else "—"
 
-        # Elo change display for stats grid
-        change_display = "—"
-        if pd.notna(change):
-            change_class = "change-positive" if change >= 0 else "change-negative"
-            change_prefix = "+" if change >= 0 else ""
-            change_display = f'<span class="{change_class}">{change_prefix}{change:.1f}</span>'
-
         # Build stats (8 items including Elo and Change)
         stats_html = f'''
-        <div style="{stat_layout}"><span style="{label_style}">Daily #1</span><span style="{value_style}">{safe_str(row.get('wins'))}</span></div>
-        <div style="{stat_layout}"><span style="{label_style}">Daily #1 (%)</span><span style="{value_style}">{safe_str(row.get('win_rate'), "{:.1f}")}%</span></div>
-        <div style="{stat_layout}"><span style="{label_style}">Daily Top 10</span><span style="{value_style}">{top10}</span></div>
-        <div style="{stat_layout}"><span style="{label_style}">Daily Top 10 (%)</span><span style="{value_style}">{top10_rate}</span></div>
-        <div style="{stat_layout}"><span style="{label_style}">7-Game Avg</span><span style="{value_style}">{safe_str(row.get('last_7'), "{:.1f}")}</span></div>
-        <div style="{stat_layout}"><span style="{label_style}" title="Lower = more consistent">7-Game StdDev</span><span style="{value_style}">{safe_str(row.get('consistency'), "{:.1f}")}</span></div>
-        <div style="{stat_layout}"><span style="{label_style}">Elo</span><span style="{value_style}">{rating}</span></div>
-        <div style="{stat_layout}"><span style="{label_style}">Change</span><span style="{value_style}">{change_display}</span></div>
+        <div class="card-stat"><span class="card-stat-label">Daily #1</span><span class="card-stat-value">{safe_str(row.get('wins'))}</span></div>
+        <div class="card-stat"><span class="card-stat-label">Daily #1 (%)</span><span class="card-stat-value">{safe_str(row.get('win_rate'), "{:.1f}")}%</span></div>
+        <div class="card-stat"><span class="card-stat-label">Daily Top 10</span><span class="card-stat-value">{top10}</span></div>
+        <div class="card-stat"><span class="card-stat-label">Daily Top 10 (%)</span><span class="card-stat-value">{top10_rate}</span></div>
+        <div class="card-stat"><span class="card-stat-label">7-Game Avg</span><span class="card-stat-value">{safe_str(row.get('last_7'), "{:.1f}")}</span></div>
+        <div class="card-stat"><span class="card-stat-label" title="Lower = more consistent">7-Game StdDev</span><span class="card-stat-value">{safe_str(row.get('consistency'), "{:.1f}")}</span></div>
+        <div class="card-stat"><span class="card-stat-label">Elo</span><span class="card-stat-value">{rating}</span></div>
+        <div class="card-stat"><span class="card-stat-label">Change</span><span class="card-stat-value">{change_display}</span></div>
         '''
 
         # Card layout with centered header
-        card = f'''<div class="history-card" style="{card_base}">
+        card = f'''<div class="history-card">
             <div class="history-header" style="text-align:center;margin-bottom:0.75rem;padding-bottom:0.5rem;border-bottom:1px solid rgba(128,128,128,0.35);">
                 <span style="font-weight:600;color:var(--text-color);">{html.escape(player_name)}'s run n°{run_number} · {date_link_html}</span>
             </div>
             <div class="history-rank" style="display:flex;flex-direction:column;align-items:center;margin-bottom:0.5rem;padding-bottom:0.5rem;border-bottom:1px solid rgba(128,128,128,0.2);">
-                <span style="{label_style}">Daily Rank</span>
-                <span style="{value_style}">{rank_score_combined}</span>
+                <span class="card-stat-label">Daily Rank</span>
+                <span class="card-stat-value">{rank_score_combined}</span>
             </div>
             <div class="history-stats" style="display:grid;grid-template-columns:repeat(4, 1fr);gap:0.5rem;">{stats_html}</div>
         </div>'''
@@ -677,7 +692,7 @@ def compute_hall_of_fame_stats(df_history):
         return None
 
     # Filter to rows where player actually played (has a rank/score)
-    df_played = df_history[df_history['rank'].notna()].copy()
+    df_played = df_history[df_history['rank'].notna()]
 
     if df_played.empty:
         return None
@@ -686,7 +701,8 @@ def compute_hall_of_fame_stats(df_history):
         """Get top N entries including all ties at the Nth position."""
         if cols is None:
             cols = ['player_name', value_col]
-        df_sorted = df.sort_values(value_col, ascending=False)
+        # Stable sort: tied entries keep input (alphabetical) order regardless of dtype
+        df_sorted = df.sort_values(value_col, ascending=False, kind='mergesort')
         if len(df_sorted) <= n:
             return df_sorted[cols].values.tolist()
         # Find the value at the nth position
@@ -697,16 +713,16 @@ def compute_hall_of_fame_stats(df_history):
 
     # 1. Most Wins (total rank=1 finishes per player)
     # Get latest row per player (cumulative wins column)
-    latest_per_player = df_history.sort_values('date').groupby('player_name').last().reset_index()
+    latest_per_player = df_history.sort_values('date').groupby('player_name', observed=True).last().reset_index()
     if 'wins' in latest_per_player.columns:
         most_wins = top_n_with_ties(latest_per_player, 'wins', 10, ['player_name', 'wins'])
     else:
         # Fallback: count rank=1 occurrences
-        win_counts = df_played[df_played['rank'] == 1].groupby('player_name').size().reset_index(name='wins')
+        win_counts = df_played[df_played['rank'] == 1].groupby('player_name', observed=True).size().reset_index(name='wins')
         most_wins = top_n_with_ties(win_counts, 'wins', 10, ['player_name', 'wins'])
 
     # 2. Highest Scores (single-game records)
-    df_with_scores = df_played[df_played['score'].notna()].copy()
+    df_with_scores = df_played[df_played['score'].notna()]
     highest_scores = top_n_with_ties(df_with_scores, 'score', 10, ['player_name', 'score', 'date'])
 
     # 3. Most Games (total games played per player)
@@ -714,7 +730,7 @@ def compute_hall_of_fame_stats(df_history):
         most_games = top_n_with_ties(latest_per_player, 'games_played', 10, ['player_name', 'games_played'])
     else:
         # Fallback: count appearances
-        game_counts = df_played.groupby('player_name').size().reset_index(name='games_played')
+        game_counts = df_played.groupby('player_name', observed=True).size().reset_index(name='games_played')
         most_games = top_n_with_ties(game_counts, 'games_played', 10, ['player_name', 'games_played'])
 
     # 4. Longest Win Streaks (consecutive rank=1 days)
@@ -722,7 +738,7 @@ def compute_hall_of_fame_stats(df_history):
     df_sorted = df_played.sort_values(['player_name', 'date'])
 
     streaks = []
-    for player, group in df_sorted.groupby('player_name'):
+    for player, group in df_sorted.groupby('player_name', observed=True):
         group = group.sort_values('date')
         current_streak = 0
         max_streak = 0
@@ -753,9 +769,9 @@ def compute_hall_of_fame_stats(df_history):
     # 5. Days at Elo #1 (all players who have held active_rank=1)
     # Count days where each player was Elo #1
     if 'active_rank' in df_history.columns:
-        df_elo_1 = df_history[df_history['active_rank'] == 1].copy()
-        days_at_elo_1_counts = df_elo_1.groupby('player_name').size().reset_index(name='days')
-        days_at_elo_1_counts = days_at_elo_1_counts.sort_values('days', ascending=False)
+        df_elo_1 = df_history[df_history['active_rank'] == 1]
+        days_at_elo_1_counts = df_elo_1.groupby('player_name', observed=True).size().reset_index(name='days')
+        days_at_elo_1_counts = days_at_elo_1_counts.sort_values('days', ascending=False, kind='mergesort')
         days_at_elo_1 = days_at_elo_1_counts[['player_name', 'days']].values.tolist()
     else:
         days_at_elo_1 = []
@@ -842,7 +858,7 @@ def generate_hall_of_fame_cards(stats):
 
     def build_card(title, icon, items, value_formatter=format_number):
         """Build a single Hall of Fame card with proper tie handling."""
-        rows_html = ""
+        rows = []
         current_rank = 0
         prev_value = None
 
@@ -869,13 +885,14 @@ def generate_hall_of_fame_cards(stats):
             player_url = build_url_with_params({"tab": "tracker", "player": player, **_get_current_dataset_param()})
             player_link_html = f'<a href="{player_url}" target="_self" class="player-link" style="color: inherit; text-decoration: none;">{html.escape(player)}</a>'
 
-            rows_html += f'''
+            rows.append(f'''
                 <div style="{row_style}">
                     <span style="{rank_style}">{rank_display}</span>
                     <span style="{name_style}">{player_link_html}</span>
                     <span style="{value_style}">{value_formatter(value)}</span>
                 </div>
-            '''
+            ''')
+        rows_html = "".join(rows)
 
         return f'''
             <div style="{card_style}">
@@ -887,31 +904,31 @@ def generate_hall_of_fame_cards(stats):
             </div>
         '''
 
-    cards_html = '<div class="hof-cards-grid">'
+    cards = ['<div class="hof-cards-grid">']
 
     # Most Wins card
     if stats.get('most_wins'):
-        cards_html += build_card("Most Wins", "🏆", stats['most_wins'])
+        cards.append(build_card("Most Wins", "🏆", stats['most_wins']))
 
     # Highest Scores card
     if stats.get('highest_scores'):
-        cards_html += build_card("Highest Scores", "💯", stats['highest_scores'])
+        cards.append(build_card("Highest Scores", "💯", stats['highest_scores']))
 
     # Most Games card
     if stats.get('most_games'):
-        cards_html += build_card("Most Games", "🎮", stats['most_games'])
+        cards.append(build_card("Most Games", "🎮", stats['most_games']))
 
     # Longest Win Streaks card
     if stats.get('longest_streaks'):
-        cards_html += build_card("Longest Win Streaks", "🔥", stats['longest_streaks'])
+        cards.append(build_card("Longest Win Streaks", "🔥", stats['longest_streaks']))
 
     # Days at Elo #1 card (shows ALL players who have held #1, not just top 5)
     if stats.get('days_at_elo_1'):
-        cards_html += build_card("Days at Elo #1", "👑", stats['days_at_elo_1'])
+        cards.append(build_card("Days at Elo #1", "👑", stats['days_at_elo_1']))
 
-    cards_html += '</div>'
+    cards.append('</div>')
 
-    return cards_html
+    return "".join(cards)
 
 
 # --- Rivalries ---
@@ -938,7 +955,7 @@ def get_player_rivals(player_name, df_rivalries, n=6, min_closeness=0.5):
 
     # Find all rivalries involving this player
     mask = (df_rivalries['player1'] == player_name) | (df_rivalries['player2'] == player_name)
-    player_rivalries = df_rivalries[mask].copy()
+    player_rivalries = df_rivalries[mask]
 
     if player_rivalries.empty:
         return []
@@ -1052,7 +1069,7 @@ def generate_rivals_html(player_name, rivals):
         margin-top: 0.25rem;
     """
 
-    rivals_html = ""
+    rival_cards = []
     for rival in rivals:
         # Target icon for all rivals
         icon = "🎯"
@@ -1068,13 +1085,14 @@ def generate_rivals_html(player_name, rivals):
         else:
             record_prefix = "="  # Tied
 
-        rivals_html += f'''
+        rival_cards.append(f'''
             <a href="{duel_url}" target="_self" style="{rival_card_style}" class="rival-card">
                 <div style="{name_style}">{icon} {html.escape(rival['name'])}</div>
                 <div style="{record_style}">{record_prefix} {rival['player_wins']}-{rival['rival_wins']}</div>
                 <div style="{meta_style}">{rival['total_encounters']} battles</div>
             </a>
-        '''
+        ''')
+    rivals_html = "".join(rival_cards)
 
     return f'''
         <div style="{card_style}">
@@ -1250,1448 +1268,462 @@ def create_download_link_b64(b64_data: str, filename: str, label: str, is_dark:
 
 # Custom CSS for visual hierarchy and spacing
 # Includes: Gothic fonts, glassmorphism, animations, gradient effects
-CUSTOM_CSS = """
+# Stylesheet lives in styles/dashboard.css; read once at import, not per rerun.
+# (Streamlit's static serving returns .css as text/plain + nosniff, so it can't
+# be <link>ed; injected payloads over 10 KB are already sent by hash on reruns.)
+CSS_PATH = Path(__file__).parent / "styles" / "dashboard.css"
+CUSTOM_CSS = (
+    """
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin="anonymous">
 <link href="https://fonts.googleapis.com/css2?family=Cinzel:wght@400;600;700&family=Rajdhani:wght@400;500;600;700&display=swap" rel="stylesheet">
 <style>
-:root {
-    --font-display: 'Source Sans', sans-serif;
-    --font-body: 'Source Sans', sans-serif;
-    --primary-glow: 0 0 20px rgba(255, 107, 107, 0.4);
-    --glass-bg: rgba(38, 39, 48, 0.7);
-    --glass-border: rgba(255, 107, 107, 0.2);
-    /* Spacing tokens */
-    --space-xs: 0.25rem;
-    --space-sm: 0.5rem;
-    --space-md: 1rem;
-    --space-lg: 1.5rem;
-    --space-xl: 2rem;
-}
+"""
+    + CSS_PATH.read_text(encoding="utf-8")
+    + "</style>\n"
+    # Theme overrides follow the base sheet, so one element carries all page CSS
+    + get_theme_css()
+)
 
-/* Theme-adaptive glass effect variables (set on Streamlit's themed container) */
-[data-testid="stAppViewContainer"] {
-    --glass-border-subtle: rgba(255,255,255,0.2);
-    --glass-ring: rgba(255,255,255,0.08);
-    --glass-inset: rgba(255,255,255,0.1);
-    --glass-drop: rgba(0,0,0,0.15);
-}
+LOGO_PATH = Path(__file__).parent / "images" / "dftl_logo.png"
 
-/* Hide Streamlit toolbar and status indicators */
-[data-testid="stMainMenu"],
-[data-testid="stAppDeployButton"],
-[data-testid="stToolbarActions"],
-[data-testid="stStatusWidget"] {
-    display: none !important;
-}
 
-/* Prevent header from covering the scrollbar */
-[data-testid="stHeader"] {
-    width: calc(100% - 8px) !important;
-}
+@st.cache_resource
+def load_logo_b64():
+    """Base64-encoded banner logo, read and encoded once per process (None if missing)."""
+    if not LOGO_PATH.exists():
+        return None
+    return base64.b64encode(LOGO_PATH.read_bytes()).decode()
 
-/* Sidebar collapse button - ensure always visible (not just on hover) */
-[data-testid="stSidebarCollapseButton"],
-[data-testid="stSidebarCollapseButton"] button {
-    visibility: visible !important;
-    opacity: 1 !important;
-}
 
-/* ===== WCAG-Compliant Rating Change Colors ===== */
-.change-positive {
-    color-scheme: inherit;
-    color: #10B981 !important;
-}
-.change-negative {
-    color-scheme: inherit;
-    color: #EF4444 !important;
-}
+# --- Chart Styling ---
+# Plotly figure styling for consistent theme-aware charts
 
-/* ===== Typography Hierarchy ===== */
-.main h1, .main h2, .main h3 {
-    font-family: var(--font-display) !important;
-}
+def apply_plotly_style(fig, add_gradient_fill=False):
+    """Apply consistent styling to Plotly figures following the design system.
 
-.main h1 {
-    font-size: 2.25rem !important;
-    font-weight: 700 !important;
-    letter-spacing: 0.05em !important;
-    margin-bottom: 0.5rem !important;
-}
+    Typography (from CLAUDE.md design system):
+    - Font: System font stack (matches "System" in design system)
+    - Label: 0.8rem (~13px), weight 500
+    - Data value: 1.4rem (~22px), weight 700
 
-.main h2 {
-    font-size: 1.5rem !important;
-    font-weight: 600 !important;
-    margin-top: 1.5rem !important;
-    margin-bottom: 1rem !important;
-    letter-spacing: 0.03em !important;
-}
+    Text colors are NOT explicitly set, allowing Streamlit to inject theme-aware
+    colors automatically. Only structural elements (grids, backgrounds) use
+    explicit neutral colors.
+    """
+    # System font stack (design system "System" font)
+    system_font = '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif'
 
-.main h3 {
-    font-size: 1.25rem !important;
-    font-weight: 600 !important;
-}
+    # Structural colors that work on both light and dark backgrounds
+    grid_color = "rgba(128, 128, 128, 0.4)"  # Neutral gray grid
+    line_color = "rgba(128, 128, 128, 0.3)"  # Neutral gray lines
+    hover_bg = "rgba(50, 50, 50, 0.9)"  # Dark hover for readability
+    hover_text = "#FFFFFF"  # White text on dark hover background
 
-/* Body text uses Rajdhani for readability */
-.main p, .main span, .main label, .main div {
-    font-family: var(--font-body), sans-serif;
-}
+    # Design system font weights
+    label_weight = 500   # Label style
+    heading_weight = 600  # Card heading style
 
-/* ===== Player Links (click to view in Tracker) ===== */
-.player-link {
-    color: inherit !important;
-    text-decoration: none !important;
-    transition: color 0.15s ease;
-}
-.player-link:hover {
-    color: #FF6B6B !important;
-    text-decoration: underline !important;
-}
+    # Design system font sizes (converted from rem, assuming 16px base)
+    label_size = 13      # 0.8rem ≈ 13px
+    body_size = 16       # 1rem = 16px
 
-/* ===== Date Links (click to view in Dailies) ===== */
-.date-link {
-    color: inherit !important;
-    text-decoration: none !important;
-    transition: color 0.15s ease;
-}
-.date-link:hover {
-    color: #3B82F6 !important;
-    text-decoration: underline !important;
-}
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        font=dict(family=system_font, size=body_size, weight=label_weight),
+        xaxis=dict(
+            gridcolor=grid_color,
+            linecolor=line_color,
+            tickfont=dict(family=system_font, size=label_size, weight=label_weight),
+            title_font=dict(family=system_font, size=label_size, weight=heading_weight),
+            showgrid=True,
+            zeroline=False,
+        ),
+        yaxis=dict(
+            gridcolor=grid_color,
+            linecolor=line_color,
+            tickfont=dict(family=system_font, size=label_size, weight=label_weight),
+            title_font=dict(family=system_font, size=label_size, weight=heading_weight),
+            showgrid=True,
+            zeroline=False,
+        ),
+        legend=dict(
+            title_text="",  # Remove "Player" title
+            font=dict(family=system_font, size=label_size, weight=heading_weight),
+            bgcolor="rgba(0,0,0,0)",  # Transparent background
+            borderwidth=0,  # No border
+        ),
+        hoverlabel=dict(
+            bgcolor=hover_bg,
+            bordercolor="rgba(0,0,0,0)",  # No border
+            font=dict(color=hover_text, family=system_font, size=14, weight=heading_weight),
+        ),
+        dragmode=False,  # Disable pan/zoom to prevent scroll hijacking on mobile
+        transition=dict(duration=0),  # No layout animation on (re)render
+    )
 
-/* Focus styles for keyboard navigation (WCAG 2.1 compliance) */
-.player-link:focus,
-.date-link:focus,
-.dashboard-banner-link:focus,
-.tab-link:focus,
-.stPopover button:focus {
-    color-scheme: inherit;
-    outline: 2px solid #FF6B6B !important;
-    outline-offset: 2px;
-    border-radius: 4px;
-}
+    # Add gradient fill under line charts if requested
+    if add_gradient_fill:
+        fig.update_traces(
+            fill='tozeroy',
+            fillcolor='rgba(255, 107, 107, 0.15)',
+            line=dict(width=3),
+        )
 
-/* ===== Section Containers ===== */
-.stTabs [data-baseweb="tab-panel"] {
-    padding-top: 1.5rem;
-}
+    return fig
 
-/* ===== Metric Cards (theme-adaptive using Streamlit CSS variables) ===== */
-[data-testid="stMetric"] {
-    background: var(--secondary-background-color) !important;
-    border: 1px solid rgba(128, 128, 128, 0.2) !important;
-    border-radius: 12px !important;
-    padding: 1.25rem !important;
-    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1) !important;
-    transition: transform 0.2s ease, box-shadow 0.2s ease !important;
-}
 
-[data-testid="stMetric"]:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15) !important;
-    border-color: rgba(255, 107, 107, 0.4) !important;
+# --- Constants ---
+OUTPUT_FOLDER = Path(__file__).parent / "data" / "processed"
+DATASET_OPTIONS = {
+    "Steam Demo+Early Access": "full",
+    "Early Access Only": "early_access"
 }
 
-[data-testid="stMetric"] label {
-    font-family: var(--font-body) !important;
-    font-size: 0.8rem !important;
-    font-weight: 600 !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.1em !important;
-    color-scheme: inherit;
-    color: #9CA3AF !important;
-}
+# Tab options (radio-as-tabs for persistence)
+TAB_OPTIONS = [
+    "🏅 Rankings",
+    "⚔️ Duels",
+    "👤 Tracker",
+    "📊 Dailies",
+    "🏆 Hall of Fame"
+]
 
-[data-testid="stMetric"] [data-testid="stMetricValue"] {
-    font-family: var(--font-display) !important;
-    font-size: 2rem !important;
-    font-weight: 700 !important;
-    color: var(--text-color) !important;
+# Tab name to URL slug mapping (for cleaner URLs)
+TAB_SLUGS = {
+    "🏅 Rankings": "rankings",
+    "⚔️ Duels": "duels",
+    "👤 Tracker": "tracker",
+    "📊 Dailies": "dailies",
+    "🏆 Hall of Fame": "hall-of-fame"
 }
+SLUG_TO_TAB = {v: k for k, v in TAB_SLUGS.items()}
 
-/* ===== Number Counter Effect (static for performance) ===== */
-/* Animation removed - was causing re-renders on every state change */
 
-/* ===== Data Tables with Glass Effect ===== */
-.stDataFrame {
-    border-radius: 12px !important;
-    overflow: hidden;
-    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.2);
-}
+# --- Data Loading Functions ---
+@st.cache_resource(ttl=300)
+def output_file_names():
+    """
+    Sorted names of the files in OUTPUT_FOLDER.
 
-.stDataFrame thead th {
-    font-family: var(--font-body) !important;
-    font-weight: 700 !important;
-    text-transform: uppercase !important;
-    font-size: 0.75rem !important;
-    letter-spacing: 0.08em !important;
-    background: rgba(255, 107, 107, 0.1) !important;
-}
+    One directory listing serves every loader and dataset check; it is cached
+    for 5 minutes to avoid re-scanning the folder on every rerun.
+    """
+    if not OUTPUT_FOLDER.is_dir():
+        return ()
+    return tuple(sorted(entry.name for entry in os.scandir(OUTPUT_FOLDER) if entry.is_file()))
 
-/* ===== Sidebar Styling ===== */
-/* Background set dynamically via get_theme_css() for theme support */
 
-[data-testid="stSidebar"] .stMarkdown hr {
-    border-color: rgba(255, 107, 107, 0.3);
-    margin: 1.5rem 0;
-    box-shadow: 0 1px 0 rgba(255, 107, 107, 0.1);
-}
+def latest_file(pattern, exclude=None):
+    """
+    Return the most recent file in OUTPUT_FOLDER matching `pattern`, or None.
 
-/* Sidebar collapse button (inside sidebar) - always light (sidebar is always dark) */
-/* Use CSS filter as fallback - inverts dark icon to light */
-/* IMPORTANT: Only target elements INSIDE [data-testid="stSidebar"] */
-[data-testid="stSidebar"] button[data-testid="stBaseButton-headerNoPadding"],
-[data-testid="stSidebar"] [data-testid="stSidebarNav"] button,
-[data-testid="stSidebar"] button[kind="headerNoPadding"],
-[data-testid="stSidebar"] > div > button,
-[data-testid="stSidebar"] header button {
-    color: #FFFFFF !important;
-    filter: brightness(0) invert(1) !important;
-}
-[data-testid="stSidebar"] button[data-testid="stBaseButton-headerNoPadding"] svg,
-[data-testid="stSidebar"] [data-testid="stSidebarNav"] svg,
-[data-testid="stSidebar"] > div > button svg,
-[data-testid="stSidebar"] header button svg {
-    fill: #FFFFFF !important;
-    stroke: #FFFFFF !important;
-}
+    Files carry a YYYYMMDD suffix, so the newest one sorts last by name.
+    """
+    names = [n for n in output_file_names() if fnmatchcase(n, pattern) and not (exclude and exclude in n)]
+    return OUTPUT_FOLDER / names[-1] if names else None
 
-/* ===== Tab Styling - Subtle ===== */
-.stTabs [data-baseweb="tab-list"] {
-    gap: 0.25rem;
-    background: transparent;
-    padding: 0.25rem 0;
-    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-    border-radius: 0;
-    /* Enable horizontal scrolling on narrow screens */
-    overflow-x: auto;
-    flex-wrap: nowrap !important;
-    -webkit-overflow-scrolling: touch;
-    scrollbar-width: thin;
-}
 
-/* Hide the animated highlight bar */
-.stTabs [data-baseweb="tab-highlight"] {
-    display: none !important;
-}
+def downcast_int_columns(df):
+    """
+    Downcast integer-valued columns in place to smaller dtypes.
 
-.stTabs [data-baseweb="tab"] {
-    font-family: var(--font-body) !important;
-    border-radius: 0 !important;
-    padding: 0.6rem 1rem !important;
-    font-weight: 500 !important;
-    letter-spacing: 0.02em;
-    border-bottom: 2px solid transparent !important;
-    background: transparent !important;
-    opacity: 0.85;
-    transition: opacity 0.15s ease !important;
-    /* Prevent tabs from shrinking on narrow screens */
-    flex-shrink: 0 !important;
-    white-space: nowrap !important;
-}
+    int64 columns go to the smallest integer dtype that holds their values.
+    Float columns that only hold whole numbers (ranks/scores padded with NaN
+    on days a player did not play) go to float32, which is exact below 2**24.
+    Fractional floats (ratings, rates) stay float64 on purpose: float32 would
+    change how displayed values like 1234.45 round.
+    """
+    for col in df.select_dtypes(include='int64').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include='float64').columns:
+        values = df[col].to_numpy()
+        finite = values[~np.isnan(values)]
+        if (finite == np.round(finite)).all() and (np.abs(finite) < 2**24).all():
+            df[col] = values.astype('float32')
+    return df
 
-.stTabs [data-baseweb="tab"]:hover {
-    opacity: 0.95;
-    background: transparent !important;
-    color: inherit !important;
-}
 
-.stTabs [aria-selected="true"] {
-    opacity: 1 !important;
-    border-bottom: 2px solid var(--text-color, currentColor) !important;
-    background: transparent !important;
-    color: inherit !important;
-}
+# Using cache_resource instead of cache_data for faster cache hits (no serialization overhead)
+# WARNING: cache_resource hands every session the SAME DataFrame object - treat loaded
+# frames (and slices of them) as read-only; derive new frames instead of assigning into them
+# Player-name columns are loaded as categories: filters/merges/groupbys work on int codes
+# (groupby on them needs observed=True, otherwise every category gets a row)
+@st.cache_resource(ttl=3600)
+def load_leaderboard_data(dataset_prefix):
+    """Load the most recent leaderboard CSV for the given dataset."""
+    path = latest_file(f"{dataset_prefix}_leaderboard_*.csv")
+    if path is None:
+        return None
+    df = pd.read_csv(path, parse_dates=['date'])
+    df['player_name'] = df['player_name'].astype('category')
+    downcast_int_columns(df)
+    # Date-major order so the Dailies tab can use rows_for_date
+    df = df.sort_values('date', kind='mergesort', ignore_index=True)
+    return df
 
-/* ===== Buttons with Glow Effect ===== */
-.stButton > button {
-    font-family: var(--font-body) !important;
-    border-radius: 8px !important;
-    font-weight: 600 !important;
-    letter-spacing: 0.03em;
-    transition: border-color 0.2s ease, box-shadow 0.2s ease !important;
-    border: 1px solid rgba(255, 107, 107, 0.3) !important;
-}
 
-.stButton > button:hover {
-    border-color: #FF6B6B !important;
-    box-shadow: var(--primary-glow) !important;
-    transform: translateY(-1px);
-}
+@st.cache_resource(ttl=3600)
+def load_ratings_data(dataset_prefix):
+    """Load the most recent Elo ratings CSV for the given dataset (active players only)."""
+    # Exclude _all_ files
+    path = latest_file(f"{dataset_prefix}_elo_ratings_*.csv", exclude='_all_')
+    if path is None:
+        return None
+    df = pd.read_csv(path, parse_dates=['last_seen'])
+    df['player_name'] = df['player_name'].astype('category')
+    downcast_int_columns(df)
+    return df
 
-/* ===== Toggle with Animation ===== */
-[data-testid="stToggle"] label span {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-}
 
-/* ===== Expander with Glass Effect ===== */
-.streamlit-expanderHeader {
-    font-family: var(--font-display) !important;
-    font-weight: 600 !important;
-    letter-spacing: 0.02em;
-}
+@st.cache_resource(ttl=3600)
+def load_all_ratings_data(dataset_prefix):
+    """Load the most recent Elo ratings CSV including inactive players."""
+    path = latest_file(f"{dataset_prefix}_elo_ratings_all_*.csv")
+    if path is None:
+        return None
+    df = pd.read_csv(path, parse_dates=['last_seen'])
+    df['player_name'] = df['player_name'].astype('category')
+    downcast_int_columns(df)
+    return df
 
-[data-testid="stExpander"] {
-    border: 1px solid var(--glass-border) !important;
-    border-radius: 12px !important;
-    /* Background set dynamically via get_theme_css() */
-}
 
-/* ===== Form Labels ===== */
-[data-testid="stSelectbox"] label,
-[data-testid="stDateInput"] label {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    letter-spacing: 0.02em;
-}
+@st.cache_resource(ttl=3600)
+def load_history_data(dataset_prefix):
+    """Load the most recent Elo history CSV for the given dataset."""
+    path = latest_file(f"{dataset_prefix}_elo_history_*.csv")
+    if path is None:
+        return None
+    df = pd.read_csv(path, parse_dates=['date'])
+    df['player_name'] = df['player_name'].astype('category')
+    downcast_int_columns(df)
+    # Date-major order (stable: players stay alphabetical within a day) so
+    # per-day lookups can binary-search instead of scanning (see rows_for_date)
+    df = df.sort_values('date', kind='mergesort', ignore_index=True)
+    return df
 
-/* ===== Spacing ===== */
-.block-container {
-    padding-top: 3rem;
-    padding-bottom: 2rem;
-}
 
-.element-container {
-    margin-bottom: 0.5rem;
-}
+@st.cache_resource(ttl=3600)
+def load_rivalries_data(dataset_prefix):
+    """Load the most recent rivalries CSV for the given dataset."""
+    path = latest_file(f"{dataset_prefix}_rivalries_*.csv")
+    if path is None:
+        return None
+    df = pd.read_csv(path)
+    df['player1'] = df['player1'].astype('category')
+    df['player2'] = df['player2'].astype('category')
+    downcast_int_columns(df)
+    return df
 
-/* Tighter vertical spacing - use --space-xs (4px) for related controls */
-[data-testid="stVerticalBlock"] {
-    gap: 0.25rem !important;
-}
-/* Horizontal blocks: allow wrapping by default for charts to stack on mobile */
-[data-testid="stHorizontalBlock"] {
-    gap: 0.5rem !important;
-}
-/* Tab 1 controls (with date input): keep side-by-side even on mobile */
-[data-testid="stHorizontalBlock"]:has([data-testid="stDateInput"]) {
-    flex-wrap: nowrap !important;
-}
-/* Only remove min-width for Tab 1 control columns, not chart columns */
-[data-testid="stHorizontalBlock"]:has([data-testid="stDateInput"]) [data-testid="stColumn"] {
-    min-width: 0 !important;
-}
-/* Tab 2 duel pickers: keep side-by-side even on mobile */
-[data-testid="stHorizontalBlock"]:has([data-testid="stSelectbox"]) {
-    flex-wrap: nowrap !important;
-}
-[data-testid="stHorizontalBlock"]:has([data-testid="stSelectbox"]) [data-testid="stColumn"] {
-    min-width: 0 !important;
-}
-/* Remove margin between player label and selectbox in duel pickers */
-[data-testid="stHorizontalBlock"]:has([data-testid="stSelectbox"]) [data-testid="stElementContainer"]:has([data-testid="stHtml"]) {
-    margin-bottom: 0 !important;
-}
-/* Vertically center heading + control rows (e.g., Game History + sort dropdown) */
-[data-testid="stHorizontalBlock"]:has(h3):has([data-testid="stSelectbox"]) {
-    align-items: center !important;
-}
-[data-testid="stHorizontalBlock"]:has(h3):has([data-testid="stSelectbox"]) [data-testid="stVerticalBlock"] {
-    justify-content: center !important;
-}
-/* Reduce vertical spacing in Tab 2 (duel pickers, cards, charts) */
-[data-testid="stVerticalBlock"]:has([data-testid="stSelectbox"]) > [data-testid="stElementContainer"] {
-    margin-bottom: 0.5rem !important;
-}
-/* Vertical divider between side-by-side chart columns */
-[data-testid="stHorizontalBlock"]:has(.stPlotlyChart) {
-    color-scheme: inherit;
-    gap: 1.5rem !important;
-}
-[data-testid="stHorizontalBlock"]:has(.stPlotlyChart) > [data-testid="stColumn"]:first-child {
-    color-scheme: inherit;
-    border-right: 1px solid #404040;
-    padding-right: 1rem;
-}
-/* Mobile/Tablet: prevent chart scroll hijacking */
-/* touch-action: pan-y allows vertical scrolling through charts */
-.stPlotlyChart,
-.stPlotlyChart * {
-    touch-action: pan-y !important;
-}
-/* On narrower screens, fully disable chart interaction */
-@media (max-width: 768px) {
-    .stPlotlyChart {
-        pointer-events: none !important;
-    }
-}
 
-/* ===== Tab Navigation Styling ===== */
-/* Anchor links styled as tabs for scroll-to-top navigation */
-.tab-nav {
-    display: flex;
-    flex-direction: row;
-    flex-wrap: wrap;
-    gap: 0;
-    justify-content: center;
-    width: 100%;
-    position: relative;
-    padding-bottom: 1px;
-}
-/* Note: Full-width divider line is handled by box-shadow on sticky container */
-.tab-link {
-    display: flex;
-    align-items: center;
-    padding: 0.6rem 0.8rem;
-    margin: 0;
-    border: none;
-    background: transparent;
-    cursor: pointer;
-    font-weight: 500;
-    font-size: 0.9rem;
-    color: var(--text-color);
-    opacity: 0.6;
-    border-bottom: 2px solid transparent;
-    transition: opacity 0.2s, border-color 0.2s;
-    white-space: nowrap;
-    text-decoration: none;
-}
-.tab-link:hover {
-    opacity: 1;
-    text-decoration: none;
-    color: var(--text-color);
-}
-.tab-link.active {
-    opacity: 1;
-    border-bottom-color: #FF6B6B;
-    font-weight: 600;
-}
-/* Mobile sm (≤600px): compact tabs to fit on one row */
-@media (max-width: 600px) {
-    .tab-link {
-        padding: 0.5rem 0.5rem;
-        font-size: 0.8rem;
-    }
-}
-/* Mobile xs (≤400px): tighter spacing for narrow screens */
-@media (max-width: 400px) {
-    .tab-link {
-        padding: 0.45rem 0.35rem;
-        font-size: 0.75rem;
-    }
-}
+@st.cache_resource(ttl=3600)
+def history_row_index(dataset_prefix):
+    """
+    Map player_name -> positional row indices in the history frame (one groupby per dataset).
 
-/* ===== Player Tracker Chart Subtitle ===== */
-.tracker-chart-subtitle {
-    color-scheme: inherit;
-    color: #A0A0A0;
-    font-size: 0.75rem;
-    font-weight: 500;
-    margin: -0.5rem 0 0.5rem 0;
-}
+    Lets per-player lookups skip the full-history `player_name == X` scan.
+    """
+    df = load_history_data(dataset_prefix)
+    if df is None:
+        return {}
+    return df.groupby('player_name', observed=True, sort=False).indices
 
-/* ===== Dividers with Gradient ===== */
-.main hr {
-    border: none;
-    height: 1px;
-    background: linear-gradient(90deg, transparent 0%, rgba(255, 107, 107, 0.5) 50%, transparent 100%);
-    margin: 1.5rem 0;
-}
 
-/* ===== Animation Keyframes (removed for performance) ===== */
-/* Infinite animations removed - they cause continuous repaints */
+def load_player_history(dataset_prefix, player_name):
+    """Return the history rows for one player (date order), or None if there is no history."""
+    df = load_history_data(dataset_prefix)
+    if df is None:
+        return None
+    rows = history_row_index(dataset_prefix).get(player_name)
+    if rows is None:
+        return df.iloc[0:0]
+    return df.iloc[rows]
 
-/* ===== Custom Scrollbar ===== */
-::-webkit-scrollbar {
-    width: 8px;
-    height: 8px;
-}
 
-::-webkit-scrollbar-track {
-    background: rgba(38, 39, 48, 0.5);
-    border-radius: 4px;
-}
+@st.cache_resource(ttl=3600)
+def players_sorted_by_rating(dataset_prefix):
+    """
+    Player names for selectors: ranked players first, then unranked, both by rating desc.
 
-::-webkit-scrollbar-thumb {
-    background: linear-gradient(180deg, #FF6B6B 0%, #E55555 100%);
-    border-radius: 4px;
-}
+    Returned as a tuple so the one cached object can be shared by every session
+    and selectbox without a per-rerun copy. Returns None if no all-ratings file
+    exists for the dataset.
+    """
+    df = load_all_ratings_data(dataset_prefix)
+    if df is None:
+        return None
+    # One stable sort, then split: ranked/unranked partitions keep rating order
+    df_sorted = df.sort_values('rating', ascending=False, kind='mergesort')
+    ranked_mask = df_sorted['active_rank'].notna()
+    return tuple(
+        df_sorted.loc[ranked_mask, 'player_name'].tolist()
+        + df_sorted.loc[~ranked_mask, 'player_name'].tolist()
+    )
 
-::-webkit-scrollbar-thumb:hover {
-    background: linear-gradient(180deg, #FF8E8E 0%, #FF6B6B 100%);
-}
 
-/* ===== Tooltip Styling ===== */
-[data-testid="stTooltipIcon"] {
-    color: rgba(255, 107, 107, 0.7) !important;
-}
+@st.cache_resource(ttl=3600)
+def players_alphabetical(dataset_prefix):
+    """Distinct leaderboard player names in alphabetical order, as a shared tuple."""
+    return tuple(sorted(load_leaderboard_data(dataset_prefix)['player_name'].unique()))
 
-/* ===== Selection Highlight ===== */
-::selection {
-    background: rgba(255, 107, 107, 0.3);
-    color: #FAFAFA;
-}
 
-/* ===== Top 3 Spotlight ===== */
-/* Static styling - animations removed for performance */
+def rows_for_date(df, day):
+    """
+    Return the rows of a date-sorted DataFrame that fall on `day`.
 
-/* ===== Sidebar Styling ===== */
-/* Sidebar text styling handled dynamically via get_theme_css() */
-/* Typography uses design system scale: Card heading (1.1/1/0.95rem), Label (0.8/0.75/0.7rem) */
-[data-testid="stSidebar"] {
-    padding: var(--space-sm) !important;  /* Compact: --space-sm instead of --space-md */
-    max-width: 360px !important;
-}
+    Brackets the day with two binary searches on the `date` column, so the
+    lookup is O(log N) instead of a full-column `.dt.date == day` scan.
+    """
+    start = np.datetime64(day, 'D')
+    lo, hi = df['date'].to_numpy().searchsorted([start, start + np.timedelta64(1, 'D')])
+    return df.iloc[lo:hi]
 
-/* Only set min-width when sidebar is expanded */
-[data-testid="stSidebar"][aria-expanded="true"] {
-    min-width: 320px !important;
-}
 
-/* Collapse sidebar properly when closed */
-[data-testid="stSidebar"][aria-expanded="false"] {
-    width: 0 !important;
-    min-width: 0 !important;
-    padding: 0 !important;
-    overflow: hidden !important;
-}
+@st.cache_resource(ttl=3600)
+def available_dates(dataset_prefix, source):
+    """Distinct days in the dataset's leaderboard or history data, newest first."""
+    loader = load_leaderboard_data if source == 'leaderboard' else load_history_data
+    return sorted(loader(dataset_prefix)['date'].dt.date.unique(), reverse=True)
 
-[data-testid="stSidebar"] > div:first-child {
-    width: 100% !important;
-    max-width: 360px !important;
-}
 
-/* Sidebar headers - Card heading scale with consistent vertical rhythm */
-[data-testid="stSidebar"] h1,
-[data-testid="stSidebar"] h2,
-[data-testid="stSidebar"] h3 {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.08em !important;
-    font-size: 1rem !important;  /* Card heading sm size */
-    margin-top: 0 !important;
-    margin-bottom: var(--space-sm) !important;
-    padding-top: 0 !important;
-}
+@st.cache_resource(ttl=3600)
+def leaderboard_player_stats(dataset_prefix):
+    """
+    Per-player daily leaderboard stats for the Rankings fallback table.
 
-/* Sidebar metadata text - Label scale */
-[data-testid="stSidebar"] p,
-[data-testid="stSidebar"] label,
-[data-testid="stSidebar"] .stMarkdown span {
-    font-family: var(--font-body) !important;
-    font-weight: 500 !important;
-    font-size: 0.8rem !important;  /* Label lg size */
-}
+    Returns:
+        DataFrame with player_name, wins, top_10s, avg_daily_rank, win_rate,
+        top_10s_rate and last_7, built once per dataset
+    """
+    df = load_leaderboard_data(dataset_prefix)
 
-/* Sidebar selectbox value - Body xs scale (fits on one line) */
-[data-testid="stSidebar"] .stSelectbox span {
-    font-family: var(--font-body) !important;
-    font-weight: 400 !important;
-    font-size: 0.9rem !important;  /* Body xs size */
-}
+    # Win/top-10 flags as columns so every aggregation is a built-in (no per-group lambdas)
+    player_stats = df.assign(
+        _is_win=df['rank'] == 1,
+        _is_top10=df['rank'] <= 10,
+    ).groupby('player_name', observed=True).agg(
+        wins=('_is_win', 'sum'),
+        top_10s=('_is_top10', 'sum'),
+        avg_daily_rank=('rank', 'mean'),
+        total_games=('rank', 'count')
+    ).reset_index()
+    player_stats['avg_daily_rank'] = player_stats['avg_daily_rank'].round(1)
+    player_stats['win_rate'] = (player_stats['wins'] / player_stats['total_games'] * 100).round(1)
+    player_stats['top_10s_rate'] = (player_stats['top_10s'] / player_stats['total_games'] * 100).round(1)
+    player_stats = player_stats.drop(columns=['total_games'])
+
+    # Calculate Last 7: average daily rank over each player's 7 most recent games
+    # (one sort + grouped head instead of a mask per player)
+    df_recent = df.sort_values('date', ascending=False, kind='mergesort')
+    df_last7 = (
+        df_recent.groupby('player_name', observed=True, sort=False).head(7)
+        .groupby('player_name', observed=True)['rank'].mean().round(1)
+        .rename('last_7').reset_index()
+    )
+    return player_stats.merge(df_last7, on='player_name', how='left')
 
-/* Sidebar captions - Label sm scale with WCAG-compliant contrast */
-[data-testid="stSidebar"] .stCaption,
-[data-testid="stSidebar"] [data-testid="stCaptionContainer"] {
-    font-family: var(--font-body) !important;
-    font-weight: 500 !important;
-    font-size: 0.75rem !important;  /* Label sm size */
-    opacity: 1 !important;  /* Full opacity for accessibility - overrides Streamlit's 0.6 */
-    margin-top: 0 !important;
-    margin-bottom: 0 !important;  /* No gap - let elements stack tightly */
-}
 
-/* Consecutive captions - even tighter */
-[data-testid="stSidebar"] .stCaption + .stCaption,
-[data-testid="stSidebar"] [data-testid="stCaptionContainer"] + [data-testid="stCaptionContainer"] {
-    margin-top: calc(-1 * var(--space-xs)) !important;
-}
+@st.cache_resource(ttl=3600)
+def dailies_view(dataset_prefix, day):
+    """
+    Top 30 of the leaderboard for `day`, joined with that day's Elo history.
 
-/* Sidebar dividers - accent gradient, container handles spacing */
-[data-testid="stSidebar"] hr {
-    margin: 0 !important;  /* Container provides balanced spacing */
-    border: none !important;
-    height: 1px !important;
-    background: linear-gradient(90deg, transparent 0%, rgba(255, 107, 107, 0.4) 50%, transparent 100%) !important;
-}
+    Returns:
+        DataFrame in daily rank order, or None if there is no data for `day`
+    """
+    df_day = rows_for_date(load_leaderboard_data(dataset_prefix), day)
+    if df_day.empty:
+        return None
+    df_day = df_day.nsmallest(30, 'rank')
 
-/* Sidebar selectbox - consistent spacing and no truncation */
-[data-testid="stSidebar"] [data-testid="stSelectbox"] {
-    margin-bottom: var(--space-sm) !important;
-}
+    # Merge with history data for rating, rating_change, and active_rank
+    df_history = load_history_data(dataset_prefix)
+    if df_history is not None:
+        # Get history for the selected date (active_rank is pre-computed if available)
+        history_cols = ['player_name', 'rating', 'rating_change']
+        if 'active_rank' in df_history.columns:
+            history_cols.append('active_rank')
+        # Project first, then left-join on the player index (hashed once)
+        df_day_history = rows_for_date(df_history, day)[history_cols].set_index('player_name')
+        df_day = df_day.join(df_day_history, on='player_name')
 
-/* Sidebar download button - Label scale with card styling */
-[data-testid="stSidebar"] .stDownloadButton button {
-    font-family: var(--font-body) !important;
-    font-weight: 600 !important;
-    font-size: 0.8rem !important;  /* Label lg size */
-    letter-spacing: 0.02em;
-    border-radius: 8px !important;
-    padding: var(--space-sm) var(--space-md) !important;
-    transition: all 0.2s ease !important;
-}
+    # Sort by daily rank (natural order for leaderboard)
+    return df_day.sort_values('rank', ascending=True, na_position='last')
 
-/* Responsive sidebar typography */
-@media (max-width: 400px) {
-    [data-testid="stSidebar"] h1,
-    [data-testid="stSidebar"] h2,
-    [data-testid="stSidebar"] h3 {
-        font-size: 0.95rem !important;  /* Card heading xs size */
-    }
-    [data-testid="stSidebar"] p,
-    [data-testid="stSidebar"] label,
-    [data-testid="stSidebar"] .stMarkdown span {
-        font-size: 0.75rem !important;  /* Label sm size */
-    }
-    [data-testid="stSidebar"] .stSelectbox span {
-        font-size: 0.9rem !important;  /* Body xs size */
-    }
-    [data-testid="stSidebar"] .stCaption {
-        font-size: 0.7rem !important;  /* Label xs size */
-    }
-    [data-testid="stSidebar"] .stDownloadButton button {
-        font-size: 0.75rem !important;  /* Label sm size */
-        padding: var(--space-xs) var(--space-sm) !important;
-    }
-}
 
-/* ===== Ranking Cards ===== */
-.ranking-cards {
-    display: block;
-    container-type: inline-size;
-    container-name: cards;
-}
+@st.cache_resource(ttl=3600)
+def rankings_view(dataset_prefix, day, show_unranked, sort_column, sort_ascending):
+    """
+    Rankings tab rows for `day`: display columns only, sorted for the cards.
 
-/* Dailies tab: constrained width for cleaner layout */
-.dailies-cards {
-    display: block;
-    container-type: inline-size;
-    container-name: cards;
-    max-width: 600px;
-    margin: 0 auto;
-}
-
-/* Daily row responsive adjustments for narrow viewports - two-row grid layout */
-@container cards (max-width: 400px) {
-    .daily-row {
-        display: grid !important;
-        grid-template-columns: auto 1fr auto !important;
-        grid-template-rows: auto auto !important;
-        gap: 0.125rem 0.5rem !important;
-        padding: 0.5rem 0.75rem !important;
-        align-items: center !important;
-    }
-    /* Row 1: Rank (col 1) */
-    .daily-row > span:nth-child(1) {
-        grid-row: 1 !important;
-        grid-column: 1 !important;
-        min-width: 1.75rem !important;
-        text-align: center !important;
-    }
-    /* Row 1: Score (col 2-3, spans to end) */
-    .daily-row > span:nth-child(2) {
-        grid-row: 1 !important;
-        grid-column: 2 / -1 !important;
-        text-align: left !important;
-        min-width: auto !important;
-    }
-    /* Row 2: Name (col 1-2) - smaller font */
-    .daily-row > span:nth-child(3) {
-        grid-row: 2 !important;
-        grid-column: 1 / 3 !important;
-        font-size: 0.85rem !important;
-        min-width: 0 !important;
-        padding-top: 0.25rem !important;
-        border-top: 1px solid rgba(128,128,128,0.2) !important;
-    }
-    /* Row 2: Rating (col 3) - smaller font */
-    .daily-row > span:nth-child(4) {
-        grid-row: 2 !important;
-        grid-column: 3 !important;
-        font-size: 0.85rem !important;
-        min-width: auto !important;
-        text-align: right !important;
-        padding-top: 0.25rem !important;
-        border-top: 1px solid rgba(128,128,128,0.2) !important;
-    }
-    /* Smaller rating change text */
-    .daily-row > span:nth-child(4) .change-positive,
-    .daily-row > span:nth-child(4) .change-negative {
-        font-size: 0.75rem !important;
-    }
-}
-
-/* Responsive stats grid: 8 columns on desktop, 4 on mobile */
-.stats-grid {
-    display: grid;
-    grid-template-columns: repeat(8, 1fr);
-    gap: 0.5rem;
-    margin-top: 0.5rem;
-}
-
-/* Align stat values to bottom when labels wrap */
-.stats-grid > div {
-    display: flex !important;
-    flex-direction: column !important;
-    justify-content: flex-start !important;
-    align-items: center !important;
-    min-height: 3.5rem;
-}
-.stats-grid > div span:last-child {
-    margin-top: auto;
-}
-
-/* Responsive card header: matches stats grid columns */
-.card-header {
-    display: grid;
-    grid-template-columns: repeat(8, 1fr);
-    align-items: center;
-    gap: 0.5rem;
-    margin-bottom: 0.625rem;
-    padding-bottom: 0.5rem;
-    border-bottom: 1px solid rgba(128,128,128,0.35);
-}
-.card-rank {
-    grid-column: 1;
-    font-weight: 700;
-    font-size: 1rem;
-    text-align: center;
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-}
-.card-rank .rank-label {
-    font-size: 0.75rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-    color: #FF6B6B;
-}
-.card-name {
-    grid-column: 2 / 8;
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    justify-content: center;
-    text-align: center;
-    overflow: hidden;
-}
-.card-name-text {
-    font-weight: 600;
-    font-size: 1rem;
-    color: var(--text-color);
-    word-break: break-word;
-    overflow-wrap: break-word;
-    line-height: 1.2;
-}
-.card-name .rank-label {
-    font-size: 0.75rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-    color: #FF6B6B;
-}
-.card-rating {
-    grid-column: 8;
-    font-weight: 700;
-    font-size: 1.1rem;
-    text-align: center;
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-}
-.card-rating .rating-label,
-.card-rating .rank-label {
-    font-size: 0.75rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-    color: #FF6B6B;
-}
-.card-rating.active {
-    color: #FF6B6B;
-}
-.card-rating.inactive {
-    color: #6B9AFF;
-}
-.card-rating.inactive .rating-label {
-    color: #6B9AFF;
-}
-
-/* Tab 1 controls compression - related controls use --space-sm */
-[data-testid="stDateInput"] {
-    margin-bottom: 0.5rem !important;
-}
-[data-testid="stDateInput"] + div [data-testid="stHorizontalBlock"] {
-    margin-top: 0 !important;
-}
-
-/* Back to top anchor - invisible target at page top */
-#top {
-    display: block;
-    height: 0;
-    margin: 0;
-    padding: 0;
-    scroll-margin-top: 2000px;  /* Large fixed value (Safari Mobile handles px better than vh) */
-}
-
-/* Sticky tab bar - sticks below Streamlit's header (60px tall) */
-[data-testid="stElementContainer"]:has(.tab-nav) {
-    position: sticky !important;
-    top: 60px !important;  /* Below Streamlit's header */
-    z-index: 999 !important;
-    padding: 0.5rem 0 !important;
-    background: #0E1117 !important;
-    /* Use box-shadow to extend background full-width (not clipped by overflow:hidden) */
-    box-shadow: -9999px 0 0 0 #0E1117, 9999px 0 0 0 #0E1117, 0 1px 0 0 rgba(128, 128, 128, 0.2) !important;
-}
-
-/* Floating share button - position the popover container */
-/* bottom: 3rem to avoid overlap with Streamlit's "Manage app" button */
-[data-testid="stMain"] [data-testid="stPopover"] {
-    position: fixed !important;
-    bottom: 3rem !important;
-    left: 2rem !important;
-    width: 48px !important;
-    height: 48px !important;
-    z-index: 1000 !important;
-}
-/* Style the button as a circle */
-[data-testid="stMain"] [data-testid="stPopover"] button {
-    width: 48px !important;
-    height: 48px !important;
-    min-width: 48px !important;
-    min-height: 48px !important;
-    max-width: 48px !important;
-    max-height: 48px !important;
-    border-radius: 50% !important;
-    background: #3B82F6 !important;
-    color: white !important;
-    padding: 0 !important;
-    border: none !important;
-    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4) !important;
-    transition: transform 0.2s, box-shadow 0.2s !important;
-    overflow: hidden !important;
-}
-[data-testid="stMain"] [data-testid="stPopover"] button:hover {
-    transform: scale(1.1) !important;
-    box-shadow: 0 6px 16px rgba(59, 130, 246, 0.5) !important;
-    background: #2563EB !important;
-}
-[data-testid="stMain"] [data-testid="stPopover"] button:active {
-    transform: scale(0.95) !important;
-}
-/* Hide the dropdown arrow - target by material icon testid */
-[data-testid="stMain"] [data-testid="stPopover"] [data-testid="stIconMaterial"] {
-    display: none !important;
-    visibility: hidden !important;
-    width: 0 !important;
-    height: 0 !important;
-}
-/* Also hide the parent container of the arrow */
-[data-testid="stMain"] [data-testid="stPopover"] button > div > div:last-child {
-    display: none !important;
-}
-/* Center the emoji and make it bright */
-[data-testid="stMain"] [data-testid="stPopover"] button > div {
-    display: flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-    width: 100% !important;
-    height: 100% !important;
-    text-align: center !important;
-    margin: 0 !important;  /* Remove -5px right margin Streamlit adds for arrow */
-}
-[data-testid="stMain"] [data-testid="stPopover"] button > div > div:first-child {
-    display: flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-    width: 100% !important;
-    height: 100% !important;
-}
-[data-testid="stMain"] [data-testid="stPopover"] [data-testid="stMarkdownContainer"] {
-    display: flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-    width: 100% !important;
-    height: 100% !important;
-}
-[data-testid="stMain"] [data-testid="stPopover"] [data-testid="stMarkdownContainer"] p {
-    margin: 0 !important;
-    padding: 0 !important;
-    font-size: 1.2rem !important;
-    line-height: 1 !important;
-    text-align: center !important;
-    filter: brightness(1.3) saturate(1.2) !important;
-    text-shadow: 0 0 2px rgba(255,255,255,0.5) !important;
-}
-/* Hide the element container for the floating button */
-[data-testid="stVerticalBlock"] > [data-testid="stElementContainer"]:has([data-testid="stPopover"]) {
-    margin: 0 !important;
-    padding: 0 !important;
-    height: 0 !important;
-    overflow: visible !important;
-    width: 0 !important;
-}
-/* Share popover content - mobile responsive */
-[data-testid="stPopoverBody"] {
-    max-width: calc(100vw - 4rem) !important;
-    width: auto !important;
-    min-width: 200px !important;
-}
-[data-testid="stPopoverBody"] [data-testid="stCode"] {
-    max-width: 100% !important;
-}
-[data-testid="stPopoverBody"] [data-testid="stCode"] code {
-    white-space: pre-wrap !important;
-    word-break: break-all !important;
-    font-size: 0.8rem !important;
-}
-/* Make copy button always visible (parent has opacity:0 by default) */
-[data-testid="stPopoverBody"] div:has(> [data-testid="stCodeCopyButton"]) {
-    opacity: 1 !important;
-}
-[data-testid="stPopoverBody"] [data-testid="stCaptionContainer"] {
-    font-size: 0.85rem !important;
-}
-
-/* ===== Duel Card Layout (all sizes) ===== */
-/* 2-column layout: Player 1 | Player 2 */
-.duel-stats {
-    grid-template-columns: 1fr 1fr !important;
-    gap: 0.5rem !important;
-}
-.duel-vs {
-    display: none !important;
-}
-/* Vertical divider between player columns */
-.duel-stats > div:first-child {
-    border-right: 1px solid rgba(128,128,128,0.3) !important;
-    padding-right: 0.75rem !important;
-}
-/* Header: date/winner only, duel wins in footer */
-.duel-header {
-    grid-template-columns: 1fr !important;
-    justify-items: center !important;
-}
-.duel-header-wins {
-    display: none !important;
-}
-.duel-footer-wins {
-    display: flex !important;
-}
-/* Stack player name and Elo vertically */
-.duel-player-name {
-    display: flex !important;
-    flex-direction: column !important;
-    align-items: center !important;
-    gap: 0.125rem !important;
-    margin-bottom: 0.5rem !important;
-    padding-bottom: 0.5rem !important;
-    border-bottom: 1px solid rgba(128,128,128,0.2) !important;
-}
-.duel-name-text {
-    display: block !important;
-}
-.duel-elo {
-    display: block !important;
-}
-/* Hide separate stats, show combined "#rank · score" */
-.duel-player-stats {
-    display: none !important;
-}
-.duel-stat-combined {
-    display: flex !important;
-    margin-bottom: 0.25rem !important;
-}
-
-/* ===== History Card Layout (Tab 3) ===== */
-/* 4-column stats grid for desktop (8 items = 2 symmetric rows) */
-.history-stats {
-    display: grid !important;
-    grid-template-columns: repeat(4, 1fr) !important;
-    gap: 0.5rem !important;
-}
-/* Responsive: 2 columns on narrow (8 items = 4 symmetric rows) */
-@media (max-width: 500px) {
-    .history-stats {
-        grid-template-columns: repeat(2, 1fr) !important;
-    }
-    .history-header {
-        flex-direction: column !important;
-        align-items: center !important;
-        gap: 0.25rem !important;
-    }
-}
-
-/* ===== Rivals Grid (Tab 3) ===== */
-/* Responsive: 2 columns when viewport is narrow */
-@media (max-width: 900px) {
-    .rivals-grid {
-        grid-template-columns: repeat(2, 1fr) !important;
-    }
-}
-/* Single column on very narrow screens */
-@media (max-width: 500px) {
-    .rivals-grid {
-        grid-template-columns: 1fr !important;
-    }
-}
-
-/* Container-responsive: 4-column grid when container ≤816px (prevents label wrapping) */
-@container cards (max-width: 816px) {
-    /* Tab 1 ranking cards */
-    .stats-grid {
-        grid-template-columns: repeat(4, 1fr) !important;
-        gap: 0.375rem !important;
-    }
-    .card-header {
-        grid-template-columns: repeat(4, 1fr) !important;
-    }
-    .card-rank {
-        grid-column: 1 !important;
-        justify-self: center !important;
-        text-align: center !important;
-    }
-    .card-name {
-        grid-column: 2 / 4 !important;
-        justify-self: center !important;
-        text-align: center !important;
-    }
-    .card-name-text {
-        font-size: 0.95rem !important;
-    }
-    .card-rating {
-        grid-column: 4 !important;
-        justify-self: center !important;
-        text-align: center !important;
-        font-size: 1rem !important;
-    }
-    /* Design system: sm breakpoint typography */
-    .stats-grid > div span:first-child {
-        font-size: 0.75rem !important;
-    }
-    .stats-grid > div span:last-child {
-        font-size: 1.2rem !important;
-    }
-    /* Design system: sm breakpoint padding (0.75rem) */
-    .ranking-cards > div {
-        padding: 0.75rem !important;
-    }
-    /* Tab 2 duel cards - sm breakpoint (font sizes only) */
-    .duel-player-name {
-        font-size: 0.95rem !important;
-    }
-    .duel-stat-label {
-        font-size: 0.75rem !important;
-    }
-    .duel-stat-value {
-        font-size: 1.2rem !important;
-    }
-    .duel-win-count {
-        font-size: 1.2rem !important;
-    }
-    .duel-win-label {
-        font-size: 0.75rem !important;
-    }
-    .duel-date {
-        font-size: 0.9rem !important;
-    }
-    .duel-elo {
-        font-size: 0.9rem !important;
-    }
-}
-
-/* Container-responsive: extra compact when container ≤400px */
-@container cards (max-width: 400px) {
-    /* Tab 1 ranking cards */
-    .card-name-text {
-        font-size: 0.9rem !important;
-    }
-    .card-rating {
-        font-size: 0.95rem !important;
-    }
-    /* Design system: xs breakpoint typography */
-    .stats-grid > div span:first-child {
-        font-size: 0.7rem !important;
-    }
-    .stats-grid > div span:last-child {
-        font-size: 1.1rem !important;
-    }
-    /* Design system: xs breakpoint padding (0.5rem) */
-    .ranking-cards > div {
-        padding: 0.5rem !important;
-    }
-    .stats-grid {
-        gap: 0.25rem !important;
-    }
-    /* Tab 2 duel cards - xs breakpoint (font sizes only, layout is base) */
-    .duel-player-name {
-        font-size: 0.9rem !important;
-    }
-    .duel-stat-label {
-        font-size: 0.7rem !important;
-    }
-    .duel-stat-value {
-        font-size: 1.1rem !important;
-    }
-    .duel-win-count {
-        font-size: 1.1rem !important;
-    }
-    .duel-win-label {
-        font-size: 0.75rem !important;
-    }
-    .duel-date {
-        font-size: 0.85rem !important;
-    }
-    .duel-winner {
-        font-size: 0.9rem !important;
-    }
-    .duel-elo {
-        font-size: 0.85rem !important;
-    }
-    /* Tighter gaps at xs */
-    .duel-stats {
-        gap: 0.25rem 0.5rem !important;
-    }
-    .duel-stats > div:first-child {
-        padding-right: 0.5rem !important;
-    }
-}
-
-/* Large viewport (lg breakpoint >900px) */
-@media (min-width: 900px) {
-    /* Tab 1 ranking cards */
-    .card-name-text {
-        font-size: 1.1rem !important;
-    }
-    .card-rating {
-        font-size: 1.25rem !important;
-    }
-    .card-rank {
-        font-size: 1.1rem !important;
-    }
-    /* Data values already 1.4rem via inline styles - no override needed */
-    /* Tab 2 duel cards - lg breakpoint */
-    .duel-player-name {
-        font-size: 1.1rem !important;
-    }
-    .duel-stat-value {
-        font-size: 1.4rem !important;
-    }
-    .duel-win-count {
-        font-size: 1.4rem !important;
-    }
-}
-
-/* Hall of Fame cards grid */
-.hof-cards-grid {
-    display: grid;
-    grid-template-columns: repeat(2, 1fr);
-    gap: 1rem;
-    margin-bottom: 1.5rem;
-}
-
-@media (max-width: 700px) {
-    .hof-cards-grid {
-        grid-template-columns: 1fr;
-    }
-}
-
-.hof-cards-grid a.player-link:hover {
-    color: #FF6B6B !important;
-    text-decoration: underline !important;
-}
-
-/* Rival cards in Tracker tab */
-a.rival-card:hover {
-    background: rgba(128, 128, 128, 0.2) !important;
-}
-
-/* Hall of Fame chart card */
-.hof-chart-card {
-    color-scheme: inherit;
-    background: var(--secondary-background-color);
-    border: 1px solid var(--glass-border-subtle);
-    border-radius: 12px 12px 0 0;
-    padding: 1rem 1rem 0 1rem;
-    box-shadow: 0 4px 20px var(--glass-drop);
-    margin-top: 0.5rem;
-}
-
-.hof-chart-header {
-    font-size: 1rem;
-    font-weight: 700;
-    margin: 0;
-    padding-bottom: 0.75rem;
-    border-bottom: 1px solid rgba(128,128,128,0.35);
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-}
-
-/* Style the Plotly chart container that follows the card header */
-[data-testid="stElementContainer"]:has(.hof-chart-card) + [data-testid="stElementContainer"] {
-    color-scheme: inherit;
-    background: var(--secondary-background-color);
-    border: 1px solid var(--glass-border-subtle);
-    border-top: none;
-    border-radius: 0 0 12px 12px;
-    padding: 0.75rem 1rem 1rem 1rem;
-    box-shadow: 0 4px 20px var(--glass-drop);
-    margin-top: -1rem !important;
-}
-
-/* Pagination nav row - constrain width and center, prevent wrapping */
-[data-testid="stHorizontalBlock"]:has(button[data-testid="stBaseButton-secondary"]) {
-    max-width: 420px !important;
-    margin: 0 auto !important;
-    justify-content: center !important;
-    align-items: center !important;
-    gap: 0.25rem !important;
-    flex-wrap: nowrap !important;
-}
-[data-testid="stHorizontalBlock"]:has(button[data-testid="stBaseButton-secondary"]) [data-testid="stColumn"] {
-    width: auto !important;
-    min-width: auto !important;
-    flex: 0 0 auto !important;
-    display: flex !important;
-    align-items: center !important;
-}
-/* Pagination label styling - WCAG compliant colors, no opacity */
-.pagination-label {
-    margin: 0 !important;
-    padding: 0 !important;
-    font-size: 0.85rem !important;
-    white-space: nowrap !important;
-    color-scheme: inherit;
-    color: #999999 !important;
-    line-height: 1.75rem !important;
-}
-/* Fix: Streamlit's stMarkdownContainer has -16px margin that collapses layout height */
-[data-testid="stMarkdownContainer"]:has(.pagination-label) {
-    margin-bottom: 0 !important;
-}
-
-/* Page size selectbox in pagination row - scale down to match label */
-[data-testid="stHorizontalBlock"]:has(button[data-testid="stBaseButton-secondary"]) [data-testid="stSelectbox"] {
-    transform: scale(0.75) !important;
-    transform-origin: left center !important;
-    margin-right: -15px !important;
-}
-
-/* Pagination buttons - no button chrome, WCAG compliant colors */
-button[data-testid="stBaseButton-secondary"] {
-    background: transparent !important;
-    border: none !important;
-    box-shadow: none !important;
-    padding: 0.15rem 0.35rem !important;
-    min-height: 1.75rem !important;
-    min-width: auto !important;
-    font-size: 0.95rem !important;
-    color-scheme: inherit;
-    color: #999999 !important;
-    transition: color 0.15s ease !important;
-    line-height: 1 !important;
-}
-button[data-testid="stBaseButton-secondary"]:hover:not(:disabled) {
-    background: transparent !important;
-    color: #FFFFFF !important;
-    border: none !important;
-    box-shadow: none !important;
-}
-/* Disabled nav arrows - muted but still visible (decorative, not essential) */
-button[data-testid="stBaseButton-secondary"]:disabled {
-    background: transparent !important;
-    color: #555555 !important;
-    cursor: default !important;
-    border: none !important;
-}
-/* Range indicator (col 4) - essential text, needs full WCAG contrast */
-[data-testid="stHorizontalBlock"]:has(button[data-testid="stBaseButton-secondary"]) [data-testid="stColumn"]:nth-child(4) button[data-testid="stBaseButton-secondary"]:disabled {
-    color: #999999 !important;
-    font-size: 0.9rem !important;
-    white-space: nowrap !important;
-}
-button[data-testid="stBaseButton-secondary"]:focus {
-    outline: none !important;
-    box-shadow: none !important;
-    border: none !important;
-}
-
-/* Player card scroll positioning - center on screen when navigated via anchor link */
-.player-card {
-    scroll-margin-top: 35vh;
-}
-
-/* Player card target highlighting - when navigating via anchor link */
-.player-card:target {
-    animation: highlight-pulse 2s ease-out;
-    outline: 2px solid #FF6B6B;
-    outline-offset: 2px;
-}
-@keyframes highlight-pulse {
-    0% { outline-color: #FF6B6B; box-shadow: 0 0 20px rgba(255, 107, 107, 0.6); }
-    50% { outline-color: #FF6B6B; box-shadow: 0 0 10px rgba(255, 107, 107, 0.3); }
-    100% { outline-color: transparent; box-shadow: none; }
-}
-</style>
-"""
-
-
-# --- Chart Styling ---
-# Plotly figure styling for consistent theme-aware charts
-
-def apply_plotly_style(fig, add_gradient_fill=False):
-    """Apply consistent styling to Plotly figures following the design system.
-
-    Typography (from CLAUDE.md design system):
-    - Font: System font stack (matches "System" in design system)
-    - Label: 0.8rem (~13px), weight 500
-    - Data value: 1.4rem (~22px), weight 700
+    Args:
+        dataset_prefix: Dataset identifier
+        day: Date to show
+        show_unranked: Keep players without an active_rank
+        sort_column: Column to sort by
+        sort_ascending: Sort direction
 
-    Text colors are NOT explicitly set, allowing Streamlit to inject theme-aware
-    colors automatically. Only structural elements (grids, backgrounds) use
-    explicit neutral colors.
+    Returns:
+        Sorted DataFrame (may be empty)
     """
-    # System font stack (design system "System" font)
-    system_font = '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif'
-
-    # Structural colors that work on both light and dark backgrounds
-    grid_color = "rgba(128, 128, 128, 0.4)"  # Neutral gray grid
-    line_color = "rgba(128, 128, 128, 0.3)"  # Neutral gray lines
-    hover_bg = "rgba(50, 50, 50, 0.9)"  # Dark hover for readability
-    hover_text = "#FFFFFF"  # White text on dark hover background
+    df_date_history = rows_for_date(load_history_data(dataset_prefix), day)
 
-    # Design system font weights
-    label_weight = 500   # Label style
-    heading_weight = 600  # Card heading style
+    # Columns to display (defined once, reused)
+    display_cols = ['active_rank', 'player_name', 'rating', 'games_played', 'wins', 'win_rate', 'top_10s', 'top_10s_rate', 'avg_daily_rank', 'last_7', 'consistency']
+    if 'days_inactive' in df_date_history.columns:
+        display_cols.append('days_inactive')
 
-    # Design system font sizes (converted from rem, assuming 16px base)
-    label_size = 13      # 0.8rem ≈ 13px
-    body_size = 16       # 1rem = 16px
-
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(family=system_font, size=body_size, weight=label_weight),
-        xaxis=dict(
-            gridcolor=grid_color,
-            linecolor=line_color,
-            tickfont=dict(family=system_font, size=label_size, weight=label_weight),
-            title_font=dict(family=system_font, size=label_size, weight=heading_weight),
-            showgrid=True,
-            zeroline=False,
-        ),
-        yaxis=dict(
-            gridcolor=grid_color,
-            linecolor=line_color,
-            tickfont=dict(family=system_font, size=label_size, weight=label_weight),
-            title_font=dict(family=system_font, size=label_size, weight=heading_weight),
-            showgrid=True,
-            zeroline=False,
-        ),
-        legend=dict(
-            title_text="",  # Remove "Player" title
-            font=dict(family=system_font, size=label_size, weight=heading_weight),
-            bgcolor="rgba(0,0,0,0)",  # Transparent background
-            borderwidth=0,  # No border
-        ),
-        hoverlabel=dict(
-            bgcolor=hover_bg,
-            bordercolor="rgba(0,0,0,0)",  # No border
-            font=dict(color=hover_text, family=system_font, size=14, weight=heading_weight),
-        ),
-        dragmode=False,  # Disable pan/zoom to prevent scroll hijacking on mobile
-    )
-
-    # Add gradient fill under line charts if requested
-    if add_gradient_fill:
-        fig.update_traces(
-            fill='tozeroy',
-            fillcolor='rgba(255, 107, 107, 0.15)',
-            line=dict(width=3),
-        )
-
-    return fig
-
-
-# --- Constants ---
-OUTPUT_FOLDER = Path(__file__).parent / "data" / "processed"
-DATASET_OPTIONS = {
-    "Steam Demo+Early Access": "full",
-    "Early Access Only": "early_access"
-}
-
-
-# --- Data Loading Functions ---
-# Using cache_resource instead of cache_data for faster cache hits (no serialization overhead)
-@st.cache_resource(ttl=3600)
-def load_leaderboard_data(dataset_prefix):
-    """Load the most recent leaderboard CSV for the given dataset."""
-    pattern = f"{dataset_prefix}_leaderboard_*.csv"
-    files = sorted(OUTPUT_FOLDER.glob(pattern))
-    if not files:
-        return None
-    df = pd.read_csv(files[-1], parse_dates=['date'])
-    return df
+    # Filter data based on unranked toggle (mask + projection in one step;
+    # no copy needed since sort_values below returns a new frame)
+    if show_unranked:
+        df_filtered = df_date_history[display_cols]
+    else:
+        df_filtered = df_date_history.loc[df_date_history['active_rank'].notna(), display_cols]
 
+    return df_filtered.sort_values(sort_column, ascending=sort_ascending, na_position='last')
 
-@st.cache_resource(ttl=3600)
-def load_ratings_data(dataset_prefix):
-    """Load the most recent Elo ratings CSV for the given dataset (active players only)."""
-    pattern = f"{dataset_prefix}_elo_ratings_*.csv"
-    # Exclude _all_ files
-    files = sorted([f for f in OUTPUT_FOLDER.glob(pattern) if '_all_' not in f.name])
-    if not files:
-        return None
-    df = pd.read_csv(files[-1], parse_dates=['last_seen'])
-    return df
 
-
-@st.cache_resource(ttl=3600)
-def load_all_ratings_data(dataset_prefix):
-    """Load the most recent Elo ratings CSV including inactive players."""
-    pattern = f"{dataset_prefix}_elo_ratings_all_*.csv"
-    files = sorted(OUTPUT_FOLDER.glob(pattern))
-    if not files:
-        return None
-    df = pd.read_csv(files[-1], parse_dates=['last_seen'])
-    return df
+@st.cache_data(ttl=3600)
+def hall_of_fame_stats(dataset_prefix):
+    """Hall of Fame statistics for the dataset, computed once per data refresh."""
+    return compute_hall_of_fame_stats(load_history_data(dataset_prefix))
 
 
 @st.cache_resource(ttl=3600)
-def load_history_data(dataset_prefix):
-    """Load the most recent Elo history CSV for the given dataset."""
-    pattern = f"{dataset_prefix}_elo_history_*.csv"
-    files = sorted(OUTPUT_FOLDER.glob(pattern))
-    if not files:
-        return None
-    df = pd.read_csv(files[-1], parse_dates=['date'])
-    return df
-
+def elo1_timeline(dataset_prefix):
+    """
+    Date-ordered (date, player_name) rows of the Elo #1 player for each day.
 
-@st.cache_resource(ttl=3600)
-def load_rivalries_data(dataset_prefix):
-    """Load the most recent rivalries CSV for the given dataset."""
-    pattern = f"{dataset_prefix}_rivalries_*.csv"
-    files = sorted(OUTPUT_FOLDER.glob(pattern))
-    if not files:
+    Returns None if the dataset has no history or no active_rank column.
+    """
+    df_history = load_history_data(dataset_prefix)
+    if df_history is None or 'active_rank' not in df_history.columns:
         return None
-    df = pd.read_csv(files[-1])
-    return df
+    # One predicate (== 1 already excludes NaN ranks); history is date-sorted at load
+    return df_history.loc[df_history['active_rank'] == 1, ['date', 'player_name']]
 
 
 def get_available_datasets():
-    """Check which datasets are available."""
-    available = {}
-    for label, prefix in DATASET_OPTIONS.items():
-        if list(OUTPUT_FOLDER.glob(f"{prefix}_leaderboard_*.csv")):
-            available[label] = prefix
-    return available
+    """Check which datasets are available (a leaderboard file is in the cached listing)."""
+    names = output_file_names()
+    return {
+        label: prefix for label, prefix in DATASET_OPTIONS.items()
+        if any(fnmatchcase(name, f"{prefix}_leaderboard_*.csv") for name in names)
+    }
 
 
 # --- Export Preparation (Cached with base64) ---
-@st.cache_data(ttl=3600)
+# cache_resource: the payloads are immutable str (up to a few MB for history),
+# so sessions can share one object instead of unpickling a copy per hit
+@st.cache_resource(ttl=3600)
 def prepare_elo_rankings_export(dataset_prefix):
     """Prepare base64-encoded Elo Rankings CSV for export."""
     df = load_all_ratings_data(dataset_prefix)
     if df is None:
         return None
     export_cols = ['active_rank', 'player_name', 'rating', 'games_played', 'last_seen', 'is_active']
-    df_export = df[export_cols].copy()
+    df_export = df[export_cols]
     df_export = df_export.rename(columns={
         'active_rank': 'Rank',
         'player_name': 'Player',
@@ -2705,14 +1737,14 @@ def prepare_elo_rankings_export(dataset_prefix):
     return base64.b64encode(csv_str.encode()).decode()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def prepare_elo_history_export(dataset_prefix):
     """Prepare base64-encoded Elo History CSV for export."""
     df = load_history_data(dataset_prefix)
     if df is None:
         return None
     history_cols = ['date', 'player_name', 'rating', 'rating_change', 'rank', 'score']
-    df_export = df[history_cols].copy()
+    df_export = df[history_cols]
     df_export = df_export.rename(columns={
         'date': 'Date',
         'player_name': 'Player',
@@ -2725,7 +1757,7 @@ def prepare_elo_history_export(dataset_prefix):
     return base64.b64encode(csv_str.encode()).decode()
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600)
 def prepare_daily_results_export(dataset_prefix):
     """Prepare base64-encoded Daily Results CSV for export."""
     df = load_leaderboard_data(dataset_prefix)
@@ -2735,16 +1767,1139 @@ def prepare_daily_results_export(dataset_prefix):
     return base64.b64encode(csv_str.encode()).decode()
 
 
+@st.fragment
+def render_export_section(dataset_prefix):
+    """
+    Sidebar Export Data expander (true lazy loading - only prepares on button click).
+
+    Runs as a fragment: clicking a Generate button reruns just this section,
+    not the whole page with the active tab's tables and charts.
+    """
+    with st.expander("📥 Export Data", expanded=False):
+        colors = get_theme_colors()
+        is_dark = colors["bg_primary"] == "#0E1117"
+
+        # Elo Rankings export (lazy)
+        export_key_elo = f"export_elo_{dataset_prefix}"
+        if st.button("📊 Generate Elo Rankings", key=f"btn_elo_{dataset_prefix}", use_container_width=True):
+            st.session_state[export_key_elo] = prepare_elo_rankings_export(dataset_prefix)
+        if export_key_elo in st.session_state and st.session_state[export_key_elo]:
+            download_html = create_download_link_b64(
+                b64_data=st.session_state[export_key_elo],
+                filename="dftl_elo_rankings.csv",
+                label="⬇️ Download Elo Rankings",
+                is_dark=is_dark
+            )
+            st.markdown(download_html, unsafe_allow_html=True)
+
+        # Elo History export (lazy)
+        export_key_hist = f"export_history_{dataset_prefix}"
+        if st.button("📈 Generate Elo History", key=f"btn_hist_{dataset_prefix}", use_container_width=True):
+            st.session_state[export_key_hist] = prepare_elo_history_export(dataset_prefix)
+        if export_key_hist in st.session_state and st.session_state[export_key_hist]:
+            download_html = create_download_link_b64(
+                b64_data=st.session_state[export_key_hist],
+                filename="dftl_elo_history.csv",
+                label="⬇️ Download Elo History",
+                is_dark=is_dark
+            )
+            st.markdown(download_html, unsafe_allow_html=True)
+
+        # Daily Results export (lazy)
+        export_key_daily = f"export_daily_{dataset_prefix}"
+        if st.button("📅 Generate Daily Results", key=f"btn_daily_{dataset_prefix}", use_container_width=True):
+            st.session_state[export_key_daily] = prepare_daily_results_export(dataset_prefix)
+        if export_key_daily in st.session_state and st.session_state[export_key_daily]:
+            download_html = create_download_link_b64(
+                b64_data=st.session_state[export_key_daily],
+                filename="dftl_daily_results.csv",
+                label="⬇️ Download Daily Results",
+                is_dark=is_dark
+            )
+            st.markdown(download_html, unsafe_allow_html=True)
+
+
+# --- Chart Builders (Cached) ---
+# Figures depend only on the dataset (and player), so they are built once per
+# data refresh; st.plotly_chart serializes without mutating the shared figure.
+
+@st.cache_resource(ttl=3600)
+def tracker_figures(dataset_prefix, player_name):
+    """
+    Build the Tracker charts for one player.
+
+    Returns (fig_rating, fig_rank): Elo trajectory with baseline and peak marker,
+    and the daily rank bar chart.
+    """
+    df_player_history = load_player_history(dataset_prefix, player_name)
+    df_chart = df_player_history.dropna(subset=['score'])
+
+    # --- Rating Trajectory Chart ---
+    fig_rating = px.line(
+        df_chart,
+        x='date',
+        y='rating',
+        markers=True,
+        labels={'date': 'Date', 'rating': 'Elo Rating'},
+        color_discrete_sequence=[ACCENT_COLORS["primary"]],
+        render_mode='webgl',  # Long histories: draw on canvas instead of one SVG node per point
+    )
+    apply_plotly_style(fig_rating)
+    fig_rating.update_traces(
+        marker=dict(size=8, line=dict(width=2, color='rgba(255,255,255,0.3)')),
+        line=dict(width=3),
+        fill='tozeroy',
+        fillcolor='rgba(255, 107, 107, 0.15)',
+    )
+    # Set Y-axis range to fit data with padding (don't show 0)
+    rating_min = df_chart['rating'].min()
+    rating_max = df_chart['rating'].max()
+    rating_padding = (rating_max - rating_min) * 0.1
+    y_min = max(rating_min - rating_padding, 1000)  # Don't go below 1000
+    y_max = rating_max + rating_padding
+    fig_rating.update_layout(
+        height=280,
+        margin=dict(l=20, r=20, t=30, b=20),
+        showlegend=False,
+        yaxis=dict(range=[y_min, y_max])
+    )
+    fig_rating.add_hline(
+        y=1500,
+        line_dash="dash",
+        line_color="rgba(255, 107, 107, 0.4)",
+        annotation_text="Baseline (1500)",
+        annotation_font=dict(color="rgba(255, 107, 107, 0.7)", weight=600)
+    )
+    # Add peak rating marker (positional argmax: no row Series is built)
+    peak_pos = df_chart['rating'].to_numpy().argmax()
+    peak_date = df_chart['date'].iloc[peak_pos]
+    peak_rating = df_chart['rating'].iloc[peak_pos]
+    fig_rating.add_scatter(
+        x=[peak_date],
+        y=[peak_rating],
+        mode='markers',
+        marker=dict(
+            size=16,
+            color=ACCENT_COLORS["warning"],
+            symbol='star',
+            line=dict(width=2, color='#FFD700')
+        ),
+        name='Peak',
+        hovertemplate=f"<b>Peak Rating</b><br>{peak_rating:.0f}<extra></extra>"
+    )
+
+    # --- Daily Rank History Chart (Bar Chart) ---
+    # Bars grow from bottom (rank 31) UPWARD toward rank 1
+    # Better ranks (closer to 1) = taller bars
+    base_rank = 31  # Base of all bars (bottom of chart)
+    fig_rank = go.Figure()
+
+    # Calculate bar heights: negative values so bars grow upward on reversed y-axis
+    # height = rank - base_rank (e.g., rank 1 -> height -30, rank 30 -> height -1)
+    ranks = df_chart['rank'].tolist()
+    bar_heights = [r - base_rank for r in ranks]  # All negative
+
+    # Determine colors: green for best rank (rank 1), blue for others
+    best_rank = df_chart['rank'].min()
+    bar_colors = [ACCENT_COLORS["success"] if r == best_rank else ACCENT_COLORS["info"] for r in ranks]
+
+    fig_rank.add_trace(go.Bar(
+        x=df_chart['date'],
+        y=bar_heights,  # Negative heights = bars grow upward
+        base=[base_rank] * len(df_chart),  # All bars start from rank 31
+        marker=dict(
+            color=bar_colors,
+            line=dict(width=1, color='rgba(255,255,255,0.3)')
+        ),
+        customdata=ranks,  # Store actual ranks for hover
+        hovertemplate='%{x|%b %d, %Y}<br>Rank #%{customdata}<extra></extra>',
+    ))
+
+    apply_plotly_style(fig_rank)
+    fig_rank.update_layout(
+        height=280,
+        margin=dict(l=20, r=70, t=30, b=20),  # Extra right margin for annotation
+        showlegend=False,
+        yaxis=dict(
+            autorange="reversed",  # Rank 1 at top, rank 31 at bottom
+            range=[1, base_rank],  # With reversed: 1 at top, 31 at bottom
+            title="Daily Rank",
+            tickmode='array',
+            tickvals=[1, 5, 10, 15, 20, 25, 30],
+        ),
+        xaxis=dict(title="Date"),
+        bargap=0.15,
+    )
+    # Add average rank line with annotation at right edge
+    avg_rank_val = df_chart['rank'].astype('float64').mean()  # rank is float32 at load
+    fig_rank.add_hline(
+        y=avg_rank_val,
+        line_dash="dash",
+        line_color="rgba(59, 130, 246, 0.8)",
+        annotation_text=f"Avg: {avg_rank_val:.1f}",
+        annotation_position="right",
+        annotation_font=dict(color="rgba(59, 130, 246, 1)", weight=600),
+        annotation_xshift=5,  # Small shift to ensure text is in margin area
+    )
+    return fig_rating, fig_rank
+
+
+@st.cache_resource(ttl=3600)
+def elo1_timeline_figure(dataset_prefix):
+    """Build the Hall of Fame Elo #1 step chart, or None if no player has held #1."""
+    df_rank1 = elo1_timeline(dataset_prefix)
+    if df_rank1 is None or df_rank1.empty:
+        return None
+
+    # Get all unique players who held #1
+    all_rank1_players = df_rank1['player_name'].unique().tolist()
+
+    fig_rank1 = px.line(
+        df_rank1,
+        x='date',
+        y='player_name',
+        markers=True,
+        labels={'date': 'Date', 'player_name': 'Elo #1'},
+        category_orders={'player_name': all_rank1_players},
+        color_discrete_sequence=[ACCENT_COLORS["primary"]]
+    )
+    fig_rank1.update_traces(
+        line=dict(shape='hv', color=ACCENT_COLORS["primary"]),  # Step line
+        marker=dict(size=8, color=ACCENT_COLORS["primary"]),
+        hovertemplate='%{y}<br>%{x|%Y-%m-%d}<extra></extra>'
+    )
+    apply_plotly_style(fig_rank1)
+    # Enhanced marker styling with glow effect
+    fig_rank1.update_traces(
+        marker=dict(
+            size=10,
+            line=dict(width=2, color='rgba(255, 255, 255, 0.4)'),
+            symbol='diamond',
+        ),
+    )
+    fig_rank1.update_layout(
+        height=max(200, len(all_rank1_players) * 25),  # Dynamic height based on player count
+        margin=dict(l=20, r=20, t=20, b=20),
+        showlegend=False,
+        yaxis_title=None,
+        xaxis_title=None,
+        yaxis=dict(
+            tickmode='array',
+            tickvals=all_rank1_players,
+            ticktext=all_rank1_players,
+            tickfont=dict(weight=600)
+        ),
+        dragmode=False,  # Prevent scroll hijacking on mobile
+    )
+    return fig_rank1
+
+
+# --- Duels ---
+# Head-to-head comparison of two players over the days both played
+
+def duel_played_days(dataset_prefix, player_name):
+    """History rows for the days a player actually played (has a score), in date order."""
+    return load_player_history(dataset_prefix, player_name).dropna(subset=['score'])
+
+
+@st.cache_data(ttl=3600)
+def compute_duel(dataset_prefix, player1, player2):
+    """
+    Compute head-to-head results for two players, once per pair and data refresh.
+
+    Returns None if the players share no game day, otherwise a dict with:
+    - df_duel: one row per common day (most recent first) for the duel cards
+    - p1_wins / p2_wins: days each player finished ahead of the other
+    - total_games, p1_higher_elo_wins, p2_higher_elo_wins: Elo prediction accuracy
+    - total_p1_elo / total_p2_elo: net Elo each player took from the pairing
+    """
+    df_p1_played = duel_played_days(dataset_prefix, player1)
+    df_p2_played = duel_played_days(dataset_prefix, player2)
+
+    # Find common dates where both played (sorted day arrays, no Python date objects)
+    p1_days = df_p1_played['date'].to_numpy().astype('datetime64[D]')
+    p2_days = df_p2_played['date'].to_numpy().astype('datetime64[D]')
+    common_days = np.intersect1d(p1_days, p2_days)
+    if len(common_days) == 0:
+        return None
+
+    # Elo system constants (matching elo_ranking.py)
+    K_FACTOR = 180
+    K_NORMALIZED = K_FACTOR / 29  # Per pairwise comparison
+    DYNAMIC_K_NEW_GAMES = 10
+    DYNAMIC_K_ESTABLISHED_GAMES = 30
+    DYNAMIC_K_NEW_MULT = 1.5
+    DYNAMIC_K_PROV_MULT = 1.2
+    LOSS_AMP_MAX = 1.5
+    # K per games-played bucket: new, provisional, established
+    K_BY_BUCKET = np.array([K_NORMALIZED * DYNAMIC_K_NEW_MULT, K_NORMALIZED * DYNAMIC_K_PROV_MULT, K_NORMALIZED])
+
+    def get_dynamic_k(games_played):
+        """Calculate K-factor based on games played (table lookup over matchups)"""
+        bucket = np.searchsorted([DYNAMIC_K_NEW_GAMES, DYNAMIC_K_ESTABLISHED_GAMES], games_played, side='right')
+        return K_BY_BUCKET[bucket]
+
+    def calc_elo_exchange(p1_elo, p2_elo, p1_won, p1_games, p1_uncertainty, score_weight):
+        """
+        Calculate Elo exchange for P1 from each matchup with P2 (NumPy arrays).
+        Returns positive where P1 gained, negative where P1 lost.
+        """
+        # Expected score for P1
+        expected = 1.0 / (1.0 + np.power(10.0, (p2_elo - p1_elo) / 400.0))
+        actual = p1_won.astype(float)
+
+        # P1's K-factor, with loss amplification where P1 lost
+        k = get_dynamic_k(p1_games)
+        k = np.where(p1_won, k, k * (1 + (LOSS_AMP_MAX - 1) * p1_uncertainty))
+
+        # Apply score weighting
+        return k * score_weight * (actual - expected)
+
+    # Align both players' game days in one merge (no per-date scans)
+    df_m = df_p1_played.assign(_d=p1_days).merge(
+        df_p2_played.assign(_d=p2_days),
+        on='_d', suffixes=('_1', '_2')
+    ).sort_values('_d', ascending=False, ignore_index=True)
+
+    # Determine winners (lower rank is better)
+    p1_won_mask = (df_m['rank_1'] < df_m['rank_2']).to_numpy()
+    p2_won_mask = (df_m['rank_2'] < df_m['rank_1']).to_numpy()
+    decided_mask = p1_won_mask | p2_won_mask
+    winners = np.where(p1_won_mask, player1, np.where(p2_won_mask, player2, "Tie"))
+    p1_wins = int(p1_won_mask.sum())
+    p2_wins = int(p2_won_mask.sum())
+
+    # Track Elo prediction accuracy
+    total_games = int(decided_mask.sum())
+    p1_higher_elo_wins = int((p1_won_mask & (df_m['rating_1'] > df_m['rating_2']).to_numpy()).sum())
+    p2_higher_elo_wins = int((p2_won_mask & (df_m['rating_2'] > df_m['rating_1']).to_numpy()).sum())
+
+    # Calculate Elo exchange for both players (only days with a winner)
+    decided = df_m[decided_mask]
+    p1_won = p1_won_mask[decided_mask]
+    p1_elo = decided['rating_1'].to_numpy()
+    p2_elo = decided['rating_2'].to_numpy()
+    if 'games_played' in df_p1_played.columns:
+        p1_games = decided['games_played_1'].to_numpy()
+        p2_games = decided['games_played_2'].to_numpy()
+    else:
+        p1_games = p2_games = np.full(len(decided), 30)
+    if 'uncertainty' in df_p1_played.columns:
+        p1_uncertainty = decided['uncertainty_1'].to_numpy()
+        p2_uncertainty = decided['uncertainty_2'].to_numpy()
+    else:
+        p1_uncertainty = p2_uncertainty = np.zeros(len(decided))
+
+    # Score weight (ratio-based): winner's score / loser's score, 1.0 if loser scored 0
+    p1_score = decided['score_1'].to_numpy()
+    p2_score = decided['score_2'].to_numpy()
+    winner_score = np.where(p1_won, p1_score, p2_score)
+    loser_score = np.where(p1_won, p2_score, p1_score)
+    has_loser_score = loser_score > 0
+    ratio = winner_score / np.where(has_loser_score, loser_score, 1.0)
+    log_ratio = np.log2(np.maximum(ratio, 1.0))
+    score_weight = np.where(
+        has_loser_score, 0.5 + 0.5 * np.minimum(log_ratio / np.log2(10), 1.0), 1.0
+    )
+
+    # P1's perspective, then P2's (opposite outcome)
+    total_p1_elo = float(calc_elo_exchange(
+        p1_elo, p2_elo, p1_won, p1_games, p1_uncertainty, score_weight
+    ).sum())
+    total_p2_elo = float(calc_elo_exchange(
+        p2_elo, p1_elo, ~p1_won, p2_games, p2_uncertainty, score_weight
+    ).sum())
+
+    # Build comparison dataframe (most recent first) from whole columns
+    duel_data = {
+        'Date': df_m['_d'].dt.date,
+        'Winner': winners,
+        f'{player1} Daily Rank': df_m['rank_1'].astype(int),
+        f'{player2} Daily Rank': df_m['rank_2'].astype(int),
+        f'{player1} Score': df_m['score_1'].astype(int),
+        f'{player2} Score': df_m['score_2'].astype(int),
+    }
+    # Add active rank if available
+    if 'active_rank' in df_p1_played.columns:
+        duel_data[f'{player1} Active Rank'] = df_m['active_rank_1']
+        duel_data[f'{player2} Active Rank'] = df_m['active_rank_2']
+    duel_data[f'{player1} Elo'] = df_m['rating_1'].round(1)
+    duel_data[f'{player2} Elo'] = df_m['rating_2'].round(1)
+    df_duel = pd.DataFrame(duel_data)
+
+    return {
+        'df_duel': df_duel,
+        'p1_wins': p1_wins,
+        'p2_wins': p2_wins,
+        'total_games': total_games,
+        'p1_higher_elo_wins': p1_higher_elo_wins,
+        'p2_higher_elo_wins': p2_higher_elo_wins,
+        'total_p1_elo': total_p1_elo,
+        'total_p2_elo': total_p2_elo,
+    }
+
+
+@st.cache_resource(ttl=3600)
+def duel_figures(dataset_prefix, player1, player2):
+    """
+    Build the Duels charts for a pair that has common game days.
+
+    Returns (fig_elo, fig_score): both players' Elo over time, and the
+    mirrored per-day score bars.
+    """
+    df_p1_played = duel_played_days(dataset_prefix, player1)
+    df_p2_played = duel_played_days(dataset_prefix, player2)
+    df_duel = compute_duel(dataset_prefix, player1, player2)['df_duel']
+
+    # Elo chart data
+    df_p1_chart = df_p1_played[['date', 'rating']].assign(player=player1)
+    df_p2_chart = df_p2_played[['date', 'rating']].assign(player=player2)
+    # Both halves are already date-sorted; a stable merge sort just interleaves them
+    df_elo_compare = pd.concat([df_p1_chart, df_p2_chart], ignore_index=True).sort_values('date', kind='mergesort')
+
+    elo_colors = get_theme_colors()
+    fig_elo = px.line(
+        df_elo_compare,
+        x='date',
+        y='rating',
+        color='player',
+        markers=True,
+        labels={'date': 'Date', 'rating': 'Elo Rating', 'player': 'Player'},
+        color_discrete_map={player1: elo_colors["player1"], player2: elo_colors["player2"]},
+        render_mode='webgl',
+    )
+    fig_elo.update_traces(
+        hovertemplate='%{fullData.name}: %{y:.0f}<extra></extra>',
+        marker=dict(size=8, line=dict(width=1, color='rgba(255, 255, 255, 0.3)')),
+        line=dict(width=2),
+    )
+    apply_plotly_style(fig_elo)
+    fig_elo.update_layout(
+        hovermode='x unified',
+        height=280,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(weight=600)),
+        margin=dict(l=20, r=60, t=30, b=20)
+    )
+    # X-axis shows one tick per month; hover shows full date
+    fig_elo.update_xaxes(title="", tickformat="%b", hoverformat="%b %d, %Y", tickangle=0, dtick="M1")
+    fig_elo.update_yaxes(title="")
+    fig_elo.add_hline(y=1500, line_dash="dash", line_color="rgba(128, 128, 128, 0.5)", annotation_text="Baseline", annotation_font=dict(weight=600))
+
+    # Score chart data
+    score_colors = get_theme_colors()
+    # Oldest first, read straight off the duel rows
+    df_duel_chrono = df_duel.iloc[::-1]
+    dates_sorted = df_duel_chrono['Date'].tolist()
+    p1_scores_raw = df_duel_chrono[f'{player1} Score'].to_numpy(dtype=float)
+    p2_scores_raw = df_duel_chrono[f'{player2} Score'].to_numpy(dtype=float)
+
+    all_scores = np.concatenate([p1_scores_raw, p2_scores_raw])
+    score_cap = np.percentile(all_scores, 90) * 1.5 if len(all_scores) > 0 else 50000
+    score_cap = max(score_cap, 1000)
+
+    # Bars are capped at score_cap (hatched when clipped); the day's
+    # higher score gets its player color, the lower one (or a tie) grey
+    p1_scores_display = np.minimum(p1_scores_raw, score_cap)
+    p2_scores_display = -np.minimum(p2_scores_raw, score_cap)
+
+    p1_higher = p1_scores_raw > p2_scores_raw
+    p2_higher = p2_scores_raw > p1_scores_raw
+    tie_color = "rgba(128, 128, 128, 0.6)"
+    lower_color = "rgba(128, 128, 128, 0.4)"
+    p1_colors = np.where(p1_higher, score_colors["player1"], np.where(p2_higher, lower_color, tie_color))
+    p2_colors = np.where(p2_higher, score_colors["player2"], np.where(p1_higher, lower_color, tie_color))
+
+    p1_patterns = np.where(p1_scores_raw > score_cap, "/", "")
+    p2_patterns = np.where(p2_scores_raw > score_cap, "/", "")
+
+    fig_score = go.Figure()
+    fig_score.add_trace(go.Bar(name=player1, x=dates_sorted, y=p1_scores_display,
+        marker=dict(color=p1_colors, line=dict(width=1, color='rgba(255,255,255,0.3)'), pattern=dict(shape=p1_patterns, solidity=0.5)),
+        customdata=p1_scores_raw, hovertemplate=f'{player1}: %{{customdata:,.0f}}<extra></extra>', showlegend=False))
+    fig_score.add_trace(go.Bar(name=player2, x=dates_sorted, y=p2_scores_display,
+        marker=dict(color=p2_colors, line=dict(width=1, color='rgba(255,255,255,0.3)'), pattern=dict(shape=p2_patterns, solidity=0.5)),
+        customdata=p2_scores_raw, hovertemplate=f'{player2}: %{{customdata:,.0f}}<extra></extra>', showlegend=False))
+    fig_score.add_trace(go.Scatter(x=[None], y=[None], mode='markers', marker=dict(size=10, color=score_colors["player1"]), name=player1, showlegend=True))
+    fig_score.add_trace(go.Scatter(x=[None], y=[None], mode='markers', marker=dict(size=10, color=score_colors["player2"]), name=player2, showlegend=True))
+
+    apply_plotly_style(fig_score)
+    fig_score.update_layout(
+        barmode='relative', hovermode='x unified', height=280, bargap=0.15,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(weight=600)),
+        margin=dict(l=20, r=60, t=30, b=20),
+    )
+
+    # X-axis shows one tick per month; hover shows full date
+    fig_score.update_xaxes(title="", tickformat="%b", hoverformat="%b %d, %Y", tickangle=0, dtick="M1")
+
+    # Abbreviated y-axis labels (60K instead of 60,000) for narrow screens
+    def format_score_tick(val):
+        if val >= 1000:
+            return f"{int(val/1000)}K"
+        return str(int(val))
+
+    tick_step = 10 ** math.floor(math.log10(max(score_cap, 1000)))
+    if score_cap / tick_step < 3:
+        tick_step = tick_step / 2
+    tick_data = []
+    val = 0
+    while val <= score_cap * 1.1:
+        tick_data.append((val, format_score_tick(val)))
+        if val > 0:
+            tick_data.append((-val, format_score_tick(val)))
+        val += tick_step
+    tick_data.sort(key=lambda x: x[0])
+    fig_score.update_yaxes(title="", range=[-score_cap * 1.1, score_cap * 1.1],
+        tickvals=[t[0] for t in tick_data], ticktext=[t[1] for t in tick_data])
+    fig_score.add_hline(y=0, line_width=1, line_color="rgba(128, 128, 128, 0.5)")
+    return fig_elo, fig_score
+
+
+# --- Tab Renderers ---
+# One function per tab; main() only builds the shared chrome (CSS, banner,
+# sidebar, tab links) and hands off to render_active_tab.
+
+def render_dailies_tab(dataset_prefix):
+    """Render the Dailies tab: one day's top-30 leaderboard as cards."""
+    # Date selector for specific day
+    dates = available_dates(dataset_prefix, 'leaderboard')
+    if dates:
+        # Check for date in URL query params (e.g., ?tab=dailies&date=2024-01-15)
+        url_date = st.query_params.get("date", None)
+        default_date = dates[0]  # Most recent by default
+
+        if url_date:
+            try:
+                parsed_date = datetime.strptime(url_date, '%Y-%m-%d').date()
+                if parsed_date in dates:
+                    default_date = parsed_date
+            except ValueError:
+                pass  # Invalid date format, use default
+
+        # Calendar date picker
+        selected_date = st.date_input(
+            "Select date",
+            value=default_date,
+            min_value=dates[-1],
+            max_value=dates[0],
+            key="dailies_date"
+        )
+
+        # Note: Date is saved to session state on tab switch, not synced to URL on every change
+        # This prevents browser history pollution while still enabling deep linking via date clicks
+
+        # Check if selected date has data
+        df_day_sorted = dailies_view(dataset_prefix, selected_date)
+
+        if df_day_sorted is None:
+            st.info(f"No leaderboard data for {selected_date.strftime('%Y-%m-%d')}. Try another date.")
+        else:
+            # Display as cards
+            has_rating = 'rating' in df_day_sorted.columns
+            has_active_rank = 'active_rank' in df_day_sorted.columns
+            cards_html = generate_leaderboard_cards(df_day_sorted, has_rating=has_rating, has_active_rank=has_active_rank)
+            st.markdown(f'<div class="dailies-cards">{cards_html}</div>', unsafe_allow_html=True)
+    else:
+        st.warning("No data available for the selected date range.")
+
+
+def render_rankings_tab(dataset_prefix, df_history, df_ratings, df_ratings_all):
+    """Render the Rankings tab: paginated Elo ranking cards for a chosen date."""
+    if df_history is not None and 'active_rank' in df_history.columns:
+        # Date picker and sort on same row
+        dates = available_dates(dataset_prefix, 'history')
+
+        # Check for date in URL query params (shared with Dailies tab)
+        url_date = st.query_params.get("date", None)
+        default_ranking_date = dates[0]  # Most recent by default
+
+        if url_date:
+            try:
+                parsed_date = datetime.strptime(url_date, '%Y-%m-%d').date()
+                if parsed_date in dates:
+                    default_ranking_date = parsed_date
+            except ValueError:
+                pass  # Invalid date format, use default
+
+        # Sort options: display name -> (column, default_ascending)
+        sort_options = {
+            "Elo": ("rating", False),
+            "Daily Runs": ("games_played", False),
+            "Daily #1": ("wins", False),
+            "Daily #1 (%)": ("win_rate", False),
+            "Daily Top10": ("top_10s", False),
+            "Daily Top10 (%)": ("top_10s_rate", False),
+            "Daily Avg": ("avg_daily_rank", True),
+            "7-Game Avg": ("last_7", True),
+            "7-Game StdDev": ("consistency", True),
+        }
+
+        col_date, col_sort = st.columns([2, 3])
+        with col_date:
+            selected_ranking_date = st.date_input(
+                "Date",
+                value=default_ranking_date,
+                min_value=dates[-1],
+                max_value=dates[0],
+                key="elo_ranking_date"
+            )
+            # Note: Date saved to session state on tab switch, not synced to URL on every change
+        with col_sort:
+            selected_sort = st.selectbox(
+                "Sort by",
+                options=list(sort_options.keys()),
+                index=0,
+                key="card_sort"
+            )
+
+        # Load data for selected date
+        df_date_history = rows_for_date(df_history, selected_ranking_date)
+
+        if df_date_history.empty:
+            st.info(f"No ranking data for {selected_ranking_date}. Try another date.")
+        else:
+            # Toggle for showing unranked players
+            show_unranked = st.toggle("Show Unranked Players", value=True, help="Players with <7 games or inactive >7 days")
+
+            # Use "Best" sort direction (defined in sort_options)
+            sort_column, sort_ascending = sort_options[selected_sort]
+
+            # Project, filter and sort once per (date, toggle, sort) choice
+            df_sorted = rankings_view(dataset_prefix, selected_ranking_date, show_unranked,
+                                      sort_column, sort_ascending)
+
+            # No search filtering - show all players in sorted order
+            df_to_paginate = df_sorted
+
+            # Page size options
+            PAGE_SIZE_OPTIONS = {10: "10", 20: "20", 50: "50", 100: "100", 1000: "1000"}
+
+            # Initialize page size in session state
+            if "ranking_page_size" not in st.session_state:
+                st.session_state.ranking_page_size = 20
+
+            page_size = st.session_state.ranking_page_size
+            total_players = len(df_to_paginate)
+
+            if total_players == 0:
+                st.info("No players to display.")
+            else:
+                # Calculate pagination
+                total_pages = max(1, (total_players + page_size - 1) // page_size)
+
+                # Initialize page state if not exists
+                if "ranking_page" not in st.session_state:
+                    st.session_state.ranking_page = 1
+
+                # Clamp page to valid range
+                current_page = max(1, min(st.session_state.ranking_page, total_pages))
+                if current_page != st.session_state.ranking_page:
+                    st.session_state.ranking_page = current_page
+
+                # Calculate slice indices
+                start_idx = (current_page - 1) * page_size
+                end_idx = min(start_idx + page_size, total_players)
+
+                # Pagination controls function (renders compact centered nav with page size selector)
+                def render_pagination(position: str):
+                    """Render pagination controls. position='top' or 'bottom' for unique keys."""
+                    # Navigation: [label] [size] prev | range | next (label+size only on top)
+                    if position == "top":
+                        col_label, col_size, col_prev, col_range, col_next = st.columns([1.5, 1, 0.5, 2, 0.5])
+                        with col_label:
+                            st.markdown('<p class="pagination-label">Rows per page:</p>', unsafe_allow_html=True)
+                        with col_size:
+                            new_size = st.selectbox(
+                                "Per page",
+                                options=list(PAGE_SIZE_OPTIONS.keys()),
+                                format_func=lambda x: str(x),
+                                index=list(PAGE_SIZE_OPTIONS.keys()).index(page_size),
+                                key="page_size_select",
+                                label_visibility="collapsed"
+                            )
+                            if new_size != page_size:
+                                st.session_state.ranking_page_size = new_size
+                                st.session_state.ranking_page = 1
+                                st.rerun()
+                        with col_prev:
+                            if st.button("◁", disabled=(current_page <= 1), key=f"prev_{position}"):
+                                st.session_state.ranking_page = current_page - 1
+                                st.rerun()
+                        with col_range:
+                            range_text = f"{start_idx + 1}-{end_idx} of {total_players}"
+                            st.button(range_text, disabled=True, key=f"range_{position}")
+                        with col_next:
+                            if st.button("▷", disabled=(current_page >= total_pages), key=f"next_{position}"):
+                                st.session_state.ranking_page = current_page + 1
+                                st.rerun()
+                    else:
+                        # Bottom: just navigation, no size selector
+                        col_prev, col_range, col_next = st.columns(3)
+                        with col_prev:
+                            if st.button("◁", disabled=(current_page <= 1), key=f"prev_{position}"):
+                                st.session_state.ranking_page = current_page - 1
+                                st.rerun()
+                        with col_range:
+                            range_text = f"{start_idx + 1}-{end_idx} of {total_players}"
+                            st.button(range_text, disabled=True, key=f"range_{position}")
+                        with col_next:
+                            if st.button("▷", disabled=(current_page >= total_pages), key=f"next_{position}"):
+                                st.session_state.ranking_page = current_page + 1
+                                st.rerun()
+
+                # Top pagination (only show if more than 1 page)
+                if total_pages > 1:
+                    render_pagination("top")
+                elif total_players > 20:
+                    # Show page size selector even if only 1 page (user might want smaller pages)
+                    render_pagination("top")
+
+                # Slice to current page
+                df_page = df_to_paginate.iloc[start_idx:end_idx]
+
+                # Card layout (responsive: 8 stats on desktop, 4x2 on mobile)
+                # Uses Streamlit CSS variables for automatic theme adaptation
+                cards_html = generate_ranking_cards(df_page)
+                st.html(f'<div class="ranking-cards">{cards_html}</div>')
+
+                # Bottom pagination (only show if more than 1 page)
+                if total_pages > 1:
+                    render_pagination("bottom")
+    elif df_ratings is not None:
+        # Fallback if no history data with active_rank
+        st.warning("Historical rankings not available. Showing current rankings only.")
+
+        # Rating Distribution Chart (built only on demand - an expander is
+        # serialized even while collapsed)
+        if st.toggle("📊 Show Rating Distribution", value=False, key="show_dist"):
+            ratings = df_ratings['rating'].to_numpy()
+            median_rating = float(np.median(ratings))
+            fig_dist = go.Figure(go.Histogram(
+                x=ratings,
+                nbinsx=20,
+                marker_color=ACCENT_COLORS["primary"],
+                hovertemplate='Elo Rating=%{x}<br>Players=%{y}<extra></extra>',
+            ))
+            apply_plotly_style(fig_dist)
+            # Enhanced bar styling with glow effect
+            fig_dist.update_traces(
+                marker=dict(
+                    line=dict(width=1, color='rgba(255, 107, 107, 0.8)'),
+                    opacity=0.85,
+                ),
+            )
+            fig_dist.update_layout(
+                showlegend=False,
+                height=300,
+                margin=dict(l=20, r=20, t=30, b=20),
+                xaxis_title="Rating",
+                yaxis_title="Players"
+            )
+            fig_dist.add_vline(
+                x=median_rating,
+                line_dash="dash",
+                line_color=ACCENT_COLORS["warning"],
+                annotation_text=f"Median: {median_rating:.0f}",
+                annotation_font=dict(color=ACCENT_COLORS["warning"], weight=600)
+            )
+            st.plotly_chart(fig_dist, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
+
+        # Toggle to show unranked players
+        show_unranked = st.toggle("Show Unranked Players", value=True, help="Players with <7 games or inactive >7 days")
+
+        # Determine which ratings to display
+        if show_unranked and df_ratings_all is not None:
+            df_ratings_to_display = df_ratings_all
+        else:
+            df_ratings_to_display = df_ratings
+
+        # All players table
+        st.subheader("Elo Ranking Leaderboard")
+
+        # Per-player leaderboard stats (computed once per dataset)
+        player_stats = leaderboard_player_stats(dataset_prefix)
+
+        # Merge stats with ratings
+        df_ratings_display = df_ratings_to_display.merge(player_stats, on='player_name', how='left')
+
+        # Determine columns based on whether we have uncertainty data
+        has_uncertainty = 'uncertainty' in df_ratings_display.columns
+        has_days_inactive = 'days_inactive' in df_ratings_display.columns
+
+        # Select columns to display (use active_rank instead of rank)
+        display_cols = ['active_rank', 'player_name', 'rating', 'games_played', 'wins', 'win_rate', 'top_10s', 'top_10s_rate', 'avg_daily_rank', 'last_7', 'last_seen']
+        if has_days_inactive:
+            display_cols.insert(-1, 'days_inactive')
+        if has_uncertainty and show_unranked:
+            display_cols.insert(-1, 'uncertainty')
+
+        column_config = {
+            "active_rank": st.column_config.NumberColumn("Elo Rank", format="%d"),
+            "player_name": st.column_config.TextColumn("Player"),
+            "rating": st.column_config.NumberColumn("Rating", format="%.1f"),
+            "games_played": st.column_config.NumberColumn("Daily Runs", format="%d", help="Top 30 finishes"),
+            "wins": st.column_config.NumberColumn("Daily #1", format="%d"),
+            "win_rate": st.column_config.NumberColumn("Daily #1 (%)", format="%.1f"),
+            "top_10s": st.column_config.NumberColumn("Daily Top10", format="%d"),
+            "top_10s_rate": st.column_config.NumberColumn("Daily Top10 (%)", format="%.1f"),
+            "avg_daily_rank": st.column_config.NumberColumn("Daily Avg", format="%.1f", help="Average Daily Rank over all games"),
+            "last_7": st.column_config.NumberColumn("7-Game Avg", format="%.1f", help="Average Daily Rank over last 7 games"),
+            "last_seen": st.column_config.DateColumn("Last Seen", format="YYYY-MM-DD")
+        }
+        if has_days_inactive:
+            column_config["days_inactive"] = st.column_config.NumberColumn("Inactive", format="%d")
+        if has_uncertainty:
+            column_config["uncertainty"] = st.column_config.NumberColumn("Uncertainty", format="%.2f")
+
+        st.dataframe(
+            df_ratings_display[display_cols],
+            width='stretch',
+            hide_index=True,
+            column_config=column_config
+        )
+    else:
+        st.warning("Ratings data not available.")
+
+
+def render_tracker_tab(dataset_prefix, df_history, df_ratings, players_by_rating):
+    """Render the Tracker tab: one player's summary card, rivals, charts and game history."""
+    if df_history is not None:
+        # Check for player in URL query params (e.g., ?tab=tracker&player=Bidderlyn)
+        url_player = st.query_params.get("player", None)
+        player_index = None
+
+        if url_player and url_player in players_by_rating:
+            player_index = players_by_rating.index(url_player)
+        elif 'tracker_default_player' not in st.session_state:
+            # Pre-select random player from top 10 on first load (persists during session)
+            top_n = min(10, len(players_by_rating))
+            if top_n >= 1:
+                player_index = random.randint(0, top_n - 1)
+                st.session_state.tracker_default_player = player_index
+
+        # Use URL player, session state, or None
+        if player_index is None:
+            player_index = st.session_state.get('tracker_default_player', None)
+
+        # Player selector (single selection)
+        selected_player = st.selectbox(
+            "Select a player",
+            options=players_by_rating,
+            index=player_index,
+            placeholder="Choose a player...",
+            key="tab4_player_select"
+        )
+
+        # Sync selected player to URL params (for share button and bookmarking)
+        if selected_player and st.query_params.get("player") != selected_player:
+            st.query_params["player"] = selected_player
+
+        if selected_player:
+            # Filter history for selected player
+            df_player_history = load_player_history(dataset_prefix, selected_player)
+
+            if not df_player_history.empty:
+                # Filter to days where the player actually played (score is not null)
+                df_player_played = df_player_history.dropna(subset=['score'])
+
+                if not df_player_played.empty:
+                    # Get latest stats from the most recent game (history is date-ordered at load)
+                    latest = df_player_played.iloc[-1]
+                    has_active_rank = 'active_rank' in df_player_played.columns
+
+                    # Get current Elo rank
+                    current_player_rating = df_ratings[df_ratings['player_name'] == selected_player]
+                    if not current_player_rating.empty and pd.notna(current_player_rating.iloc[0]['active_rank']):
+                        elo_rank = int(current_player_rating.iloc[0]['active_rank'])
+                        elo_rank_str = f"#{elo_rank}"
+                    else:
+                        elo_rank_str = "—"
+
+                    # Prepare metric values
+                    current_rating = latest['rating']
+                    games = int(latest['games_played'])
+                    wins = int(latest['wins'])
+                    win_rate = latest['win_rate']
+                    top_10s = int(latest['top_10s'])
+                    top_10_rate = latest['top_10s_rate']
+                    avg_rank = latest['avg_daily_rank']
+                    last_7 = latest['last_7']
+                    consistency = latest['consistency']
+
+                    # Pre-format optional values for f-string
+                    avg_rank_str = f"{avg_rank:.1f}" if pd.notna(avg_rank) else "N/A"
+                    last_7_str = f"{last_7:.1f}" if pd.notna(last_7) else "N/A"
+                    consistency_str = f"{consistency:.1f}" if pd.notna(consistency) else "N/A"
+
+                    # --- Player Summary Card (exact match to Rankings tab) ---
+                    # Uses the same .rank-card / .card-stat classes as generate_ranking_cards()
+
+                    # Elo rank display (with label on top)
+                    rank_html = f'<span class="rank-label">Elo Rank</span><span style="color:#FF6B6B;">{elo_rank_str}</span>'
+
+                    # Player name (matches Rankings tab)
+                    name_html = f'<span class="card-name-text">{html.escape(selected_player)}</span>'
+
+                    # Rating display
+                    rating_str = f"{current_rating:.1f}"
+
+                    # Format stats to match Rankings tab exactly
+                    win_rate_str = f"{win_rate:.1f}%"
+                    top10_rate_str = f"{top_10_rate:.1f}%"
+
+                    summary_html = f'<div class="rank-card"><div class="card-header"><div class="card-rank">{rank_html}</div><div class="card-name">{name_html}</div><div class="card-rating active"><span class="rating-label">Elo</span>{rating_str}</div></div><div class="stats-grid"><div class="card-stat"><span class="card-stat-label">Daily Runs</span><span class="card-stat-value">{games}</span></div><div class="card-stat"><span class="card-stat-label">Daily #1</span><span class="card-stat-value">{wins}</span></div><div class="card-stat"><span class="card-stat-label">Daily #1 (%)</span><span class="card-stat-value">{win_rate_str}</span></div><div class="card-stat"><span class="card-stat-label">Daily Top10</span><span class="card-stat-value">{top_10s}</span></div><div class="card-stat"><span class="card-stat-label">Daily Top10 (%)</span><span class="card-stat-value">{top10_rate_str}</span></div><div class="card-stat"><span class="card-stat-label">Daily Avg</span><span class="card-stat-value">{avg_rank_str}</span></div><div class="card-stat"><span class="card-stat-label">7-Game Avg</span><span class="card-stat-value">{last_7_str}</span></div><div class="card-stat"><span class="card-stat-label" title="Lower = more consistent">7-Game StdDev</span><span class="card-stat-value">{consistency_str}</span></div></div></div>'
+                    st.html(f'<div class="ranking-cards">{summary_html}</div>')
+
+                    # --- Top Rivals Section ---
+                    df_rivalries = load_rivalries_data(dataset_prefix)
+                    if df_rivalries is not None and not df_rivalries.empty:
+                        rivals = get_player_rivals(selected_player, df_rivalries, n=6)
+                        if rivals:
+                            rivals_html = generate_rivals_html(selected_player, rivals)
+                            st.html(rivals_html)
+
+                    # --- Charts Row (side by side if space allows) ---
+                    fig_rating, fig_rank = tracker_figures(dataset_prefix, selected_player)
+                    chart_col1, chart_col2 = st.columns(2)
+
+                    # --- Rating Trajectory Chart ---
+                    with chart_col1:
+                        st.subheader("Elo Rating History")
+                        st.html('<p class="tracker-chart-subtitle">1500 = starting rating</p>')
+                        st.plotly_chart(fig_rating, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
+
+                    # --- Daily Rank History Chart (Bar Chart) ---
+                    with chart_col2:
+                        st.subheader("Daily Rank History")
+                        st.html('<p class="tracker-chart-subtitle">Green = best rank achieved</p>')
+                        st.plotly_chart(fig_rank, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
+
+                    # --- Game History Cards ---
+                    # Sort controls - column and direction combined
+                    sort_options = {
+                        "Recent": ("date", False),
+                        "Oldest": ("date", True),
+                        "Daily Rank": ("rank", True),
+                        "Score": ("score", False),
+                    }
+
+                    col_label, col_sort = st.columns([1, 2])
+                    with col_label:
+                        st.subheader("Game History")
+                    with col_sort:
+                        selected_sort = st.selectbox(
+                            "Sort",
+                            options=list(sort_options.keys()),
+                            index=0,
+                            key="history_sort",
+                            label_visibility="collapsed"
+                        )
+
+                    sort_column, sort_ascending = sort_options[selected_sort]
+                    # Rows are already in date order (one per day), so the
+                    # date sorts are a view or a reversal rather than a sort
+                    if sort_column == 'date':
+                        df_table = df_player_played if sort_ascending else df_player_played.iloc[::-1]
+                    # Daily Rank: secondary sort by score (highest first within same rank)
+                    elif selected_sort == "Daily Rank":
+                        df_table = df_player_played.sort_values(
+                            ['rank', 'score'],
+                            ascending=[True, False],
+                            na_position='last'
+                        )
+                    else:
+                        df_table = df_player_played.sort_values(sort_column, ascending=sort_ascending, na_position='last')
+
+                    # Display as cards
+                    cards_html = generate_game_history_cards(df_table, player_name=selected_player, has_active_rank=has_active_rank)
+                    st.html(f'<div class="ranking-cards">{cards_html}</div>')
+                else:
+                    st.info(f"No game history found for {selected_player}.")
+            else:
+                st.info(f"No history data available for {selected_player}.")
+        else:
+            st.info("Select a player to view their profile and history.")
+    else:
+        st.warning("History data not available.")
+
+
+def render_hall_of_fame_tab(dataset_prefix, df_history):
+    """Render the Hall of Fame tab: all-time leader cards and the Elo #1 timeline."""
+    if df_history is not None and 'active_rank' in df_history.columns:
+        # Hall of Fame leaderboard cards
+        hof_stats = hall_of_fame_stats(dataset_prefix)
+        if hof_stats:
+            hof_cards_html = generate_hall_of_fame_cards(hof_stats)
+            st.html(hof_cards_html)
+
+        # Elo #1 evolution chart - shows who held #1 over time (all history)
+        fig_rank1 = elo1_timeline_figure(dataset_prefix)
+
+        # Card header for the chart
+        st.html('''
+            <div class="hof-chart-card">
+                <div class="hof-chart-header">
+                    <span style="font-size: 1.2rem;">📈</span>
+                    <span>Elo #1 Timeline</span>
+                </div>
+            </div>
+        ''')
+
+        if fig_rank1 is not None:
+            st.plotly_chart(fig_rank1, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
+    else:
+        st.warning("Active rank history data not available.")
+
+
+def render_duels_tab(dataset_prefix, df_history, players_by_rating):
+    """Render the Duels tab: head-to-head record, charts and game-by-game cards."""
+    if df_history is not None:
+        # Check for players in URL query params (e.g., ?tab=duels&player1=Bidderlyn&player2=Siker_7)
+        url_player1 = st.query_params.get("player1", None)
+        url_player2 = st.query_params.get("player2", None)
+
+        p1_index = None
+        p2_index = None
+
+        # If query params provided, use them
+        if url_player1 and url_player1 in players_by_rating:
+            p1_index = players_by_rating.index(url_player1)
+        if url_player2 and url_player2 in players_by_rating:
+            p2_index = players_by_rating.index(url_player2)
+
+        # If no query params (or invalid), use session state or random selection
+        if p1_index is None or p2_index is None:
+            if 'duel_default_p1' not in st.session_state:
+                top_n = min(10, len(players_by_rating))
+                if top_n >= 2:
+                    idx1, idx2 = random.sample(range(top_n), 2)
+                    st.session_state.duel_default_p1 = idx1
+                    st.session_state.duel_default_p2 = idx2
+                else:
+                    st.session_state.duel_default_p1 = None
+                    st.session_state.duel_default_p2 = None
+
+            if p1_index is None:
+                p1_index = st.session_state.get('duel_default_p1', None)
+            if p2_index is None:
+                p2_index = st.session_state.get('duel_default_p2', None)
+
+        # Get theme colors (same source as duel cards for consistency)
+        duel_colors = get_theme_colors()
+        p1_label_color = duel_colors.get("player1", "#0E7490")
+        p2_label_color = duel_colors.get("player2", "#B45309")
+
+        col_p1, col_p2 = st.columns([1, 1])
+
+        with col_p1:
+            st.html(f'<p style="font-size: 0.875rem; font-weight: 600; margin: 0; color: {p1_label_color};">Player 1</p>')
+            player1 = st.selectbox(
+                "Player 1",
+                options=players_by_rating,
+                index=p1_index,
+                placeholder="Choose player...",
+                key="duel_player1",
+                label_visibility="collapsed"
+            )
+
+        with col_p2:
+            st.html(f'<p style="font-size: 0.875rem; font-weight: 600; margin: 0; color: {p2_label_color};">Player 2</p>')
+            player2 = st.selectbox(
+                "Player 2",
+                options=players_by_rating,
+                index=p2_index,
+                placeholder="Choose player...",
+                key="duel_player2",
+                label_visibility="collapsed"
+            )
+        # Note: Players saved to session state on tab switch, not synced to URL on every change
+
+        if player1 and player2:
+            if player1 == player2:
+                st.warning("Please select two different players.")
+            else:
+                duel = compute_duel(dataset_prefix, player1, player2)
+
+                if duel is None:
+                    st.info(f"No common game days found between {player1} and {player2}.")
+                else:
+                    df_duel = duel['df_duel']
+
+                    # Last Encounter section - show most recent duel card with full win tally
+                    df_duel_recent_first = df_duel.sort_values('Date', ascending=False)
+                    theme_colors = get_theme_colors()
+                    last_card_html = generate_duel_cards(df_duel_recent_first, player1, player2, colors=theme_colors, limit=1, last_encounter_label=True)
+                    st.html(f'<div class="ranking-cards">{last_card_html}</div>')
+
+                    # Display charts side-by-side
+                    fig_elo, fig_score = duel_figures(dataset_prefix, player1, player2)
+                    col_elo, col_score = st.columns(2)
+                    with col_elo:
+                        st.subheader("Elo Rating Comparison")
+                        st.html('<p style="color: #A0A0A0; font-size: 0.75rem; font-weight: 500; margin: -0.5rem 0 0.5rem 0;">1500 = starting rating</p>')
+                        st.plotly_chart(fig_elo, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
+                    with col_score:
+                        st.subheader("Score Comparison")
+                        st.html('<p style="color: #A0A0A0; font-size: 0.75rem; font-weight: 500; margin: -0.5rem 0 0.5rem 0;">Color = duel winner</p>')
+                        st.plotly_chart(fig_score, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
+
+                    # Display the duel cards
+                    st.subheader("Game-by-Game Comparison")
+
+                    # Sort control - just Recent/Oldest by date
+                    sort_direction = st.selectbox(
+                        "Sort by",
+                        options=["Recent", "Oldest"],
+                        index=0,
+                        key="duel_sort"
+                    )
+                    sort_ascending = sort_direction == "Oldest"
+                    df_duel_sorted = df_duel.sort_values("Date", ascending=sort_ascending, na_position='last')
+
+                    # Display as cards (with theme-adaptive player colors)
+                    theme_colors = get_theme_colors()
+                    cards_html = generate_duel_cards(df_duel_sorted, player1, player2, colors=theme_colors)
+                    st.html(f'<div class="ranking-cards">{cards_html}</div>')
+        else:
+            st.info("Select two players to compare their head-to-head performance.")
+    else:
+        st.warning("History data not available.")
+
+
+@st.fragment
+def render_active_tab(active_tab, dataset_prefix, df_history,
+                      df_ratings, df_ratings_all, players_by_rating):
+    """
+    Render the active tab and the floating share button.
+
+    Runs as a fragment: widgets inside the tab (date pickers, player selects,
+    sort and pagination controls) rerun only this function, not the CSS,
+    banner and sidebar. The share button lives here so its link tracks those
+    widgets.
+    """
+    if active_tab == "📊 Dailies":
+        render_dailies_tab(dataset_prefix)
+    elif active_tab == "🏅 Rankings":
+        render_rankings_tab(dataset_prefix, df_history, df_ratings, df_ratings_all)
+    elif active_tab == "👤 Tracker":
+        render_tracker_tab(dataset_prefix, df_history, df_ratings, players_by_rating)
+    elif active_tab == "🏆 Hall of Fame":
+        render_hall_of_fame_tab(dataset_prefix, df_history)
+    elif active_tab == "⚔️ Duels":
+        render_duels_tab(dataset_prefix, df_history, players_by_rating)
+
+    # Floating share button (use validated slug, not raw URL param)
+    validated_slug = TAB_SLUGS.get(active_tab, "rankings")
+    render_floating_share_button(validated_slug)
+
+
 # --- Main App ---
 def main():
-    # Inject custom CSS (static) - use st.html() to avoid markdown parsing of CSS comments
+    # Inject custom + theme CSS (static) - use st.html() to avoid markdown parsing of CSS comments
     st.html(CUSTOM_CSS)
 
-    # Inject theme-specific CSS (dynamic based on current theme)
-    st.markdown(get_theme_css(), unsafe_allow_html=True)
-
     # Title with logo, gradient text, and glow effects
-    logo_path = Path(__file__).parent / "images" / "dftl_logo.png"
+    logo_b64 = load_logo_b64()
 
     # Determine current dataset for badge display and toggle behavior
     # Check session_state FIRST (immediately reflects widget changes), then URL param (for direct navigation)
@@ -2776,134 +2931,9 @@ def main():
     else:
         banner_link_href = "?"
 
-    if logo_path.exists():
-        with open(logo_path, "rb") as f:
-            logo_b64 = base64.b64encode(f.read()).decode()
+    if logo_b64:
         st.html(f"""
         <div id="top"></div>
-        <style>
-            /* Container query context */
-            /* Banner header - compact, full-width, always horizontal, centered */
-            .dashboard-banner {{
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                gap: 0.75rem;
-                padding: 0;
-                margin: 0 0 var(--space-md) 0;  /* 16px bottom margin per design system */
-            }}
-            .dashboard-banner-link,
-            .dashboard-banner-link:hover,
-            .dashboard-banner-link:visited {{
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                gap: inherit;
-                text-decoration: none !important;
-                color: inherit;
-                cursor: pointer;
-            }}
-            .dashboard-banner-link *,
-            .dashboard-banner-link:hover * {{
-                text-decoration: none !important;
-            }}
-            .dashboard-banner-link:hover {{
-                opacity: 0.85;
-            }}
-            [data-testid="stVerticalBlock"] > [data-testid="stElementContainer"]:has(.dashboard-banner) {{
-                margin: 0 !important;  /* Override Streamlit default - spacing controlled via .dashboard-banner */
-            }}
-            .dashboard-logo {{
-                width: 50px;
-                height: auto;
-                filter: drop-shadow(0 0 8px rgba(255, 107, 107, 0.3));
-                flex-shrink: 0;
-            }}
-            .dashboard-title-group {{
-                display: flex;
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 0;
-            }}
-            .dashboard-title-row {{
-                display: flex;
-                align-items: center;
-                gap: 0.5rem;
-            }}
-            .dataset-badge {{
-                font-family: system-ui, sans-serif !important;
-                font-size: 0.65rem !important;
-                font-weight: 600 !important;
-                padding: 0.15rem 0.4rem;
-                border-radius: 4px;
-                color-scheme: inherit;
-                white-space: nowrap;
-                letter-spacing: 0.02em;
-                cursor: pointer;
-            }}
-            .dataset-badge-ea {{
-                background: #1E3A5F;
-                color: #93C5FD;
-            }}
-            .dataset-badge-full {{
-                background: #064E3B;
-                color: #6EE7B7;
-            }}
-            .dashboard-title {{
-                font-family: 'Source Sans', sans-serif !important;
-                font-size: 1.25rem !important;
-                font-weight: 700 !important;
-                line-height: 1.1 !important;
-                margin: 0 !important;
-                padding: 0 !important;
-                --gradient-start: #FAFAFA;
-                --gradient-mid: #FF6B6B;
-                --gradient-end: #FFD700;
-                background: linear-gradient(135deg, var(--gradient-start) 0%, var(--gradient-mid) 50%, var(--gradient-end) 100%) !important;
-                -webkit-background-clip: text !important;
-                -webkit-text-fill-color: transparent !important;
-                background-clip: text !important;
-                letter-spacing: 0.02em;
-            }}
-            .dashboard-subtitle {{
-                font-size: 0.65rem;
-                font-weight: 400;
-                line-height: 1.2;
-                color: #9CA3AF;
-                margin: 0 !important;
-                padding: 0 !important;
-                letter-spacing: 0.04em;
-            }}
-            /* Scale up banner on wider viewports (sm breakpoint = 600px) */
-            @media (min-width: 600px) {{
-                .dashboard-banner {{
-                    gap: 1rem;  /* --space-md */
-                }}
-                .dashboard-logo {{
-                    width: 60px;
-                }}
-                .dashboard-title {{
-                    font-size: 1.5rem !important;
-                }}
-                .dashboard-subtitle {{
-                    font-size: 0.7rem;
-                }}
-                .dataset-badge {{
-                    font-size: 0.75rem !important;
-                    padding: 0.2rem 0.5rem;
-                }}
-            }}
-            /* Hide the anchor link inside the title */
-            .dashboard-title [data-testid="stHeaderActionElements"] {{
-                display: none !important;
-            }}
-            /* Hide Streamlit header action elements on mobile (sm) */
-            @media (max-width: 600px) {{
-                [data-testid="stHeaderActionElements"] {{
-                    display: none !important;
-                }}
-            }}
-        </style>
         <div class="dashboard-banner">
             <a href="{banner_link_href}" class="dashboard-banner-link" target="_self" title="{banner_link_title}" aria-label="{banner_link_title}">
                 <img src="data:image/png;base64,{logo_b64}" class="dashboard-logo" alt="DFTL Rankings Logo">
@@ -2976,67 +3006,22 @@ def main():
         min_date = df_leaderboard['date'].min().date()
         max_date = df_leaderboard['date'].max().date()
 
-        all_players = sorted(df_leaderboard['player_name'].unique())
+        all_players = players_alphabetical(dataset_prefix)
 
-        # Create rating-sorted player list (ranked first, then unranked, both by rating desc)
-        if df_ratings_all is not None:
-            df_ranked_sorted = df_ratings_all[df_ratings_all['active_rank'].notna()].sort_values('rating', ascending=False)
-            df_unranked_sorted = df_ratings_all[df_ratings_all['active_rank'].isna()].sort_values('rating', ascending=False)
-            players_by_rating = df_ranked_sorted['player_name'].tolist() + df_unranked_sorted['player_name'].tolist()
-        else:
+        # Rating-sorted player list (ranked first, then unranked, both by rating desc)
+        players_by_rating = players_sorted_by_rating(dataset_prefix)
+        if players_by_rating is None:
             players_by_rating = all_players  # Fallback to alphabetical
 
-        st.caption(f"Data range: {min_date} to {max_date}")
-        st.caption(f"Players in Dataset: {len(all_players)}")
+        st.caption(f"Data range: {min_date} to {max_date}  \nPlayers in Dataset: {len(all_players)}")
 
         # Export Data section (true lazy loading - only prepares on button click)
         st.markdown("---")
-        with st.expander("📥 Export Data", expanded=False):
-            colors = get_theme_colors()
-            is_dark = colors["bg_primary"] == "#0E1117"
-
-            # Elo Rankings export (lazy)
-            export_key_elo = f"export_elo_{dataset_prefix}"
-            if st.button("📊 Generate Elo Rankings", key=f"btn_elo_{dataset_prefix}", use_container_width=True):
-                st.session_state[export_key_elo] = prepare_elo_rankings_export(dataset_prefix)
-            if export_key_elo in st.session_state and st.session_state[export_key_elo]:
-                download_html = create_download_link_b64(
-                    b64_data=st.session_state[export_key_elo],
-                    filename="dftl_elo_rankings.csv",
-                    label="⬇️ Download Elo Rankings",
-                    is_dark=is_dark
-                )
-                st.markdown(download_html, unsafe_allow_html=True)
-
-            # Elo History export (lazy)
-            export_key_hist = f"export_history_{dataset_prefix}"
-            if st.button("📈 Generate Elo History", key=f"btn_hist_{dataset_prefix}", use_container_width=True):
-                st.session_state[export_key_hist] = prepare_elo_history_export(dataset_prefix)
-            if export_key_hist in st.session_state and st.session_state[export_key_hist]:
-                download_html = create_download_link_b64(
-                    b64_data=st.session_state[export_key_hist],
-                    filename="dftl_elo_history.csv",
-                    label="⬇️ Download Elo History",
-                    is_dark=is_dark
-                )
-                st.markdown(download_html, unsafe_allow_html=True)
-
-            # Daily Results export (lazy)
-            export_key_daily = f"export_daily_{dataset_prefix}"
-            if st.button("📅 Generate Daily Results", key=f"btn_daily_{dataset_prefix}", use_container_width=True):
-                st.session_state[export_key_daily] = prepare_daily_results_export(dataset_prefix)
-            if export_key_daily in st.session_state and st.session_state[export_key_daily]:
-                download_html = create_download_link_b64(
-                    b64_data=st.session_state[export_key_daily],
-                    filename="dftl_daily_results.csv",
-                    label="⬇️ Download Daily Results",
-                    is_dark=is_dark
-                )
-                st.markdown(download_html, unsafe_allow_html=True)
-
-        # Help link
-        st.markdown("---")
+        render_export_section(dataset_prefix)
+
+        # Help link (separator and link sent as one element)
         st.markdown(
+            '---\n\n'
             '<div style="padding: 0.5rem 0;">'
             '<a href="https://github.com/NPrime808/DFTL_Ranking_Dashboard#faq" target="_blank">📖 FAQ & Glossary</a>'
             '</div>',
@@ -3052,29 +3037,7 @@ def main():
             unsafe_allow_html=True
         )
 
-    # Use full date range
-    df_filtered = df_leaderboard.copy()
-
     # --- Main Content ---
-    # Tab options (radio-as-tabs for persistence)
-    TAB_OPTIONS = [
-        "🏅 Rankings",
-        "⚔️ Duels",
-        "👤 Tracker",
-        "📊 Dailies",
-        "🏆 Hall of Fame"
-    ]
-
-    # Tab name to URL slug mapping (for cleaner URLs)
-    TAB_SLUGS = {
-        "🏅 Rankings": "rankings",
-        "⚔️ Duels": "duels",
-        "👤 Tracker": "tracker",
-        "📊 Dailies": "dailies",
-        "🏆 Hall of Fame": "hall-of-fame"
-    }
-    SLUG_TO_TAB = {v: k for k, v in TAB_SLUGS.items()}
-
     # Read tab from URL query params (persists across reloads)
     url_tab = st.query_params.get("tab", "rankings")
     default_tab = SLUG_TO_TAB.get(url_tab, TAB_OPTIONS[0])
@@ -3097,1079 +3060,9 @@ def main():
         </nav>
     ''')
 
-    # --- Tab 4: Steam Leaderboards ---
-    if active_tab == "📊 Dailies":
-        # Date selector for specific day
-        available_dates = sorted(df_filtered['date'].dt.date.unique(), reverse=True)
-        if available_dates:
-            # Check for date in URL query params (e.g., ?tab=dailies&date=2024-01-15)
-            url_date = st.query_params.get("date", None)
-            default_date = available_dates[0]  # Most recent by default
-
-            if url_date:
-                try:
-                    parsed_date = datetime.strptime(url_date, '%Y-%m-%d').date()
-                    if parsed_date in available_dates:
-                        default_date = parsed_date
-                except ValueError:
-                    pass  # Invalid date format, use default
-
-            # Calendar date picker
-            selected_date = st.date_input(
-                "Select date",
-                value=default_date,
-                min_value=available_dates[-1],
-                max_value=available_dates[0],
-                key="dailies_date"
-            )
-
-            # Note: Date is saved to session state on tab switch, not synced to URL on every change
-            # This prevents browser history pollution while still enabling deep linking via date clicks
-
-            # Check if selected date has data
-            df_day = df_filtered[df_filtered['date'].dt.date == selected_date].copy()
-
-            if df_day.empty:
-                st.info(f"No leaderboard data for {selected_date.strftime('%Y-%m-%d')}. Try another date.")
-            else:
-                df_day = df_day.sort_values('rank').head(30)
-
-                # Merge with history data for rating, rating_change, and active_rank
-                if df_history is not None:
-                    # Get history for the selected date (active_rank is pre-computed if available)
-                    history_cols = ['player_name', 'rating', 'rating_change']
-                    if 'active_rank' in df_history.columns:
-                        history_cols.append('active_rank')
-                    df_day_history = df_history[df_history['date'].dt.date == selected_date][
-                        history_cols
-                    ].copy()
-                    df_day = df_day.merge(df_day_history, on='player_name', how='left')
-                    display_cols = ['rank', 'player_name', 'score', 'rating', 'rating_change']
-                    if 'active_rank' in df_day.columns:
-                        display_cols.append('active_rank')
-                else:
-                    display_cols = ['rank', 'player_name', 'score']
-
-                # Sort by daily rank (natural order for leaderboard)
-                df_day_sorted = df_day.sort_values('rank', ascending=True, na_position='last')
-
-                # Display as cards
-                has_rating = 'rating' in df_day.columns
-                has_active_rank = 'active_rank' in df_day.columns
-                cards_html = generate_leaderboard_cards(df_day_sorted, has_rating=has_rating, has_active_rank=has_active_rank)
-                st.markdown(f'<div class="dailies-cards">{cards_html}</div>', unsafe_allow_html=True)
-        else:
-            st.warning("No data available for the selected date range.")
-
-    # --- Tab 1: Elo Rankings ---
-    if active_tab == "🏅 Rankings":
-        if df_history is not None and 'active_rank' in df_history.columns:
-            # Date picker and sort on same row
-            available_dates = sorted(df_history['date'].dt.date.unique(), reverse=True)
-
-            # Check for date in URL query params (shared with Dailies tab)
-            url_date = st.query_params.get("date", None)
-            default_ranking_date = available_dates[0]  # Most recent by default
-
-            if url_date:
-                try:
-                    parsed_date = datetime.strptime(url_date, '%Y-%m-%d').date()
-                    if parsed_date in available_dates:
-                        default_ranking_date = parsed_date
-                except ValueError:
-                    pass  # Invalid date format, use default
-
-            # Sort options: display name -> (column, default_ascending)
-            sort_options = {
-                "Elo": ("rating", False),
-                "Daily Runs": ("games_played", False),
-                "Daily #1": ("wins", False),
-                "Daily #1 (%)": ("win_rate", False),
-                "Daily Top10": ("top_10s", False),
-                "Daily Top10 (%)": ("top_10s_rate", False),
-                "Daily Avg": ("avg_daily_rank", True),
-                "7-Game Avg": ("last_7", True),
-                "7-Game StdDev": ("consistency", True),
-            }
-
-            col_date, col_sort = st.columns([2, 3])
-            with col_date:
-                selected_ranking_date = st.date_input(
-                    "Date",
-                    value=default_ranking_date,
-                    min_value=available_dates[-1],
-                    max_value=available_dates[0],
-                    key="elo_ranking_date"
-                )
-                # Note: Date saved to session state on tab switch, not synced to URL on every change
-            with col_sort:
-                selected_sort = st.selectbox(
-                    "Sort by",
-                    options=list(sort_options.keys()),
-                    index=0,
-                    key="card_sort"
-                )
-
-            # Load data for selected date
-            df_date_history = df_history[df_history['date'].dt.date == selected_ranking_date].copy()
-
-            if df_date_history.empty:
-                st.info(f"No ranking data for {selected_ranking_date}. Try another date.")
-            else:
-                # Toggle for showing unranked players
-                show_unranked = st.toggle("Show Unranked Players", value=True, help="Players with <7 games or inactive >7 days")
-
-                # Use "Best" sort direction (defined in sort_options)
-                sort_column, sort_ascending = sort_options[selected_sort]
-
-                # Columns to display (defined once, reused)
-                display_cols = ['active_rank', 'player_name', 'rating', 'games_played', 'wins', 'win_rate', 'top_10s', 'top_10s_rate', 'avg_daily_rank', 'last_7', 'consistency']
-                if 'days_inactive' in df_date_history.columns:
-                    display_cols.append('days_inactive')
-
-                # Filter data based on unranked toggle
-                if show_unranked:
-                    df_filtered = df_date_history[display_cols].copy()
-                else:
-                    df_filtered = df_date_history[df_date_history['active_rank'].notna()][display_cols].copy()
-
-                # Sort cards by selected option
-                df_sorted = df_filtered.sort_values(sort_column, ascending=sort_ascending, na_position='last')
-
-                # No search filtering - show all players in sorted order
-                df_to_paginate = df_sorted
-
-                # Page size options
-                PAGE_SIZE_OPTIONS = {10: "10", 20: "20", 50: "50", 100: "100", 1000: "1000"}
-
-                # Initialize page size in session state
-                if "ranking_page_size" not in st.session_state:
-                    st.session_state.ranking_page_size = 20
-
-                page_size = st.session_state.ranking_page_size
-                total_players = len(df_to_paginate)
-
-                if total_players == 0:
-                    st.info("No players to display.")
-                else:
-                    # Calculate pagination
-                    total_pages = max(1, (total_players + page_size - 1) // page_size)
-
-                    # Initialize page state if not exists
-                    if "ranking_page" not in st.session_state:
-                        st.session_state.ranking_page = 1
-
-                    # Clamp page to valid range
-                    current_page = max(1, min(st.session_state.ranking_page, total_pages))
-                    if current_page != st.session_state.ranking_page:
-                        st.session_state.ranking_page = current_page
-
-                    # Calculate slice indices
-                    start_idx = (current_page - 1) * page_size
-                    end_idx = min(start_idx + page_size, total_players)
-
-                    # Pagination controls function (renders compact centered nav with page size selector)
-                    def render_pagination(position: str):
-                        """Render pagination controls. position='top' or 'bottom' for unique keys."""
-                        # Navigation: [label] [size] prev | range | next (label+size only on top)
-                        if position == "top":
-                            col_label, col_size, col_prev, col_range, col_next = st.columns([1.5, 1, 0.5, 2, 0.5])
-                            with col_label:
-                                st.markdown('<p class="pagination-label">Rows per page:</p>', unsafe_allow_html=True)
-                            with col_size:
-                                new_size = st.selectbox(
-                                    "Per page",
-                                    options=list(PAGE_SIZE_OPTIONS.keys()),
-                                    format_func=lambda x: str(x),
-                                    index=list(PAGE_SIZE_OPTIONS.keys()).index(page_size),
-                                    key="page_size_select",
-                                    label_visibility="collapsed"
-                                )
-                                if new_size != page_size:
-                                    st.session_state.ranking_page_size = new_size
-                                    st.session_state.ranking_page = 1
-                                    st.rerun()
-                            with col_prev:
-                                if st.button("◁", disabled=(current_page <= 1), key=f"prev_{position}"):
-                                    st.session_state.ranking_page = current_page - 1
-                                    st.rerun()
-                            with col_range:
-                                range_text = f"{start_idx + 1}-{end_idx} of {total_players}"
-                                st.button(range_text, disabled=True, key=f"range_{position}")
-                            with col_next:
-                                if st.button("▷", disabled=(current_page >= total_pages), key=f"next_{position}"):
-                                    st.session_state.ranking_page = current_page + 1
-                                    st.rerun()
-                        else:
-                            # Bottom: just navigation, no size selector
-                            col_prev, col_range, col_next = st.columns(3)
-                            with col_prev:
-                                if st.button("◁", disabled=(current_page <= 1), key=f"prev_{position}"):
-                                    st.session_state.ranking_page = current_page - 1
-                                    st.rerun()
-                            with col_range:
-                                range_text = f"{start_idx + 1}-{end_idx} of {total_players}"
-                                st.button(range_text, disabled=True, key=f"range_{position}")
-                            with col_next:
-                                if st.button("▷", disabled=(current_page >= total_pages), key=f"next_{position}"):
-                                    st.session_state.ranking_page = current_page + 1
-                                    st.rerun()
-
-                    # Top pagination (only show if more than 1 page)
-                    if total_pages > 1:
-                        render_pagination("top")
-                    elif total_players > 20:
-                        # Show page size selector even if only 1 page (user might want smaller pages)
-                        render_pagination("top")
-
-                    # Slice to current page
-                    df_page = df_to_paginate.iloc[start_idx:end_idx]
-
-                    # Card layout (responsive: 8 stats on desktop, 4x2 on mobile)
-                    # Uses Streamlit CSS variables for automatic theme adaptation
-                    cards_html = generate_ranking_cards(df_page)
-                    st.html(f'<div class="ranking-cards">{cards_html}</div>')
-
-                    # Bottom pagination (only show if more than 1 page)
-                    if total_pages > 1:
-                        render_pagination("bottom")
-        elif df_ratings is not None:
-            # Fallback if no history data with active_rank
-            st.warning("Historical rankings not available. Showing current rankings only.")
-
-            # Rating Distribution Chart
-            with st.expander("📊 Rating Distribution", expanded=False):
-                fig_dist = px.histogram(
-                    df_ratings,
-                    x='rating',
-                    nbins=20,
-                    labels={'rating': 'Elo Rating', 'count': 'Players'},
-                    color_discrete_sequence=[ACCENT_COLORS["primary"]]
-                )
-                apply_plotly_style(fig_dist)
-                # Enhanced bar styling with glow effect
-                fig_dist.update_traces(
-                    marker=dict(
-                        line=dict(width=1, color='rgba(255, 107, 107, 0.8)'),
-                        opacity=0.85,
-                    ),
-                )
-                fig_dist.update_layout(
-                    showlegend=False,
-                    height=300,
-                    margin=dict(l=20, r=20, t=30, b=20),
-                    xaxis_title="Rating",
-                    yaxis_title="Players"
-                )
-                fig_dist.add_vline(
-                    x=df_ratings['rating'].median(),
-                    line_dash="dash",
-                    line_color=ACCENT_COLORS["warning"],
-                    annotation_text=f"Median: {df_ratings['rating'].median():.0f}",
-                    annotation_font=dict(color=ACCENT_COLORS["warning"], weight=600)
-                )
-                st.plotly_chart(fig_dist, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
-
-            # Toggle to show unranked players
-            show_unranked = st.toggle("Show Unranked Players", value=True, help="Players with <7 games or inactive >7 days")
-
-            # Determine which ratings to display
-            if show_unranked and df_ratings_all is not None:
-                df_ratings_to_display = df_ratings_all.copy()
-            else:
-                df_ratings_to_display = df_ratings.copy()
-
-            # All players table
-            st.subheader("Elo Ranking Leaderboard")
-
-            # Calculate player stats from leaderboard data
-            player_stats = df_leaderboard.groupby('player_name').agg(
-                wins=('rank', lambda x: (x == 1).sum()),
-                top_10s=('rank', lambda x: (x <= 10).sum()),
-                avg_daily_rank=('rank', 'mean'),
-                total_games=('rank', 'count')
-            ).reset_index()
-            player_stats['avg_daily_rank'] = player_stats['avg_daily_rank'].round(1)
-            player_stats['win_rate'] = (player_stats['wins'] / player_stats['total_games'] * 100).round(1)
-            player_stats['top_10s_rate'] = (player_stats['top_10s'] / player_stats['total_games'] * 100).round(1)
-            player_stats = player_stats.drop(columns=['total_games'])
-
-            # Calculate Last 7: average daily rank over last 7 games
-            last7_data = []
-            for player in df_ratings_to_display['player_name'].unique():
-                player_games = df_leaderboard[
-                    df_leaderboard['player_name'] == player
-                ].sort_values('date', ascending=False).head(7)
-
-                if len(player_games) > 0:
-                    avg_last7 = player_games['rank'].mean()
-                    last7_data.append({
-                        'player_name': player,
-                        'last_7': round(avg_last7, 1)
-                    })
-                else:
-                    last7_data.append({'player_name': player, 'last_7': None})
-
-            df_last7 = pd.DataFrame(last7_data)
-            player_stats = player_stats.merge(df_last7, on='player_name', how='left')
-
-            # Merge stats with ratings
-            df_ratings_display = df_ratings_to_display.merge(player_stats, on='player_name', how='left')
-
-            # Determine columns based on whether we have uncertainty data
-            has_uncertainty = 'uncertainty' in df_ratings_display.columns
-            has_days_inactive = 'days_inactive' in df_ratings_display.columns
-
-            # Select columns to display (use active_rank instead of rank)
-            display_cols = ['active_rank', 'player_name', 'rating', 'games_played', 'wins', 'win_rate', 'top_10s', 'top_10s_rate', 'avg_daily_rank', 'last_7', 'last_seen']
-            if has_days_inactive:
-                display_cols.insert(-1, 'days_inactive')
-            if has_uncertainty and show_unranked:
-                display_cols.insert(-1, 'uncertainty')
-
-            column_config = {
-                "active_rank": st.column_config.NumberColumn("Elo Rank", format="%d"),
-                "player_name": st.column_config.TextColumn("Player"),
-                "rating": st.column_config.NumberColumn("Rating", format="%.1f"),
-                "games_played": st.column_config.NumberColumn("Daily Runs", format="%d", help="Top 30 finishes"),
-                "wins": st.column_config.NumberColumn("Daily #1", format="%d"),
-                "win_rate": st.column_config.NumberColumn("Daily #1 (%)", format="%.1f"),
-                "top_10s": st.column_config.NumberColumn("Daily Top10", format="%d"),
-                "top_10s_rate": st.column_config.NumberColumn("Daily Top10 (%)", format="%.1f"),
-                "avg_daily_rank": st.column_config.NumberColumn("Daily Avg", format="%.1f", help="Average Daily Rank over all games"),
-                "last_7": st.column_config.NumberColumn("7-Game Avg", format="%.1f", help="Average Daily Rank over last 7 games"),
-                "last_seen": st.column_config.DateColumn("Last Seen", format="YYYY-MM-DD")
-            }
-            if has_days_inactive:
-                column_config["days_inactive"] = st.column_config.NumberColumn("Inactive", format="%d")
-            if has_uncertainty:
-                column_config["uncertainty"] = st.column_config.NumberColumn("Uncertainty", format="%.2f")
-
-            st.dataframe(
-                df_ratings_display[display_cols],
-                width='stretch',
-                hide_index=True,
-                column_config=column_config
-            )
-        else:
-            st.warning("Ratings data not available.")
-
-    # --- Tab 3: Player Tracker ---
-    if active_tab == "👤 Tracker":
-        if df_history is not None:
-            # Check for player in URL query params (e.g., ?tab=tracker&player=Bidderlyn)
-            url_player = st.query_params.get("player", None)
-            player_index = None
-
-            if url_player and url_player in players_by_rating:
-                player_index = players_by_rating.index(url_player)
-            elif 'tracker_default_player' not in st.session_state:
-                # Pre-select random player from top 10 on first load (persists during session)
-                top_n = min(10, len(players_by_rating))
-                if top_n >= 1:
-                    player_index = random.randint(0, top_n - 1)
-                    st.session_state.tracker_default_player = player_index
-
-            # Use URL player, session state, or None
-            if player_index is None:
-                player_index = st.session_state.get('tracker_default_player', None)
-
-            # Player selector (single selection)
-            selected_player = st.selectbox(
-                "Select a player",
-                options=players_by_rating,
-                index=player_index,
-                placeholder="Choose a player...",
-                key="tab4_player_select"
-            )
-
-            # Sync selected player to URL params (for share button and bookmarking)
-            if selected_player and st.query_params.get("player") != selected_player:
-                st.query_params["player"] = selected_player
-
-            if selected_player:
-                # Filter history for selected player
-                df_player_history = df_history[
-                    df_history['player_name'] == selected_player
-                ].copy()
-
-                if not df_player_history.empty:
-                    # Filter to days where the player actually played (score is not null)
-                    df_player_played = df_player_history[df_player_history['score'].notna()].copy()
-
-                    if not df_player_played.empty:
-                        # Get latest stats from the most recent game
-                        latest = df_player_played.sort_values('date', ascending=False).iloc[0]
-                        has_active_rank = 'active_rank' in df_player_played.columns
-
-                        # Get current Elo rank
-                        current_player_rating = df_ratings[df_ratings['player_name'] == selected_player]
-                        if not current_player_rating.empty and pd.notna(current_player_rating.iloc[0]['active_rank']):
-                            elo_rank = int(current_player_rating.iloc[0]['active_rank'])
-                            elo_rank_str = f"#{elo_rank}"
-                        else:
-                            elo_rank_str = "—"
-
-                        # Prepare metric values
-                        current_rating = latest['rating']
-                        games = int(latest['games_played'])
-                        wins = int(latest['wins'])
-                        win_rate = latest['win_rate']
-                        top_10s = int(latest['top_10s'])
-                        top_10_rate = latest['top_10s_rate']
-                        avg_rank = latest['avg_daily_rank']
-                        last_7 = latest['last_7']
-                        consistency = latest['consistency']
-
-                        # Pre-format optional values for f-string
-                        avg_rank_str = f"{avg_rank:.1f}" if pd.notna(avg_rank) else "N/A"
-                        last_7_str = f"{last_7:.1f}" if pd.notna(last_7) else "N/A"
-                        consistency_str = f"{consistency:.1f}" if pd.notna(consistency) else "N/A"
-
-                        # --- Player Summary Card (exact match to Rankings tab) ---
-                        # Use the exact same styling as generate_ranking_cards()
-                        # Uses --glass-* CSS vars for theme-adaptive borders/shadows
-                        card_base = "color-scheme:inherit;border:1px solid var(--glass-border-subtle);border-radius:12px;padding:1rem;margin-bottom:0.75rem;box-shadow:0 0 0 1px var(--glass-ring), inset 0 1px 0 var(--glass-inset), 0 4px 20px var(--glass-drop);"
-                        active_bg = "background-color:var(--secondary-background-color);background-image:linear-gradient(135deg, transparent 0%, rgba(255,107,107,0.15) 100%);"
-                        card_style = active_bg + card_base
-
-                        stat_layout = "display:flex;flex-direction:column;align-items:center;text-align:center;"
-                        label_style = "font-size:0.8rem;text-transform:uppercase;color:var(--text-color);font-weight:500;"
-                        value_style = "font-size:1.4rem;font-weight:700;color:var(--text-color);"
-
-                        # Elo rank display (with label on top)
-                        rank_html = f'<span class="rank-label">Elo Rank</span><span style="color:#FF6B6B;">{elo_rank_str}</span>'
-
-                        # Player name (matches Rankings tab)
-                        name_html = f'<span class="card-name-text">{html.escape(selected_player)}</span>'
-
-                        # Rating display
-                        rating_str = f"{current_rating:.1f}"
-
-                        # Format stats to match Rankings tab exactly
-                        win_rate_str = f"{win_rate:.1f}%"
-                        top10_rate_str = f"{top_10_rate:.1f}%"
-
-                        summary_html = f'<div style="{card_style}"><div class="card-header"><div class="card-rank">{rank_html}</div><div class="card-name">{name_html}</div><div class="card-rating active"><span class="rating-label">Elo</span>{rating_str}</div></div><div class="stats-grid"><div style="{stat_layout}"><span style="{label_style}">Daily Runs</span><span style="{value_style}">{games}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily #1</span><span style="{value_style}">{wins}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily #1 (%)</span><span style="{value_style}">{win_rate_str}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily Top10</span><span style="{value_style}">{top_10s}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily Top10 (%)</span><span style="{value_style}">{top10_rate_str}</span></div><div style="{stat_layout}"><span style="{label_style}">Daily Avg</span><span style="{value_style}">{avg_rank_str}</span></div><div style="{stat_layout}"><span style="{label_style}">7-Game Avg</span><span style="{value_style}">{last_7_str}</span></div><div style="{stat_layout}"><span style="{label_style}" title="Lower = more consistent">7-Game StdDev</span><span style="{value_style}">{consistency_str}</span></div></div></div>'
-                        st.html(f'<div class="ranking-cards">{summary_html}</div>')
-
-                        # --- Top Rivals Section ---
-                        df_rivalries = load_rivalries_data(dataset_prefix)
-                        if df_rivalries is not None and not df_rivalries.empty:
-                            rivals = get_player_rivals(selected_player, df_rivalries, n=6)
-                            if rivals:
-                                rivals_html = generate_rivals_html(selected_player, rivals)
-                                st.html(rivals_html)
-
-                        # --- Charts Row (side by side if space allows) ---
-                        df_chart = df_player_played.sort_values('date')
-                        chart_col1, chart_col2 = st.columns(2)
-
-                        # --- Rating Trajectory Chart ---
-                        with chart_col1:
-                            st.subheader("Elo Rating History")
-                            st.html('<p class="tracker-chart-subtitle">1500 = starting rating</p>')
-                            fig_rating = px.line(
-                                df_chart,
-                                x='date',
-                                y='rating',
-                                markers=True,
-                                labels={'date': 'Date', 'rating': 'Elo Rating'},
-                                color_discrete_sequence=[ACCENT_COLORS["primary"]]
-                            )
-                            apply_plotly_style(fig_rating)
-                            fig_rating.update_traces(
-                                marker=dict(size=8, line=dict(width=2, color='rgba(255,255,255,0.3)')),
-                                line=dict(width=3),
-                                fill='tozeroy',
-                                fillcolor='rgba(255, 107, 107, 0.15)',
-                            )
-                            # Set Y-axis range to fit data with padding (don't show 0)
-                            rating_min = df_chart['rating'].min()
-                            rating_max = df_chart['rating'].max()
-                            rating_padding = (rating_max - rating_min) * 0.1
-                            y_min = max(rating_min - rating_padding, 1000)  # Don't go below 1000
-                            y_max = rating_max + rating_padding
-                            fig_rating.update_layout(
-                                height=280,
-                                margin=dict(l=20, r=20, t=30, b=20),
-                                showlegend=False,
-                                yaxis=dict(range=[y_min, y_max])
-                            )
-                            fig_rating.add_hline(
-                                y=1500,
-                                line_dash="dash",
-                                line_color="rgba(255, 107, 107, 0.4)",
-                                annotation_text="Baseline (1500)",
-                                annotation_font=dict(color="rgba(255, 107, 107, 0.7)", weight=600)
-                            )
-                            # Add peak rating marker
-                            peak_idx = df_chart['rating'].idxmax()
-                            peak_row = df_chart.loc[peak_idx]
-                            fig_rating.add_scatter(
-                                x=[peak_row['date']],
-                                y=[peak_row['rating']],
-                                mode='markers',
-                                marker=dict(
-                                    size=16,
-                                    color=ACCENT_COLORS["warning"],
-                                    symbol='star',
-                                    line=dict(width=2, color='#FFD700')
-                                ),
-                                name='Peak',
-                                hovertemplate=f"<b>Peak Rating</b><br>{peak_row['rating']:.0f}<extra></extra>"
-                            )
-                            st.plotly_chart(fig_rating, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
-
-                        # --- Daily Rank History Chart (Bar Chart) ---
-                        with chart_col2:
-                            st.subheader("Daily Rank History")
-                            st.html('<p class="tracker-chart-subtitle">Green = best rank achieved</p>')
-                            # Bars grow from bottom (rank 31) UPWARD toward rank 1
-                            # Better ranks (closer to 1) = taller bars
-                            base_rank = 31  # Base of all bars (bottom of chart)
-                            fig_rank = go.Figure()
-
-                            # Calculate bar heights: negative values so bars grow upward on reversed y-axis
-                            # height = rank - base_rank (e.g., rank 1 -> height -30, rank 30 -> height -1)
-                            ranks = df_chart['rank'].tolist()
-                            bar_heights = [r - base_rank for r in ranks]  # All negative
-
-                            # Determine colors: green for best rank (rank 1), blue for others
-                            best_rank = df_chart['rank'].min()
-                            bar_colors = [ACCENT_COLORS["success"] if r == best_rank else ACCENT_COLORS["info"] for r in ranks]
-
-                            fig_rank.add_trace(go.Bar(
-                                x=df_chart['date'],
-                                y=bar_heights,  # Negative heights = bars grow upward
-                                base=[base_rank] * len(df_chart),  # All bars start from rank 31
-                                marker=dict(
-                                    color=bar_colors,
-                                    line=dict(width=1, color='rgba(255,255,255,0.3)')
-                                ),
-                                customdata=ranks,  # Store actual ranks for hover
-                                hovertemplate='%{x|%b %d, %Y}<br>Rank #%{customdata}<extra></extra>',
-                            ))
-
-                            apply_plotly_style(fig_rank)
-                            fig_rank.update_layout(
-                                height=280,
-                                margin=dict(l=20, r=70, t=30, b=20),  # Extra right margin for annotation
-                                showlegend=False,
-                                yaxis=dict(
-                                    autorange="reversed",  # Rank 1 at top, rank 31 at bottom
-                                    range=[1, base_rank],  # With reversed: 1 at top, 31 at bottom
-                                    title="Daily Rank",
-                                    tickmode='array',
-                                    tickvals=[1, 5, 10, 15, 20, 25, 30],
-                                ),
-                                xaxis=dict(title="Date"),
-                                bargap=0.15,
-                            )
-                            # Add average rank line with annotation at right edge
-                            avg_rank_val = df_chart['rank'].mean()
-                            fig_rank.add_hline(
-                                y=avg_rank_val,
-                                line_dash="dash",
-                                line_color="rgba(59, 130, 246, 0.8)",
-                                annotation_text=f"Avg: {avg_rank_val:.1f}",
-                                annotation_position="right",
-                                annotation_font=dict(color="rgba(59, 130, 246, 1)", weight=600),
-                                annotation_xshift=5,  # Small shift to ensure text is in margin area
-                            )
-                            st.plotly_chart(fig_rank, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
-
-                        # --- Game History Cards ---
-                        # Sort controls - column and direction combined
-                        sort_options = {
-                            "Recent": ("date", False),
-                            "Oldest": ("date", True),
-                            "Daily Rank": ("rank", True),
-                            "Score": ("score", False),
-                        }
-
-                        col_label, col_sort = st.columns([1, 2])
-                        with col_label:
-                            st.subheader("Game History")
-                        with col_sort:
-                            selected_sort = st.selectbox(
-                                "Sort",
-                                options=list(sort_options.keys()),
-                                index=0,
-                                key="history_sort",
-                                label_visibility="collapsed"
-                            )
-
-                        sort_column, sort_ascending = sort_options[selected_sort]
-                        # Daily Rank: secondary sort by score (highest first within same rank)
-                        if selected_sort == "Daily Rank":
-                            df_table = df_player_played.sort_values(
-                                ['rank', 'score'],
-                                ascending=[True, False],
-                                na_position='last'
-                            )
-                        else:
-                            df_table = df_player_played.sort_values(sort_column, ascending=sort_ascending, na_position='last')
-
-                        # Display as cards
-                        cards_html = generate_game_history_cards(df_table, player_name=selected_player, has_active_rank=has_active_rank)
-                        st.html(f'<div class="ranking-cards">{cards_html}</div>')
-                    else:
-                        st.info(f"No game history found for {selected_player}.")
-                else:
-                    st.info(f"No history data available for {selected_player}.")
-            else:
-                st.info("Select a player to view their profile and history.")
-        else:
-            st.warning("History data not available.")
-
-    # --- Tab 5: Hall of Fame ---
-    if active_tab == "🏆 Hall of Fame":
-        if df_history is not None and 'active_rank' in df_history.columns:
-            # Hall of Fame leaderboard cards
-            hof_stats = compute_hall_of_fame_stats(df_history)
-            if hof_stats:
-                hof_cards_html = generate_hall_of_fame_cards(hof_stats)
-                st.html(hof_cards_html)
-
-            # Use pre-computed active_rank from history data
-            # Filter to players with an active_rank (only active players have ranks)
-            df_history_active = df_history[df_history['active_rank'].notna()].copy()
-
-            # Filter to top 10 active ranks only
-            df_top10 = df_history_active[df_history_active['active_rank'] <= 10].copy()
-
-            # Elo #1 evolution chart - shows who held #1 over time (all history)
-            df_rank1 = df_top10[df_top10['active_rank'] == 1].copy()
-            df_rank1 = df_rank1.sort_values('date')
-
-            # Card header for the chart
-            st.html('''
-                <div class="hof-chart-card">
-                    <div class="hof-chart-header">
-                        <span style="font-size: 1.2rem;">📈</span>
-                        <span>Elo #1 Timeline</span>
-                    </div>
-                </div>
-            ''')
-
-            if not df_rank1.empty:
-                # Get all unique players who held #1
-                all_rank1_players = df_rank1['player_name'].unique().tolist()
-
-                fig_rank1 = px.line(
-                    df_rank1,
-                    x='date',
-                    y='player_name',
-                    markers=True,
-                    labels={'date': 'Date', 'player_name': 'Elo #1'},
-                    category_orders={'player_name': all_rank1_players},
-                    color_discrete_sequence=[ACCENT_COLORS["primary"]]
-                )
-                fig_rank1.update_traces(
-                    line=dict(shape='hv', color=ACCENT_COLORS["primary"]),  # Step line
-                    marker=dict(size=8, color=ACCENT_COLORS["primary"]),
-                    hovertemplate='%{y}<br>%{x|%Y-%m-%d}<extra></extra>'
-                )
-                apply_plotly_style(fig_rank1)
-                # Enhanced marker styling with glow effect
-                fig_rank1.update_traces(
-                    marker=dict(
-                        size=10,
-                        line=dict(width=2, color='rgba(255, 255, 255, 0.4)'),
-                        symbol='diamond',
-                    ),
-                )
-                fig_rank1.update_layout(
-                    height=max(200, len(all_rank1_players) * 25),  # Dynamic height based on player count
-                    margin=dict(l=20, r=20, t=20, b=20),
-                    showlegend=False,
-                    yaxis_title=None,
-                    xaxis_title=None,
-                    yaxis=dict(
-                        tickmode='array',
-                        tickvals=all_rank1_players,
-                        ticktext=all_rank1_players,
-                        tickfont=dict(weight=600)
-                    ),
-                    dragmode=False,  # Prevent scroll hijacking on mobile
-                )
-                st.plotly_chart(fig_rank1, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
-        else:
-            st.warning("Active rank history data not available.")
-
-    # --- Tab 2: Daily Duels ---
-    if active_tab == "⚔️ Duels":
-        if df_history is not None:
-            # Check for players in URL query params (e.g., ?tab=duels&player1=Bidderlyn&player2=Siker_7)
-            url_player1 = st.query_params.get("player1", None)
-            url_player2 = st.query_params.get("player2", None)
-
-            p1_index = None
-            p2_index = None
-
-            # If query params provided, use them
-            if url_player1 and url_player1 in players_by_rating:
-                p1_index = players_by_rating.index(url_player1)
-            if url_player2 and url_player2 in players_by_rating:
-                p2_index = players_by_rating.index(url_player2)
-
-            # If no query params (or invalid), use session state or random selection
-            if p1_index is None or p2_index is None:
-                if 'duel_default_p1' not in st.session_state:
-                    top_n = min(10, len(players_by_rating))
-                    if top_n >= 2:
-                        idx1, idx2 = random.sample(range(top_n), 2)
-                        st.session_state.duel_default_p1 = idx1
-                        st.session_state.duel_default_p2 = idx2
-                    else:
-                        st.session_state.duel_default_p1 = None
-                        st.session_state.duel_default_p2 = None
-
-                if p1_index is None:
-                    p1_index = st.session_state.get('duel_default_p1', None)
-                if p2_index is None:
-                    p2_index = st.session_state.get('duel_default_p2', None)
-
-            # Get theme colors (same source as duel cards for consistency)
-            duel_colors = get_theme_colors()
-            p1_label_color = duel_colors.get("player1", "#0E7490")
-            p2_label_color = duel_colors.get("player2", "#B45309")
-
-            col_p1, col_p2 = st.columns([1, 1])
-
-            with col_p1:
-                st.html(f'<p style="font-size: 0.875rem; font-weight: 600; margin: 0; color: {p1_label_color};">Player 1</p>')
-                player1 = st.selectbox(
-                    "Player 1",
-                    options=players_by_rating,
-                    index=p1_index,
-                    placeholder="Choose player...",
-                    key="duel_player1",
-                    label_visibility="collapsed"
-                )
-
-            with col_p2:
-                st.html(f'<p style="font-size: 0.875rem; font-weight: 600; margin: 0; color: {p2_label_color};">Player 2</p>')
-                player2 = st.selectbox(
-                    "Player 2",
-                    options=players_by_rating,
-                    index=p2_index,
-                    placeholder="Choose player...",
-                    key="duel_player2",
-                    label_visibility="collapsed"
-                )
-            # Note: Players saved to session state on tab switch, not synced to URL on every change
-
-            if player1 and player2:
-                if player1 == player2:
-                    st.warning("Please select two different players.")
-                else:
-                    # Get history for both players
-                    df_p1 = df_history[df_history['player_name'] == player1].copy()
-                    df_p2 = df_history[df_history['player_name'] == player2].copy()
-
-                    # Filter to days when both players actually played (have scores)
-                    df_p1_played = df_p1[df_p1['score'].notna()].copy()
-                    df_p2_played = df_p2[df_p2['score'].notna()].copy()
-
-                    # Find common dates where both played
-                    common_dates = set(df_p1_played['date'].dt.date) & set(df_p2_played['date'].dt.date)
-
-                    if not common_dates:
-                        st.info(f"No common game days found between {player1} and {player2}.")
-                    else:
-                        # Elo system constants (matching elo_ranking.py)
-                        K_FACTOR = 180
-                        K_NORMALIZED = K_FACTOR / 29  # Per pairwise comparison
-                        DYNAMIC_K_NEW_GAMES = 10
-                        DYNAMIC_K_ESTABLISHED_GAMES = 30
-                        DYNAMIC_K_NEW_MULT = 1.5
-                        DYNAMIC_K_PROV_MULT = 1.2
-                        LOSS_AMP_MAX = 1.5
-
-                        def get_dynamic_k(games_played):
-                            """Calculate K-factor based on games played"""
-                            if games_played < DYNAMIC_K_NEW_GAMES:
-                                return K_NORMALIZED * DYNAMIC_K_NEW_MULT
-                            elif games_played < DYNAMIC_K_ESTABLISHED_GAMES:
-                                return K_NORMALIZED * DYNAMIC_K_PROV_MULT
-                            return K_NORMALIZED
-
-                        def calc_elo_exchange(p1_elo, p2_elo, p1_won, p1_games, p1_uncertainty, score_weight=1.0):
-                            """
-                            Calculate Elo exchange for P1 from a single matchup with P2.
-                            Returns positive if P1 gained, negative if P1 lost.
-                            """
-                            # Expected score for P1
-                            expected = 1 / (1 + 10 ** ((p2_elo - p1_elo) / 400))
-                            actual = 1.0 if p1_won else 0.0
-
-                            # Get P1's K-factor
-                            k = get_dynamic_k(p1_games)
-
-                            # Apply loss amplification if P1 lost
-                            if not p1_won and p1_uncertainty is not None:
-                                loss_amp = 1 + (LOSS_AMP_MAX - 1) * p1_uncertainty
-                                k *= loss_amp
-
-                            # Apply score weighting
-                            k *= score_weight
-
-                            return k * (actual - expected)
-
-                        # Build comparison dataframe
-                        duel_rows = []
-                        p1_wins = 0
-                        p2_wins = 0
-                        p1_higher_elo_wins = 0
-                        p2_higher_elo_wins = 0
-                        total_games = 0
-                        total_p1_elo = 0.0
-                        total_p2_elo = 0.0
-
-                        for date in sorted(common_dates, reverse=True):
-                            p1_data = df_p1_played[df_p1_played['date'].dt.date == date].iloc[0]
-                            p2_data = df_p2_played[df_p2_played['date'].dt.date == date].iloc[0]
-
-                            # Determine winner (lower rank is better)
-                            p1_rank = p1_data['rank']
-                            p2_rank = p2_data['rank']
-                            winner = None
-                            p1_won = False
-                            if p1_rank < p2_rank:
-                                winner = player1
-                                p1_wins += 1
-                                p1_won = True
-                            elif p2_rank < p1_rank:
-                                winner = player2
-                                p2_wins += 1
-
-                            # Track Elo prediction accuracy
-                            p1_elo = p1_data['rating']
-                            p2_elo = p2_data['rating']
-                            if winner:
-                                total_games += 1
-                                if p1_elo > p2_elo and winner == player1:
-                                    p1_higher_elo_wins += 1
-                                elif p2_elo > p1_elo and winner == player2:
-                                    p2_higher_elo_wins += 1
-
-                            # Calculate Elo exchange for both players
-                            p1_elo_change = 0.0
-                            p2_elo_change = 0.0
-                            if winner:  # Only if there's a winner (not a tie)
-                                p1_games = p1_data['games_played'] if 'games_played' in p1_data else 30
-                                p2_games = p2_data['games_played'] if 'games_played' in p2_data else 30
-                                p1_uncertainty = p1_data['uncertainty'] if 'uncertainty' in p1_data else 0.0
-                                p2_uncertainty = p2_data['uncertainty'] if 'uncertainty' in p2_data else 0.0
-
-                                # Calculate score weight (ratio-based) - winner's score / loser's score
-                                p1_score = p1_data['score']
-                                p2_score = p2_data['score']
-                                if p1_won and p2_score > 0:
-                                    ratio = p1_score / p2_score
-                                    log_ratio = math.log2(max(ratio, 1.0))
-                                    score_weight = 0.5 + 0.5 * min(log_ratio / math.log2(10), 1.0)
-                                elif not p1_won and p1_score > 0:
-                                    ratio = p2_score / p1_score
-                                    log_ratio = math.log2(max(ratio, 1.0))
-                                    score_weight = 0.5 + 0.5 * min(log_ratio / math.log2(10), 1.0)
-                                else:
-                                    score_weight = 1.0
-
-                                # P1's perspective
-                                p1_elo_change = calc_elo_exchange(
-                                    p1_elo, p2_elo, p1_won, p1_games, p1_uncertainty, score_weight
-                                )
-                                # P2's perspective (opposite outcome)
-                                p2_elo_change = calc_elo_exchange(
-                                    p2_elo, p1_elo, not p1_won, p2_games, p2_uncertainty, score_weight
-                                )
-
-                                total_p1_elo += p1_elo_change
-                                total_p2_elo += p2_elo_change
-
-                            row = {
-                                'Date': date,
-                                'Winner': winner if winner else "Tie",
-                                f'{player1} Daily Rank': int(p1_rank),
-                                f'{player2} Daily Rank': int(p2_rank),
-                                f'{player1} Score': int(p1_data['score']),
-                                f'{player2} Score': int(p2_data['score']),
-                            }
-
-                            # Add active rank if available
-                            if 'active_rank' in df_p1_played.columns:
-                                p1_active = p1_data['active_rank']
-                                p2_active = p2_data['active_rank']
-                                row[f'{player1} Active Rank'] = int(p1_active) if pd.notna(p1_active) else None
-                                row[f'{player2} Active Rank'] = int(p2_active) if pd.notna(p2_active) else None
-
-                            row[f'{player1} Elo'] = round(p1_elo, 1)
-                            row[f'{player2} Elo'] = round(p2_elo, 1)
-
-                            duel_rows.append(row)
-
-                        df_duel = pd.DataFrame(duel_rows)
-
-                        # Last Encounter section - show most recent duel card with full win tally
-                        df_duel_recent_first = df_duel.sort_values('Date', ascending=False)
-                        theme_colors = get_theme_colors()
-                        last_card_html = generate_duel_cards(df_duel_recent_first, player1, player2, colors=theme_colors, limit=1, last_encounter_label=True)
-                        st.html(f'<div class="ranking-cards">{last_card_html}</div>')
-
-                        # --- Prepare both charts data first, then display side-by-side ---
-
-                        # Elo chart data
-                        df_p1_chart = df_p1_played[['date', 'rating']].copy()
-                        df_p1_chart['player'] = player1
-                        df_p2_chart = df_p2_played[['date', 'rating']].copy()
-                        df_p2_chart['player'] = player2
-                        df_elo_compare = pd.concat([df_p1_chart, df_p2_chart]).sort_values('date')
-
-                        elo_colors = get_theme_colors()
-                        fig_elo = px.line(
-                            df_elo_compare,
-                            x='date',
-                            y='rating',
-                            color='player',
-                            markers=True,
-                            labels={'date': 'Date', 'rating': 'Elo Rating', 'player': 'Player'},
-                            color_discrete_map={player1: elo_colors["player1"], player2: elo_colors["player2"]}
-                        )
-                        fig_elo.update_traces(
-                            hovertemplate='%{fullData.name}: %{y:.0f}<extra></extra>',
-                            marker=dict(size=8, line=dict(width=1, color='rgba(255, 255, 255, 0.3)')),
-                            line=dict(width=2),
-                        )
-                        apply_plotly_style(fig_elo)
-                        fig_elo.update_layout(
-                            hovermode='x unified',
-                            height=280,
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(weight=600)),
-                            margin=dict(l=20, r=60, t=30, b=20)
-                        )
-                        # X-axis shows one tick per month; hover shows full date
-                        fig_elo.update_xaxes(title="", tickformat="%b", hoverformat="%b %d, %Y", tickangle=0, dtick="M1")
-                        fig_elo.update_yaxes(title="")
-                        fig_elo.add_hline(y=1500, line_dash="dash", line_color="rgba(128, 128, 128, 0.5)", annotation_text="Baseline", annotation_font=dict(weight=600))
-
-                        # Score chart data
-                        score_colors = get_theme_colors()
-                        dates_sorted = sorted(common_dates)
-                        p1_scores_raw = []
-                        p2_scores_raw = []
-
-                        for date in dates_sorted:
-                            p1_data = df_p1_played[df_p1_played['date'].dt.date == date].iloc[0]
-                            p2_data = df_p2_played[df_p2_played['date'].dt.date == date].iloc[0]
-                            p1_scores_raw.append(p1_data['score'])
-                            p2_scores_raw.append(p2_data['score'])
-
-                        all_scores = p1_scores_raw + p2_scores_raw
-                        score_cap = np.percentile(all_scores, 90) * 1.5 if len(all_scores) > 0 else 50000
-                        score_cap = max(score_cap, 1000)
-
-                        p1_scores_display, p2_scores_display = [], []
-                        p1_colors, p2_colors = [], []
-                        p1_patterns, p2_patterns = [], []
-
-                        for i, _ in enumerate(dates_sorted):
-                            p1_score, p2_score = p1_scores_raw[i], p2_scores_raw[i]
-                            p1_scores_display.append(min(p1_score, score_cap))
-                            p2_scores_display.append(-min(p2_score, score_cap))
-
-                            if p1_score > p2_score:
-                                p1_colors.append(score_colors["player1"])
-                                p2_colors.append("rgba(128, 128, 128, 0.4)")
-                            elif p2_score > p1_score:
-                                p1_colors.append("rgba(128, 128, 128, 0.4)")
-                                p2_colors.append(score_colors["player2"])
-                            else:
-                                p1_colors.append("rgba(128, 128, 128, 0.6)")
-                                p2_colors.append("rgba(128, 128, 128, 0.6)")
-
-                            p1_patterns.append("/" if p1_score > score_cap else "")
-                            p2_patterns.append("/" if p2_score > score_cap else "")
-
-                        fig_score = go.Figure()
-                        fig_score.add_trace(go.Bar(name=player1, x=dates_sorted, y=p1_scores_display,
-                            marker=dict(color=p1_colors, line=dict(width=1, color='rgba(255,255,255,0.3)'), pattern=dict(shape=p1_patterns, solidity=0.5)),
-                            customdata=p1_scores_raw, hovertemplate=f'{player1}: %{{customdata:,.0f}}<extra></extra>', showlegend=False))
-                        fig_score.add_trace(go.Bar(name=player2, x=dates_sorted, y=p2_scores_display,
-                            marker=dict(color=p2_colors, line=dict(width=1, color='rgba(255,255,255,0.3)'), pattern=dict(shape=p2_patterns, solidity=0.5)),
-                            customdata=p2_scores_raw, hovertemplate=f'{player2}: %{{customdata:,.0f}}<extra></extra>', showlegend=False))
-                        fig_score.add_trace(go.Scatter(x=[None], y=[None], mode='markers', marker=dict(size=10, color=score_colors["player1"]), name=player1, showlegend=True))
-                        fig_score.add_trace(go.Scatter(x=[None], y=[None], mode='markers', marker=dict(size=10, color=score_colors["player2"]), name=player2, showlegend=True))
-
-                        apply_plotly_style(fig_score)
-                        fig_score.update_layout(
-                            barmode='relative', hovermode='x unified', height=280, bargap=0.15,
-                            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(weight=600)),
-                            margin=dict(l=20, r=60, t=30, b=20),
-                        )
-
-                        # X-axis shows one tick per month; hover shows full date
-                        fig_score.update_xaxes(title="", tickformat="%b", hoverformat="%b %d, %Y", tickangle=0, dtick="M1")
-
-                        # Abbreviated y-axis labels (60K instead of 60,000) for narrow screens
-                        def format_score_tick(val):
-                            if val >= 1000:
-                                return f"{int(val/1000)}K"
-                            return str(int(val))
-
-                        tick_step = 10 ** math.floor(math.log10(max(score_cap, 1000)))
-                        if score_cap / tick_step < 3:
-                            tick_step = tick_step / 2
-                        tick_data = []
-                        val = 0
-                        while val <= score_cap * 1.1:
-                            tick_data.append((val, format_score_tick(val)))
-                            if val > 0:
-                                tick_data.append((-val, format_score_tick(val)))
-                            val += tick_step
-                        tick_data.sort(key=lambda x: x[0])
-                        fig_score.update_yaxes(title="", range=[-score_cap * 1.1, score_cap * 1.1],
-                            tickvals=[t[0] for t in tick_data], ticktext=[t[1] for t in tick_data])
-                        fig_score.add_hline(y=0, line_width=1, line_color="rgba(128, 128, 128, 0.5)")
-
-                        # Display charts side-by-side
-                        col_elo, col_score = st.columns(2)
-                        with col_elo:
-                            st.subheader("Elo Rating Comparison")
-                            st.html('<p style="color: #A0A0A0; font-size: 0.75rem; font-weight: 500; margin: -0.5rem 0 0.5rem 0;">1500 = starting rating</p>')
-                            st.plotly_chart(fig_elo, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
-                        with col_score:
-                            st.subheader("Score Comparison")
-                            st.html('<p style="color: #A0A0A0; font-size: 0.75rem; font-weight: 500; margin: -0.5rem 0 0.5rem 0;">Color = duel winner</p>')
-                            st.plotly_chart(fig_score, width='stretch', config={'displayModeBar': False, 'scrollZoom': False})
-
-                        # Display the duel cards
-                        st.subheader("Game-by-Game Comparison")
-
-                        # Sort control - just Recent/Oldest by date
-                        sort_direction = st.selectbox(
-                            "Sort by",
-                            options=["Recent", "Oldest"],
-                            index=0,
-                            key="duel_sort"
-                        )
-                        sort_ascending = sort_direction == "Oldest"
-                        df_duel_sorted = df_duel.sort_values("Date", ascending=sort_ascending, na_position='last')
-
-                        # Display as cards (with theme-adaptive player colors)
-                        theme_colors = get_theme_colors()
-                        cards_html = generate_duel_cards(df_duel_sorted, player1, player2, colors=theme_colors)
-                        st.html(f'<div class="ranking-cards">{cards_html}</div>')
-            else:
-                st.info("Select two players to compare their head-to-head performance.")
-        else:
-            st.warning("History data not available.")
-
-    # Floating share button (use validated slug, not raw URL param)
-    validated_slug = TAB_SLUGS.get(active_tab, "rankings")
-    render_floating_share_button(validated_slug)
+    render_active_tab(active_tab, dataset_prefix, df_history,
+                      df_ratings, df_ratings_all, players_by_rating)
 
 if __name__ == "__main__":
     main()
+
@@ -2,13 +2,20 @@
 Tests for Elo calculation functions.
 """
 
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from src.elo.engine import (
     calculate_confidence,
     calculate_floor_factor,
+    calculate_weight,
+    calculate_weight_matrix,
+    process_daily_leaderboard,
 )
-from src.config import RATING_FLOOR, FLOOR_SOFT_ZONE
+from src.config import BASELINE_RATING, RATING_FLOOR, FLOOR_SOFT_ZONE
 
 
 class TestCalculateConfidence:
@@ -86,3 +93,52 @@ class TestEloMathProperties:
         for rating in range(500, 2000, 50):
             factor = calculate_floor_factor(rating)
             assert 0.0 <= factor <= 1.0
+
+
+class TestCalculateWeightMatrix:
+    """Tests for calculate_weight_matrix function."""
+
+    def test_matches_scalar_weight(self):
+        scores = np.array([120000.0, 45000.0, 9000.0, 9000.0, 300.0, 0.0])
+        max_gap = scores[0] - scores[-1]
+        weights = calculate_weight_matrix(scores, max_gap)
+        for i in range(len(scores)):
+            for j in range(i + 1, len(scores)):
+                assert weights[i, j] == pytest.approx(calculate_weight(scores[i], scores[j], max_gap))
+
+    def test_zero_gap(self):
+        scores = np.array([500.0, 500.0])
+        weights = calculate_weight_matrix(scores, 0)
+        assert weights[0, 1] == pytest.approx(calculate_weight(500.0, 500.0, 0))
+
+
+class TestProcessDailyLeaderboard:
+    """Tests for process_daily_leaderboard function."""
+
+    @staticmethod
+    def _day(names):
+        return pd.DataFrame({
+            'player_name': names,
+            'rank': range(1, len(names) + 1),
+            'score': [10000 * (len(names) - i) for i in range(len(names))],
+        })
+
+    def test_changes_follow_finishing_order(self):
+        ratings, games_played, last_seen, uncertainty = {}, defaultdict(int), {}, {}
+        day = self._day(['a', 'b', 'c', 'd'])
+        changes, _ = process_daily_leaderboard(
+            day, ratings, games_played, last_seen, uncertainty, pd.Timestamp('2025-01-01')
+        )
+        assert list(changes) == ['a', 'b', 'c', 'd']
+        assert changes['a'] > 0 > changes['d']
+        assert changes['a'] > changes['b'] > changes['c'] > changes['d']
+        assert all(games_played[name] == 1 for name in 'abcd')
+        assert ratings['a'] == pytest.approx(BASELINE_RATING + changes['a'])
+
+    def test_single_player_day_has_no_pairs(self):
+        ratings, games_played, last_seen, uncertainty = {}, defaultdict(int), {}, {}
+        changes, _ = process_daily_leaderboard(
+            self._day(['solo']), ratings, games_played, last_seen, uncertainty, pd.Timestamp('2025-01-01')
+        )
+        assert changes == {}
+        assert ratings['solo'] == BASELINE_RATING
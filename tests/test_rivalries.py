@@ -0,0 +1,49 @@
+"""
+Tests for rivalry statistics computation.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.elo.rivalries import MIN_ENCOUNTERS, compute_rivalries
+
+
+def _history(days):
+    """Build a minimal history frame from a list of {player: rank} dicts."""
+    rows = []
+    for i, ranks in enumerate(days):
+        date = pd.Timestamp('2025-01-01') + pd.Timedelta(days=i)
+        for player, rank in ranks.items():
+            rows.append({'date': date, 'player_name': player, 'rank': rank})
+    return pd.DataFrame(rows)
+
+
+class TestComputeRivalries:
+    """Tests for compute_rivalries function."""
+
+    def test_head_to_head_counts(self):
+        days = [{'Zed': 1, 'Amy': 2}] * 4 + [{'Amy': 1, 'Zed': 3, 'Bob': 2}] * 3
+        df = compute_rivalries(_history(days))
+
+        row = df[(df['player1'] == 'Amy') & (df['player2'] == 'Zed')].iloc[0]
+        assert row['total_encounters'] == 7
+        assert row['p1_wins'] == 3
+        assert row['p2_wins'] == 4
+        assert row['p1_avg_rank'] == round((2 * 4 + 1 * 3) / 7, 2)
+        assert row['closeness'] == round((1 - 1 / 7) * (1 / (1 + 1 / 20)), 4)
+
+    def test_min_encounters_filter(self):
+        days = [{'Amy': 1, 'Bob': 2}] * (MIN_ENCOUNTERS - 1)
+        assert compute_rivalries(_history(days)).empty
+
+    def test_unplayed_rows_ignored(self):
+        days = [{'Amy': 1, 'Bob': 2, 'Cat': np.nan}] * MIN_ENCOUNTERS
+        df = compute_rivalries(_history(days))
+        assert list(zip(df['player1'], df['player2'])) == [('Amy', 'Bob')]
+
+    def test_ties_count_for_neither(self):
+        days = [{'Amy': 1, 'Bob': 1}] * MIN_ENCOUNTERS
+        row = compute_rivalries(_history(days)).iloc[0]
+        assert row['p1_wins'] == 0
+        assert row['p2_wins'] == 0
+        assert row['closeness'] == 1.0